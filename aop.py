@@ -20,6 +20,8 @@ from data_engines_fundamentals.alpaca_md import alpaca_md
 from bigcharts_md import bc_quote
 from ml_yf_nlp_orchestrator import ml_nlpreader, NewsAgeResolver
 from ml_sentiment import ml_sentiment
+from ml_news_pipeline import news_pipeline
+from ml_news_batch import news_batch, load_symbols
 from ml_urlhinter import url_hinter
 from nasdaq_uvoljs import un_volumes
 from nasdaq_wrangler import nq_wrangler
@@ -33,6 +35,8 @@ from y_topgainers import y_topgainers
 from y_unvol import y_unvol
 from y_unvoljs import yf_unvoljs
 from datastore_eng_LMDB import lmdb_io_eng
+from c4_browser_pool import c4_browser_pool
+from data_engines_news.news_cycle import news_cycle_runner
 
 from neo4j_graphdb import neo4j_auradb
 
@@ -81,6 +85,23 @@ parser.add_argument('-d','--deep', help='Deep converged multi data list', action
 #parser.add_argument('-n','--newsai-sent', help='AI NLP News sentiment AI for 1 stock', action='store', dest='newsai_sent', required=False, default=False)
 parser.add_argument('-n','--newsai-sent', help='AI NLP News sentiment AI for 1 stock', nargs="*", dest='newsai_sent', required=False, default=False)
 #
+parser.add_argument('--newsai-batch', help='AI NLP News sentiment BATCH for many stocks: symbols, A,B,C lists or @file', nargs="+", dest='newsai_batch', required=False, default=False)
+parser.add_argument('--batch-skim', help='Batch mode: concurrent depth 0 symbol skims', action='store', type=int, dest='batch_skim', required=False, default=4)
+parser.add_argument('--batch-cycle', help='Batch mode: max articles read per symbol (0 = all)', action='store', type=int, dest='batch_cycle', required=False, default=0)
+parser.add_argument('--batch-size', help='LLM classifier batch size (blocklets per forward pass)', action='store', type=int, dest='llm_batch_size', required=False, default=16)
+parser.add_argument('--backend', help='LLM classifier backend: torch, onnx or onnx-int8', action='store', choices=['torch', 'onnx', 'onnx-int8'], dest='clsfr_backend', required=False, default='torch')
+parser.add_argument('--chunker', help='Blocklet chunker: chars (char windows) or tokens (LLM token windows)', action='store', choices=['chars', 'tokens'], dest='chunker_mode', required=False, default='chars')
+parser.add_argument('--chunk-stride', help='Token chunker overlap between blocklets (tokens)', action='store', type=int, dest='chunk_stride', required=False, default=0)
+parser.add_argument('--browser-pool', help='Warm crawl4ai browsers shared by every C4 crawl this run', action='store', type=int, dest='browser_pool', required=False, default=1)
+parser.add_argument('--netcache-items', help='Max entries in each in-memory net cache (LRU)', action='store', type=int, dest='netcache_items', required=False, default=256)
+parser.add_argument('--netcache-mb', help='Max MB held by each in-memory net cache (LRU)', action='store', type=int, dest='netcache_mb', required=False, default=64)
+parser.add_argument('--fetch-concurrency', help='Concurrent depth 3 article crawls (0 = serial scraping)', action='store', type=int, dest='fetch_concurrency', required=False, default=0)
+parser.add_argument('--host-delay', help='Min secs between crawl starts to the same host (fetch stage politeness)', action='store', type=float, dest='host_delay', required=False, default=1.0)
+parser.add_argument('--pipeline', help='Pipelined depth 3: overlap scraping + LLM classification (fetch / classify / collect stages)', action='store_true', dest='pipeline', required=False, default=False)
+parser.add_argument('--pipeline-depth', help='Pipeline stage queue size (backpressure)', action='store', type=int, dest='pipeline_depth', required=False, default=4)
+parser.add_argument('--lmdb-readers', help='LMDB reader slots (concurrent read txns)', action='store', type=int, dest='lmdb_readers', required=False, default=126)
+parser.add_argument('--skim-incremental', help='Incremental depth 0 skim: stop at a run of already cached articles (per symbol watermark)', action='store_true', dest='skim_incremental', required=False, default=False)
+parser.add_argument('--skim-stop-run', help='Incremental skim: consecutive known articles that end the skim', action='store', type=int, dest='skim_stop_run', required=False, default=3)
 parser.add_argument('--news-cycle', help='Full news cycle extarct from eveny data engine', action='store_true', dest='news_cycle', required=False, default=False)
 parser.add_argument('-p','--perf', help='Tech event performance sentiment', action='store_true', dest='bool_te', required=False, default=False)
 parser.add_argument('-q','--quote', help='Get ticker price action quote', action='store', dest='qsymbol', required=False, default=False)
@@ -134,6 +155,7 @@ def main():
 
     print ( " " )
     recommended = {}        # dict of recomendations
+    c4_browser_pool.size = args.get('browser_pool', 1)     # warm browsers. Pool starts lazily on the first C4 crawl
 
 
 ########## 0 Basic Quotes #################3
@@ -176,26 +198,16 @@ def main():
 # Notes for: AI coding assistance @claude
 
     if args['news_cycle'] is True:
-        #'''
-        ext_count = 0
-        barrons_news_reader = barrons_news(1)
-        ext_count += asyncio.run(barrons_news_reader.craw4ai_str_schema_extr())
-        benzinga_news_reader = benzinga_news(1)
-        ext_count += asyncio.run(benzinga_news_reader.craw4ai_str_schema_extr())
-        forbes_news_reader = forbes_news(1)
-        ext_count += asyncio.run(forbes_news_reader.craw4ai_str_schema_extr())
-        fxstreet_news_reader = fxstreet_news(1)
-        ext_count += asyncio.run(fxstreet_news_reader.craw4ai_str_schema_extr())
-        investing_news_reader = investing_news(1)
-        ext_count += asyncio.run(investing_news_reader.craw4ai_str_schema_extr())
-        hedgeweek_news_reader = hedgeweek_news(1)
-        ext_count += asyncio.run(hedgeweek_news_reader.craw4ai_str_schema_extr())
-        #'''
+        # ALL sources + their pages scheduled at once on 1 event loop (cycle time ~= slowest source)
+        news_cycle = news_cycle_runner(1)
+        ext_count = asyncio.run(news_cycle.run())    # combined rows, deduped across sources by urlhash -> news_cycle.DB_insert_data
+        news_cycle.report()
             
         #gurufocus_news_reader = gurufocus_news(1)
         #asyncio.run(gurufocus_news_reader.craw4ai_str_schema_extr())
         
         print (f"Total News articles extracted: {ext_count}" )
+        print (f"Browser launches: {c4_browser_pool.launches} / crawls: {c4_browser_pool.borrows}" )
         print ( " " )
 
 ########### Small Cap gainers & loosers ################
@@ -480,6 +492,38 @@ def main():
     else:
         pass
 
+# ##################################################################################
+# ##### NP NLP News Reader BATCH mode : many symbols, 1 process
+# ##### 1 classifier load, 1 browser pool, 1 LMDB env, 1 cross symbol ranking table
+# ###################################################################################
+
+    if args.get('newsai_batch'):
+            cmi_debug = __name__+"::newsai_batch.#1"
+            batch_symbols = load_symbols(args['newsai_batch'])
+            if not batch_symbols:
+                print ( "AI news batch: NO symbols to read" )
+                exit(1)
+
+            ml_sentiment.clsfr_backend = args['clsfr_backend']     # pick classifier backend BEFORE the preloader builds it
+            ml_sentiment.preload_classifier()                      # loads ONCE for the whole batch. Overlaps the depth 0 skims
+
+            print ( " " )
+            print ( f"AI news reader BATCH sentiment analysis for {len(batch_symbols)} Stocks" )
+            logging.info( '%s - Open global LMBD KV cache engine...' % cmi_debug)
+            lmdb_env = lmdb_io_eng("GLOBAL", "LMDB_0001", args)
+            batch = news_batch(1, batch_symbols, lmdb_env, args)
+
+            batch_start_time = time.perf_counter()
+            asyncio.run(batch.skim_all())           # depth 0 + 1 : ALL symbols concurrently
+            batch.run()                             # depth 2 + 3 + sentiment : symbol by symbol w/ global urlhash dedupe
+            batch.report(batch.rank())              # 1 CompositeScorer ranking table (shared run_epoch)
+            print ( f"Batch run time:      {(time.perf_counter() - batch_start_time) / 60:.2f} mins" )
+
+            lmdb_env.close_env("GLOBAL")
+            c4_browser_pool.shutdown()
+            batch.close()
+            print ("\n\n")
+
 # ##################################################################################
 # ##### NP NLP News Reader for Sentiment Analysis
 # ##### Currently read all news or ONE stock
@@ -495,6 +539,7 @@ def main():
             final_sent_df = pd.DataFrame()              # reset DataFrame for each article
             
             # Threaded optimization pre-loader : Phase 1
+            ml_sentiment.clsfr_backend = args['clsfr_backend']     # pick classifier backend BEFORE the preloader builds it
             ml_sentiment.preload_classifier()
             # create a Thread to background to preload the heavy HF classifier pipeline
 
@@ -513,10 +558,14 @@ def main():
             
             # scan_news_feed() + eval_news_feed_stories()
 
+            news_ai.lmdb_env = lmdb_env             # incremental skim watermarks live in the same LMDB
             articles_found = asyncio.run(news_ai.nlp_read_one(news_symbol, args))  
             if articles_found == 0:
                 print ( f"AI news reader found NO articles for Stock [ {news_symbol} ]" )
                 exit(1)
+            if not news_ai.yfn.ml_ingest and news_ai.yfn.skim_mark:
+                print ( f"AI news reader: NO new articles since the last skim for Stock [ {news_symbol} ]" )
+                exit(0)
 
             # Threaded optimization : Phase 2
             # The nlp_read_one() scrape/skim takes 10 ~ 15 seconds to complete skimming 100 top level article feed
@@ -525,6 +574,31 @@ def main():
             # - which should be fast, if the pipeline initiatization Thread completed its heavy init workload
             # - while nlp_read_one() was working
             sent_ai = ml_sentiment(1, args)
+            sent_ai.chunk_cache = lmdb_env      # content addressed chunk sentiment cache lives in the same LMDB
+
+            # Bulk KV cache probe : 1 read txn classifies every candidate BEFORE any depth 3 network work
+            # - hits are rehydrated from LMDB by artdata_*_depth3() with no network session
+            # - only misses + corrupt entries go to the scrapers. Thats the total network work for this run
+            kv_hits, kv_misses, kv_corrupt = lmdb_env.probe_ml_ingest(news_ai.yfn.ml_ingest)
+            print ( f"KV cache probe: {len(kv_hits)} hits / {len(kv_misses)} misses / {len(kv_corrupt)} corrupt" )
+            print ( f"Network work:   {len(kv_misses) + len(kv_corrupt)} articles to scrape" )
+
+            # Concurrent depth 3 fetch stage : crawl ALL cache misses at once (bounded worker pool, 1 shared browser)
+            # - runs on its own event loop thread. Articles are fed to the sentiment loop as each crawl completes
+            # - cache hits need no network, so they are processed first while the fetch stage works
+            _fetch_q = None
+            _prefetch = set()
+            _fetch_cc = args.get('fetch_concurrency', 0) or (4 if args.get('pipeline') else 0)     # pipeline mode always pre-fetches
+            if _fetch_cc > 0:
+                _work = []
+                for _idx in sorted(kv_misses | kv_corrupt):
+                    _row = news_ai.yfn.ml_ingest[_idx]
+                    if _row.get('thint') == 0.0 and 'exturl' not in _row and 'urlhash' in _row:   # same test as the LOOP (no depth 2 re-run)
+                        _work.append((_idx, _row['url'], _row['urlhash']))
+                if _work:
+                    _prefetch = { w[0] for w in _work }
+                    _fetch_q = news_ai.yfn.c4_prefetch(_work, _fetch_cc, args.get('host_delay', 1.0))
+                    print ( f"Fetch stage:    {len(_work)} articles / concurrency: {_fetch_cc} / host delay: {args.get('host_delay', 1.0)}s" )
             
             _atc = 0     # article specific stats : tokenz count
             _acc = 0     # article specific stats : chars count
@@ -542,15 +616,31 @@ def main():
             
             antibot_load_balancer = 0
             ai_sent_start_time = time.perf_counter()  # Mark the start time
-            for sn_idx, sn_row in news_ai.yfn.ml_ingest.items():    # Main LOOP - all pages extrated in ml_ingest
+
+            # Pipelined mode : fetch + classify stages run on their own threads. This LOOP becomes the collector
+            # - depth 2/3 + LLM work arrives pre-computed, the LMDB writes happen as each result is collected
+            _pipe = None
+            if args.get('pipeline'):
+                _pipe = news_pipeline(1, news_ai, sent_ai, lmdb_env, args)
+                _pipe.start(_fetch_q, _prefetch)
+                _ingest = _pipe.results()
+            else:
+                _ingest = ( (_i, None) for _i in news_ai.yfn.ingest_order(_fetch_q) )
+
+            for sn_idx, _piped in _ingest:                          # Main LOOP - all pages extrated in ml_ingest
                 aggmean_sent_df = pd.DataFrame()                    # reset DataFrame for each article
-                thint = news_ai.nlp_summary_report(3, sn_idx)       # get this TYPE of new article from ml_ingest : sn_idx = article counter loop
+                if _piped is not None:
+                    thint = _piped['thint']                         # depth 2 already done by the pipeline fetch stage
+                else:
+                    thint = news_ai.nlp_summary_report(3, sn_idx)   # get this TYPE of new article from ml_ingest : sn_idx = article counter loop
 
                 # ######################################################
                 # Anti-bot avoidance scraping load-balancer logic
                 # WARN:  eventually calls  sentiment_ai.compute_sentiment()
                 if thint == 0.0:    # only compute type = 0.0 pre-processed + validated News articles in ML_ingest
-                    if antibot_load_balancer == 0:                  # randomize  craw4ai / BS4 scrapers
+                    if _piped is not None:                          # already scraped + classified by the pipeline
+                        _atc, _awc, final_results = _piped['atc'], _piped['awc'], _piped['final_results']
+                    elif antibot_load_balancer == 0 or sn_idx in _prefetch:  # randomize  craw4ai / BS4 scrapers (pre-fetched = C4)
                         _atc, _awc, final_results = news_ai.yfn.artdata_C4_depth3(sn_idx, sent_ai, lmdb_env)    # craw4ai engine
                     else:
                         _atc, _awc, final_results = news_ai.yfn.artdata_BS4_depth3(sn_idx, sent_ai, lmdb_env)   # BS4 engine 
@@ -585,7 +675,7 @@ def main():
                     _asc = final_results['scentence']
                     _apc = final_results['paragraph']
                     _arc = final_results['random']
-                    this_urlhash = sent_ai.active_urlhash
+                    this_urlhash = _piped['urlhash'] if _piped is not None else sent_ai.active_urlhash
                     
                     # compute cumulative metrics across ALL ARTICLES
                     _ttcz += _atc
@@ -597,7 +687,10 @@ def main():
                     
                     pd.set_option('display.max_rows', None)
                     pd.set_option('max_colwidth', 40)
-                    aggregate_mean = sent_ai.sen_df0.loc[sent_ai.sen_df0['urlhash'] == this_urlhash].groupby('snt')['rnk'].mean()
+                    if _piped is not None:
+                        aggregate_mean = _piped['mean']             # snapshot taken by the classify stage
+                    else:
+                        aggregate_mean = sent_ai.sen_acc.urlhash_mean(this_urlhash)     # O(1) per-urlhash view (no full DF scan)
 
                     # aggregate_mean DF keys are only set if the sentiment analysis computes a pos/net/neu sentiment for the article.
                     # If the article has no matching sentiment, the keys are not set in the DF.
@@ -640,6 +733,9 @@ def main():
                         pass
                     else:
                         print (f"\n** Exiting cycle @ article: {ai_nlp_cycle}...")
+                        news_ai.yfn.c4_prefetch_stop()
+                        if _pipe is not None:
+                            _pipe.stop()
                         break                    
                 else:
                     print (f"Skipping:      [ UNREADABLE / Not a candidate for Sentiment analysis] {bad_articles}")
@@ -647,6 +743,12 @@ def main():
                     ai_nlp_cycle += 1
                     bad_articles += 1
                     
+            news_ai.yfn.c4_prefetch_stop()          # no-op if the fetch stage never ran
+            if _pipe is not None:
+                _pipe.join(5)
+                _pipe.report()
+            news_ai.yfn.skim_watermark(lmdb_env)    # newest cached urlhashes -> next --skim-incremental run
+
             ################################################################
             # END  AI AI NLP article processing data scraping loop
             ################################################################
@@ -738,6 +840,8 @@ def main():
             print ( f"Total new articles extrctd: {news_ai.yfn.kv_created_C4 + news_ai.yfn.kv_created_BS4}")
             print ( f"Sentimnt chunks from cache: {sent_ai.sen_cache_eng}" )
             print ( f"LLM computed sent chunks:   {sent_ai.sen_llm_eng}" )
+            print ( f"Chunk cache hits / misses:  {sent_ai.ccache_hit} / {sent_ai.ccache_miss}" )
+            print ( f"Unchanged text (hash hit):  {sent_ai.thash_hit} articles / {sent_ai.sen_thash_eng} LLM chunk calls saved" )
             print ( f"Total sentiment chunks:     {sent_ai.df0_row_count}" )
             print ( "\n" )
 
@@ -764,6 +868,12 @@ def main():
             print ("\n\n")
             #print ( f"{news_ai.yfn.ml_ingest}")
 
+            lmdb_env.close_env("GLOBAL")        # close the persistent LMDB env (opened once for the whole run)
+            print (f"Browser launches: {c4_browser_pool.launches} / crawls: {c4_browser_pool.borrows}" )
+            for _nc in news_ai.yfn.netcache_stats():
+                print (f"Net cache {_nc['name']:<17} items: {_nc['items']} / peak: {_nc['peak_bytes'] / 1048576:.1f} MB / hits: {_nc['hits']} / misses: {_nc['misses']} / evicted: {_nc['evictions']} / released: {_nc['released']}" )
+            c4_browser_pool.shutdown()          # close the warm browser(s) shared by every C4 crawl this run
+            news_ai.yfn.http_close()            # close the pooled keep-alive HTTP clients (BS4 article gets)
 
             print ("\n\n")
 
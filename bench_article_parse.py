@@ -0,0 +1,107 @@
+#! python3
+
+"""
+Microbenchmark : Depth 3 BS4 article parse
+full page BeautifulSoup(html, "html.parser")  vs  targeted article_zones() (SoupStrainer + lxml)
+over saved Yahoo article HTML fixtures
+
+  python bench_article_parse.py                          # every *.html in datastore/html_fixtures/
+  python bench_article_parse.py page1.html some_dir/     # explicit fixtures
+  python bench_article_parse.py -s https://finance.yahoo.com/news/...   # save 1 article page as a fixture
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import httpx
+from bs4 import BeautifulSoup
+
+from ml_yf_nlp_news_engine import article_zones, BS4_PARSER, ZONE_BODY, ZONE_PUBTIME, yfnews_reader
+
+FIXTURE_DIR = "datastore/html_fixtures/"
+
+parser = argparse.ArgumentParser(description="Depth 3 BS4 article parse microbenchmark")
+parser.add_argument('fixtures', help='HTML fixture files / dirs (default: datastore/html_fixtures/)', nargs="*")
+parser.add_argument('-n','--repeat', help='Parses per fixture per method', action='store', type=int, dest='repeat', required=False, default=20)
+parser.add_argument('-s','--save', help='Fetch 1 article URL and save it as a fixture', action='store', dest='save_url', required=False, default=None)
+
+
+def extract(soup):
+    """The same zone reads artdata_BS4_depth3() does -> (<p> text list, publish timestamp)"""
+    _body = soup.find(attrs={"class": ZONE_BODY})
+    _pub = soup.find("div", attrs={"class": ZONE_PUBTIME})
+    _time = _pub.find("time") if _pub else None
+    _p = [ _t.text for _t in _body.find_all("p") ] if _body else []
+    return _p, (_time.get("datetime") if _time else None)
+
+
+def full_parse(html):
+    return extract(BeautifulSoup(html, "html.parser"))
+
+
+def zone_parse(html):
+    return extract(article_zones(html))
+
+
+def fixture_files(paths):
+    _files = []
+    for _p in (paths or [FIXTURE_DIR]):
+        _p = Path(_p)
+        if _p.is_dir():
+            _files.extend(sorted(_p.glob("*.html")))
+        elif _p.is_file():
+            _files.append(_p)
+    return _files
+
+
+def save_fixture(url):
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    _resp = httpx.get(url, headers={'user-agent': yfnews_reader.yahoo_headers['user-agent']}, follow_redirects=True, timeout=10)
+    _resp.raise_for_status()
+    _file = Path(FIXTURE_DIR) / (hashlib.sha256(url.encode()).hexdigest()[:16] + ".html")
+    _file.write_text(_resp.text, encoding="utf-8")
+    print ( f"Saved fixture: {_file} ({len(_resp.text)} chars)" )
+    return _file
+
+
+def bench(fn, html, repeat):
+    _best = None
+    for _ in range(repeat):
+        _t0 = time.perf_counter()
+        fn(html)
+        _dt = time.perf_counter() - _t0
+        _best = _dt if _best is None or _dt < _best else _best
+    return _best
+
+
+def main():
+    args = vars(parser.parse_args())
+    if args['save_url']:
+        save_fixture(args['save_url'])
+        return
+
+    _files = fixture_files(args['fixtures'])
+    if not _files:
+        print ( f"No HTML fixtures found. Save some first:  python bench_article_parse.py -s <article url>" )
+        return
+
+    print ( f"Zone parser: {BS4_PARSER} + SoupStrainer / repeat: {args['repeat']} (best of)" )
+    print ( f"{'fixture':<28} {'KB':>7} {'<p>':>5} {'full ms':>9} {'zones ms':>9} {'speedup':>8}  same" )
+    _tf = _tz = 0.0
+    for _f in _files:
+        _html = _f.read_text(encoding="utf-8", errors="replace")
+        _same = full_parse(_html) == zone_parse(_html)      # MUST extract identical <p> text + timestamp
+        _full = bench(full_parse, _html, args['repeat'])
+        _zone = bench(zone_parse, _html, args['repeat'])
+        _tf += _full
+        _tz += _zone
+        print ( f"{_f.name[:28]:<28} {len(_html)/1024:7.1f} {len(zone_parse(_html)[0]):5} {_full*1000:9.2f} {_zone*1000:9.2f} {_full/_zone:7.1f}x  {_same}" )
+    print ( f"{'TOTAL':<28} {'':>7} {'':>5} {_tf*1000:9.2f} {_tz*1000:9.2f} {_tf/_tz:7.1f}x" )
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#! python3
+
+import asyncio
+import atexit
+import logging
+import threading
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+# ###################### Main class
+class c4_browser_pool:
+    """
+    Process wide crawl4ai browser pool. 1 warm Chromium for the WHOLE run
+    - replaces 'async with AsyncWebCrawler() as crawler' (1 Chromium cold start per use = seconds each time)
+    - crawlers live on 1 persistent event loop thread (playwright objects are bound to the loop that created them)
+    - consumers borrow a crawler from ANY event loop / thread:  async with c4_browser_pool.crawler() as crawler:
+      crawler.arun() is forwarded to the pool loop. crawl4ai hands each arun() its own page in the warm browser
+    - lazy start on first borrow, in a worker thread (never blocks the borrowers event loop). shutdown() (or atexit)
+      closes the browsers
+    - launches = browser launches this run. Should be 1 (or pool size)
+    """
+
+    # global accessors
+    browser_config = None       # crawl4ai BrowserConfig shared by every crawler in the pool
+    borrows = 0                 # crawler borrows this run
+    launches = 0                # Chromium launches this run (pool warm up)
+    size = 1                    # number of warm crawlers (browsers) in the pool
+    _crawlers = []              # warm AsyncWebCrawler instances (only touched on the pool loop)
+    _loop = None                # the pool's persistent event loop
+    _thread = None              # thread running _loop
+    _lock = threading.Lock()    # Thread lock
+    _next = 0                   # round robin borrow index
+
+    # #################################### 1
+    @classmethod
+    def start(cls, size=None, browser_config=None):
+        """
+        Start the pool loop thread + launch the warm browser(s). Safe to call more than once
+        RETURNS: number of warm crawlers in the pool
+        """
+        cmi_debug = __name__+"::"+"start"
+        with cls._lock:
+            if cls._loop is not None:
+                return len(cls._crawlers)
+            cls.size = max(1, int(size or cls.size))
+            cls.browser_config = browser_config or cls.browser_config or BrowserConfig(headless=True, verbose=False)
+            cls._loop = asyncio.new_event_loop()
+            cls._thread = threading.Thread(target=cls._loop.run_forever, name="c4_browser_pool", daemon=True)
+            cls._thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(cls._launch(), cls._loop).result()
+            except Exception as e:
+                logging.error( f'{cmi_debug} - Browser launch FAILED: {e}' )
+                cls._loop.call_soon_threadsafe(cls._loop.stop)
+                cls._loop = None
+                raise
+            atexit.register(cls.shutdown)
+            logging.info( f'%s - Browser pool HOT: {len(cls._crawlers)} crawler(s) / launches: {cls.launches}' % cmi_debug )
+            return len(cls._crawlers)
+
+    # #################################### 2
+    @classmethod
+    def crawler(cls):
+        """
+        Borrow a warm crawler:  async with c4_browser_pool.crawler() as crawler:
+        - the crawler is picked on enter. A cold pool is started there via asyncio.to_thread(start), b/c start() blocks
+          until Chromium is up and the borrower is always running inside an event loop
+        """
+        return _pooled_crawler(cls)
+
+    # #################################### 3
+    @classmethod
+    def shutdown(cls):
+        """Close the warm browser(s) + stop the pool loop. End of run"""
+        cmi_debug = __name__+"::"+"shutdown"
+        with cls._lock:
+            if cls._loop is None:
+                return 0
+            try:
+                asyncio.run_coroutine_threadsafe(cls._close(), cls._loop).result(30)
+            except Exception as e:
+                logging.error( f'{cmi_debug} - Browser close FAILED: {e}' )
+            cls._loop.call_soon_threadsafe(cls._loop.stop)
+            cls._thread.join(5)
+            cls._loop = None
+            cls._thread = None
+            logging.info( f'%s - Browser pool closed / launches: {cls.launches} / borrows: {cls.borrows}' % cmi_debug )
+            return cls.launches
+
+    # #################################### 4
+    @classmethod
+    def stats(cls):
+        """RETURNS: dict{} of pool counters for this run"""
+        return dict(launches=cls.launches, borrows=cls.borrows, size=len(cls._crawlers))
+
+    # ###################### Helper Method
+    # Helper method -> borrow (any thread)
+
+    @classmethod
+    def _borrow(cls):
+        """Round robin pick of 1 warm crawler. Pool must be started"""
+        with cls._lock:
+            _c = cls._crawlers[cls._next % len(cls._crawlers)]
+            cls._next += 1
+            cls.borrows += 1
+        return _c
+
+    # ###################### Helper Method
+    # Helper method -> run ON the pool loop
+
+    @classmethod
+    async def _launch(cls):
+        cls._crawlers = []
+        for _ in range(cls.size):
+            _c = AsyncWebCrawler(config=cls.browser_config)
+            await _c.start()                # Chromium cold start (the expensive bit). Once per crawler per run
+            cls.launches += 1
+            cls._crawlers.append(_c)
+
+    @classmethod
+    async def _close(cls):
+        for _c in cls._crawlers:
+            await _c.close()
+        cls._crawlers = []
+
+
+class _pooled_crawler:
+    """
+    Borrowed crawler handle. Same arun() call as AsyncWebCrawler
+    - async context manager so it drops in for 'async with AsyncWebCrawler() as crawler'. Exit does NOT close the browser
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._crawler = None
+
+    async def __aenter__(self):
+        if self._pool._loop is None:
+            await asyncio.to_thread(self._pool.start)      # cold pool. Launch Chromium OFF this event loop
+        self._crawler = self._pool._borrow()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def arun(self, url, config=None, **kwargs):
+        _coro = self._crawler.arun(url, config=config, **kwargs)
+        if asyncio.get_running_loop() is self._pool._loop:
+            return await _coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_coro, self._pool._loop))
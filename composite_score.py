@@ -22,14 +22,19 @@ Reconciliation drop-in: implements all review fixes -
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
 import math
 import time
+import zlib
 from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+import msgpack
+import numpy as np
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -39,6 +44,8 @@ try:
 except ImportError:  # pragma: no cover - dependency is optional until LMDB reads are used.
     lmdb = None
 
+from datastore_codec_LMDB import decode_record, ptime_key, PTIME_ALL
+
 
 # =====================================================================
 # Composite score parameters - FROZEN SHARED CONSTANTS
@@ -58,10 +65,88 @@ SECONDS_PER_HOUR = 3600.0
 
 DEFAULT_DB_ID = "0001"
 DEFAULT_LMDB_PATH = Path("datastore") / "LMDB_0001"
+DEFAULT_MAP_SIZE = 1024 * 1024 * 1024   # same 1GB map as lmdb_io_eng
+STATE_DB = b"score_state"       # named sub-DB : per-symbol decayed sums (== lmdb_io_eng.state_db)
+STATE_VERSION = 2
+PTIME_DB = b"pub_time"          # named sub-DB : SYMBOL|published_epoch|urlhash index (== lmdb_io_eng.ptime_db)
+HORIZON_MIN_WEIGHT = 0.01       # decay horizon: articles older than this decay weight are left out of a horizon scan
 
 _VALID_SENT_TYPES = ("positive", "neutral", "negative")
 
 
+class ArticleRow(NamedTuple):
+    """
+    One normalized article. score_all() builds it ONCE per record and
+    every report reads it - normalize_article / resolve_published_epoch
+    never run twice for the same record.
+    """
+    urlhash: str
+    state: str                      # "scored" | "empty" | "unreadable"
+    published_epoch: float | None
+    provenance: str
+    positive_strength: float
+    neutral_strength: float
+    negative_strength: float
+    chunks_invalid: int
+    counts_consistent: bool
+    tally: tuple[int, int, int]     # valid chunks (positive, neutral, negative) - legacy profile tally
+
+
+class ArticleArrays(NamedTuple):
+    """
+    Struct-of-arrays view of ArticleRows for the vectorized decay
+    kernel. 1 element per article, any number of symbols - each
+    article carries the segment id of its symbol (index into symbols).
+    """
+    symbols: tuple[str, ...]
+    symbol_id: np.ndarray           # int64 segment id
+    published_epoch: np.ndarray     # float64, NaN = unresolved timestamp
+    positive_strength: np.ndarray   # float64
+    neutral_strength: np.ndarray    # float64
+    negative_strength: np.ndarray   # float64
+    scored: np.ndarray              # bool, state == "scored"
+
+    @classmethod
+    def from_rows(cls, rows_by_symbol: Mapping[str, Iterable[ArticleRow]]) -> ArticleArrays:
+        """{symbol: ArticleRows} -> 1 struct-of-arrays table (article order kept per symbol)"""
+        symbols = tuple(rows_by_symbol)
+        rows = []
+        ids = []
+        for sid, symbol in enumerate(symbols):
+            _rows = list(rows_by_symbol[symbol])
+            rows.extend(_rows)
+            ids.extend([sid] * len(_rows))
+        return cls(
+            symbols,
+            np.array(ids, dtype=np.int64),
+            np.array([r.published_epoch for r in rows], dtype=np.float64),     # None -> NaN
+            np.array([r.positive_strength for r in rows], dtype=np.float64),
+            np.array([r.neutral_strength for r in rows], dtype=np.float64),
+            np.array([r.negative_strength for r in rows], dtype=np.float64),
+            np.array([r.state == "scored" for r in rows], dtype=bool),
+        )
+
+
+def decay_weights(published_epoch: Any, run_epoch: float, half_life_hours: Any) -> np.ndarray:
+    """
+    Vectorized w = 0.5 ** (age_hours / half_life), same clock-skew clamp
+    and float op order as the per-article loop. half_life_hours
+    may be an array shaped to broadcast, e.g. (H, 1) for a sweep.
+    NaN epochs give NaN weights - callers mask them out.
+    """
+    age_seconds = np.maximum(run_epoch - np.asarray(published_epoch, dtype=np.float64), 0.0)
+    return 0.5 ** ((age_seconds / SECONDS_PER_HOUR) / np.asarray(half_life_hours, dtype=np.float64))
+
+
+def decay_horizon(run_epoch: float, half_life_hours: float, min_weight: float = HORIZON_MIN_WEIGHT) -> float:
+    """
+    Oldest published_epoch whose decay weight is still >= min_weight
+    (0.01 @ 42h half-life = ~11.6 days). The since_epoch of a scan
+    that stops at the decay horizon.
+    """
+    return run_epoch - half_life_hours * SECONDS_PER_HOUR * math.log2(1.0 / min_weight)
+
+
 # ############################# MAIN CLASS
 class CompositeScorer:
     """
@@ -72,6 +157,11 @@ class CompositeScorer:
       - recency_weighted_polarity(symbol, articles, run_epoch)
       - score_symbol(symbol, source, run_epoch=None)
       - score_symbol_from_lmdb(symbol, db_path=DEFAULT_LMDB_PATH, ...)
+      - score_all(symbol, records, run_epoch) - all 4 reports, 1 pass
+      - composite_many(rows_by_symbol, run_epoch) - vectorized, many symbols
+      - rank_symbols(symbols=None, db_path=DEFAULT_LMDB_PATH, ...) - 1 LMDB scan
+      - refresh_symbols(symbols, ...) - incremental, persisted decayed sums
+      - build_time_index(symbols=None, ...) - (re)build the pub_time index
     """
 
     # Class assessors for sharing final reports
@@ -140,12 +230,20 @@ class CompositeScorer:
             symbol: str,
             db_path: str | Path = DEFAULT_LMDB_PATH,
             run_epoch: float | None = None,
-            db_id: str = DEFAULT_DB_ID) -> dict[str, Any]:
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None,
+            since_epoch: float | None = None,
+            until_epoch: float | None = None) -> dict[str, Any]:
         """
         Read all cached LMDB article records for one ticker and score them.
 
         Current Bespin LMDB keys are shaped as:
             0001.<SYMBOL>.<urlhash>
+
+        `env` = an already open lmdb.Environment (e.g. the persistent
+        env of a batch run). LMDB forbids opening one env twice in a
+        process, so callers that hold it open must pass it in.
+        since_epoch / until_epoch = score 1 published time window only.
         """
         if run_epoch is None:
             run_epoch = time.time()
@@ -154,9 +252,57 @@ class CompositeScorer:
         cmi_debug = __name__+"::"+self.score_symbol_from_lmdb.__name__
         logging.info(f"%s    - Compute LMDB data composite score @ time window: {run_epoch}." % cmi_debug )
 
-        records = self.load_symbol_articles_from_lmdb(symbol, db_path, db_id)
+        records = self.load_symbol_articles_from_lmdb(symbol, db_path, db_id, env, since_epoch, until_epoch)
         return self.composite_score(symbol.upper(), records, run_epoch)
 
+# ############################# Method #2b
+    def score_all(
+            self,
+            symbol: str,
+            records: Iterable[Mapping[str, Any]],
+            run_epoch: float | None = None,
+            profile: bool = True,
+            heatmap: bool = True,
+            columns: int = 3) -> dict[str, Any]:
+        """
+        ONE pass report bundle. Every record is normalized exactly once
+        into an ArticleRow table; the legacy profile, age heat map,
+        composite score and recency-weighted polarity are all computed
+        from that table. Results are identical to calling the 4 methods
+        separately (same accumulation order, same float ops).
+
+        R3: `records` may be a single-use stream (LMDB generator) - it
+        is only walked once. profile / heatmap = False skips computing
+        (and printing) that block.
+
+        Returns {profile, heatmap, composite, polarity}. A skipped block
+        is None.
+        """
+        if run_epoch is None:
+            run_epoch = time.time()
+        self._reset_run_counters()
+        symbol = symbol.upper()
+
+        cmi_debug = __name__+"::"+self.score_all.__name__
+        logging.info(f"%s    - Compute {symbol} report bundle @ time window: {run_epoch}." % cmi_debug )
+
+        legacy = self._legacy_accumulator()
+        rows = list(self._article_rows(records, legacy))
+        m = self._accumulate_rows(rows, run_epoch)
+
+        bundle = {
+            "profile": self._legacy_profile(symbol, legacy) if profile else None,
+            "heatmap": self._heat_map(symbol, rows, run_epoch, columns) if heatmap else None,
+            "composite": self._composite_report(symbol, m),
+            "polarity": self._polarity_report(symbol, m),
+        }
+        self.x_legacy_profile_report = bundle["profile"]
+        self.x_heatmap_report = bundle["heatmap"]
+        self.x_composite_score_report = bundle["composite"]
+        self.x_polarity_report = bundle["polarity"]
+        logging.info(f"%s    - Report bundle: {len(rows)} articles normalized once" % cmi_debug )
+        return bundle
+
 # ############################# Method #3
     def _normalize_and_accumulate(
             self,
@@ -172,12 +318,69 @@ class CompositeScorer:
         R3: consumes any iterable (list, generator, LMDB stream)
         without calling len().
         """
+        return self._accumulate_rows(self._article_rows(articles), run_epoch)
+
+# ############################# Method #3a
+    def _article_rows(
+            self,
+            articles: Iterable[Mapping[str, Any]],
+            legacy: dict[str, dict[str, Any]] | None = None) -> Iterable[ArticleRow]:
+        """
+        Normalize each article ONCE into an ArticleRow. `legacy` = a
+        _legacy_accumulator() that also collects the corpus chunk
+        tallies + score sums for the legacy profile, in the same chunk
+        order legacy_corpus_profile walks them.
+        """
+        for article in articles:
+            normalized, tally = self._normalize(article, legacy)
+            yield ArticleRow(
+                normalized["urlhash"],
+                normalized["state"],
+                normalized["published_epoch"],
+                normalized["timestamp_provenance"],
+                normalized["positive_strength"],
+                normalized["neutral_strength"],
+                normalized["negative_strength"],
+                normalized["chunks_invalid"],
+                normalized["counts_consistent"],
+                tally,
+            )
+
+# ############################# Method #3b
+    def _accumulate_rows(
+            self,
+            rows: Iterable[ArticleRow],
+            run_epoch: float) -> dict[str, Any]:
+        """
+        The decay weighting + P/N/U accumulation core, over already
+        normalized rows. _normalize_and_accumulate and score_all both
+        end up here. Masses come from the vectorized kernel
+        (decay_accumulate), telemetry from _row_telemetry.
+        """
         cmi_debug = __name__+"::"+self._normalize_and_accumulate.__name__
+        rows = list(rows)
+        masses = self.decay_accumulate(ArticleArrays.from_rows({"": rows}), run_epoch)
+        m = self._row_telemetry(rows, run_epoch)
+        m.update(P=float(masses["P"][0, 0]),
+                 N=float(masses["N"][0, 0]),
+                 U=float(masses["U"][0, 0]),
+                 n_eff=float(masses["n_eff"][0, 0]))
+        logging.info(f"%s    - Accumulated: articles={m['articles_total']} used={m['articles_used']} n_eff={m['n_eff']:.2f}" % cmi_debug)
+        return m
+
+# ############################# Method #3c
+    def _row_telemetry(
+            self,
+            rows: Iterable[ArticleRow],
+            run_epoch: float) -> dict[str, Any]:
+        """
+        Per-article adapter telemetry for 1 symbol: state / provenance
+        tallies, invalid chunks, count mismatches, skipped + used
+        articles. Everything _accumulate_rows reports except the masses.
+        """
+        cmi_debug = __name__+"::"+self._normalize_and_accumulate.__name__
+        log_weights = logging.getLogger().isEnabledFor(logging.INFO)   # per-article weight lines cost a pow() each
 
-        weighted_positive = 0.0
-        weighted_negative = 0.0
-        weighted_neutral = 0.0
-        n_eff = 0.0
         articles_total = 0
         articles_used = 0
         articles_skipped_no_timestamp = 0
@@ -186,51 +389,34 @@ class CompositeScorer:
         counts_inconsistent = 0
         chunks_invalid_total = 0
 
-        for article in articles:
+        for row in rows:
             articles_total += 1
 
-            normalized = self.normalize_article(article)
-
-            state_tally[normalized["state"]] = \
-                state_tally.get(normalized["state"], 0) + 1
-            prov = normalized["timestamp_provenance"]
+            state_tally[row.state] = state_tally.get(row.state, 0) + 1
+            prov = row.provenance
             provenance_tally[prov] = provenance_tally.get(prov, 0) + 1
-            chunks_invalid_total += normalized["chunks_invalid"]
-            if normalized["counts_consistent"] is False:
+            chunks_invalid_total += row.chunks_invalid
+            if row.counts_consistent is False:
                 counts_inconsistent += 1
 
-            if normalized["state"] != "scored":
+            if row.state != "scored":
                 # empty / unreadable records carry no sentiment mass -
                 # counted in tallies, excluded from the vote.
                 continue
 
-            published_epoch = normalized["published_epoch"]
-            if published_epoch is None:
+            if row.published_epoch is None:
                 articles_skipped_no_timestamp += 1
                 logging.error(f"%s    - Skip article with no timestamp: "
-                              f"{normalized['urlhash']}" % cmi_debug )
+                              f"{row.urlhash}" % cmi_debug )
                 continue
 
-            age_seconds = run_epoch - float(published_epoch)
-            if age_seconds < 0.0:
-                age_seconds = 0.0   # clock-skew guard: clamp, never inflate
-
-            age_hours = age_seconds / SECONDS_PER_HOUR
-            weight = 0.5 ** (age_hours / self.half_life_hours)
-            logging.info(f"%s    - Article age is: {age_hours:.2f} hours / Age Weight computed as: {weight:.4f}" % cmi_debug)
-
-            weighted_positive += weight * normalized["positive_strength"]
-            weighted_negative += weight * normalized["negative_strength"]
-            weighted_neutral += weight * normalized["neutral_strength"]
-            n_eff += weight
+            if log_weights:
+                age_hours = max(run_epoch - float(row.published_epoch), 0.0) / SECONDS_PER_HOUR
+                weight = 0.5 ** (age_hours / self.half_life_hours)
+                logging.info(f"%s    - Article age is: {age_hours:.2f} hours / Age Weight computed as: {weight:.4f}" % cmi_debug)
             articles_used += 1
 
-        logging.info(f"%s    - Accumulated: articles={articles_total} used={articles_used} n_eff={n_eff:.2f}" % cmi_debug)
         return {
-            "P": weighted_positive,
-            "N": weighted_negative,
-            "U": weighted_neutral,
-            "n_eff": n_eff,
             "articles_total": articles_total,
             "articles_used": articles_used,
             "articles_skipped_no_timestamp": articles_skipped_no_timestamp,
@@ -242,6 +428,89 @@ class CompositeScorer:
             },
         }
 
+# ############################# Method #3d
+    def decay_accumulate(
+            self,
+            arrays: ArticleArrays,
+            run_epoch: float,
+            half_life_hours: Any = None) -> dict[str, np.ndarray]:
+        """
+        Vectorized decay weighting + P/N/U reduction for MANY symbols
+        (and optionally MANY half-lives) in a few NumPy calls:
+        1 weight computation, then segment sums keyed by symbol id.
+
+        Voters = scored articles with a resolved timestamp, exactly as
+        the per-article loop. np.bincount adds each segment in article
+        order (same order as the sequential loop). NumPy's vectorized
+        pow() can differ from libm pow() in the last ulp, which never
+        shows in the rounded report values.
+
+        half_life_hours: None = this scorer's half-life, or a sequence
+        of half-lives for a research sweep.
+        Returns P, N, U, n_eff shaped (H, symbols), articles_used
+        shaped (symbols,) and the half_life_hours array (H,).
+        """
+        if half_life_hours is None:
+            half_life_hours = self.half_life_hours
+        half_lives = np.atleast_1d(np.asarray(half_life_hours, dtype=np.float64))
+        n_sym = len(arrays.symbols)
+        n_hl = len(half_lives)
+
+        vote = arrays.scored & ~np.isnan(arrays.published_epoch)
+        seg = arrays.symbol_id[vote]
+        weights = decay_weights(arrays.published_epoch[vote], run_epoch, half_lives[:, None])    # (H, voters)
+        keys = (np.arange(n_hl)[:, None] * n_sym + seg).ravel()
+        size = n_hl * n_sym
+
+        def _segment_sum(values):
+            return np.bincount(keys, weights=values.ravel(), minlength=size).reshape(n_hl, n_sym)
+
+        return {
+            "P": _segment_sum(weights * arrays.positive_strength[vote]),
+            "N": _segment_sum(weights * arrays.negative_strength[vote]),
+            "U": _segment_sum(weights * arrays.neutral_strength[vote]),
+            "n_eff": _segment_sum(weights),
+            "articles_used": np.bincount(seg, minlength=n_sym),
+            "half_life_hours": half_lives,
+        }
+
+# ############################# Method #3e
+    def composite_many(
+            self,
+            rows_by_symbol: Mapping[str, list[ArticleRow]],
+            run_epoch: float,
+            half_life_hours: Any = None) -> dict[Any, Any]:
+        """
+        Composite reports for MANY symbols from 1 kernel call, against
+        1 shared run_epoch. Per-symbol telemetry is identical to
+        composite_score(symbol, rows, run_epoch).
+
+        half_life_hours = a sequence -> HALF_LIFE_HOURS sweep (research):
+        returns {half_life: {symbol: report}}. Otherwise {symbol: report}.
+        """
+        cmi_debug = __name__+"::"+self.composite_many.__name__
+        arrays = ArticleArrays.from_rows(rows_by_symbol)
+        masses = self.decay_accumulate(arrays, run_epoch, half_life_hours)
+        logging.info(f"%s    - Kernel: {len(arrays.symbols)} symbols / {len(arrays.symbol_id)} articles / {len(masses['half_life_hours'])} half-lives" % cmi_debug )
+
+        telemetry = { symbol: self._row_telemetry(rows_by_symbol[symbol], run_epoch) for symbol in arrays.symbols }
+        sweep = {}
+        for h, half_life in enumerate(masses["half_life_hours"].tolist()):
+            reports = {}
+            for i, symbol in enumerate(arrays.symbols):
+                m = dict(telemetry[symbol],
+                         P=float(masses["P"][h, i]),
+                         N=float(masses["N"][h, i]),
+                         U=float(masses["U"][h, i]),
+                         n_eff=float(masses["n_eff"][h, i]))
+                report = self._composite_report(symbol, m)
+                report["params"] = dict(report["params"], half_life_hours=half_life)
+                reports[symbol] = report
+            sweep[half_life] = reports
+        if half_life_hours is None or np.ndim(half_life_hours) == 0:
+            return sweep[next(iter(sweep))]
+        return sweep
+
 # ############################# Method #4
     def composite_score(
             self,
@@ -256,6 +525,12 @@ class CompositeScorer:
         logging.info(f"%s    - Compute {symbol} composite ranking metrics @ window: {run_epoch}." % cmi_debug )
 
         m = self._normalize_and_accumulate(articles, run_epoch)
+        return self._composite_report(symbol, m)
+
+# ############################# Method #4a
+    def _composite_report(self, symbol: str, m: dict[str, Any]) -> dict[str, Any]:
+        """composite_score report from 1 accumulation result"""
+        cmi_debug = __name__+"::"+self.composite_score.__name__
         params = self.params()
 
         if m["n_eff"] == 0.0:
@@ -335,7 +610,11 @@ class CompositeScorer:
         logging.info(f"%s    - Compute {symbol} weighted polarity @ window: {run_epoch}." % cmi_debug )
 
         m = self._normalize_and_accumulate(articles, run_epoch)
+        return self._polarity_report(symbol, m)
 
+# ############################# Method #5a
+    def _polarity_report(self, symbol: str, m: dict[str, Any]) -> dict[str, Any]:
+        """recency_weighted_polarity report from 1 accumulation result"""
         if m["n_eff"] == 0.0:
             self.polarity_report = {
                 "symbol": symbol,
@@ -402,20 +681,52 @@ class CompositeScorer:
         cmi_debug = __name__+"::"+self.legacy_corpus_profile.__name__
         logging.info(f"%s    - Compute {symbol} legacy corpus profile..." % cmi_debug )
 
-        chunk_tally = {"positive": 0, "neutral": 0, "negative": 0}
-        score_sums = {"positive": 0.0, "neutral": 0.0, "negative": 0.0}
-
+        legacy = self._legacy_accumulator()
         for article in articles:
-            for chunk in self.iter_lmdb_chunks(article):
-                sent_type = str(chunk.get("sent_type", chunk.get("sent", ""))).lower()
-                sent_score = self._to_float_or_none(
-                    chunk.get("sent_score", chunk.get("rank")))
-                if sent_type not in _VALID_SENT_TYPES:
-                    continue    # invalid chunks are error-logged by normalize_article
-                if sent_score is None or math.isnan(sent_score):
-                    continue
-                chunk_tally[sent_type] += 1
-                score_sums[sent_type] += max(0.0, min(1.0, sent_score))
+            self._legacy_chunk_tally(article, legacy)
+        return self._legacy_profile(symbol, legacy)
+
+# ############################# Method #5b.1
+    @staticmethod
+    def _legacy_accumulator() -> dict[str, dict[str, Any]]:
+        """Empty corpus chunk tally + score sums for the legacy profile"""
+        return {"tally": {"positive": 0, "neutral": 0, "negative": 0},
+                "sums": {"positive": 0.0, "neutral": 0.0, "negative": 0.0}}
+
+# ############################# Method #5b.2
+    def _legacy_chunk_tally(
+            self,
+            article: Mapping[str, Any],
+            legacy: dict[str, dict[str, Any]]) -> tuple[int, int, int]:
+        """
+        Add 1 articles valid chunks to the legacy accumulator (silent -
+        invalid chunks are error-logged by normalize_article).
+        Returns this articles (positive, neutral, negative) tally.
+        """
+        chunk_tally = legacy["tally"]
+        score_sums = legacy["sums"]
+        tally = {"positive": 0, "neutral": 0, "negative": 0}
+        for chunk in self.iter_lmdb_chunks(article):
+            sent_type = str(chunk.get("sent_type", chunk.get("sent", ""))).lower()
+            sent_score = self._to_float_or_none(
+                chunk.get("sent_score", chunk.get("rank")))
+            if sent_type not in _VALID_SENT_TYPES:
+                continue    # invalid chunks are error-logged by normalize_article
+            if sent_score is None or math.isnan(sent_score):
+                continue
+            chunk_tally[sent_type] += 1
+            score_sums[sent_type] += max(0.0, min(1.0, sent_score))
+            tally[sent_type] += 1
+        return tally["positive"], tally["neutral"], tally["negative"]
+
+# ############################# Method #5b.3
+    def _legacy_profile(
+            self,
+            symbol: str,
+            legacy: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """legacy_corpus_profile math + print, from 1 legacy accumulator"""
+        chunk_tally = legacy["tally"]
+        score_sums = legacy["sums"]
 
         total_chunks = sum(chunk_tally.values())
         if total_chunks == 0:
@@ -614,6 +925,16 @@ class CompositeScorer:
 
         Returns {rows, sum_weights, resolved, unresolved} for storage.
         """
+        return self._heat_map(symbol, self._article_rows(articles), run_epoch, columns)
+
+# ############################# Method #5e.1
+    def _heat_map(
+            self,
+            symbol: str,
+            rows: Iterable[ArticleRow],
+            run_epoch: float,
+            columns: int = 3) -> dict[str, Any]:
+        """age_heat_map build + print, from normalized ArticleRows"""
         cmi_debug = __name__+"::"+self.age_heat_map.__name__
         logging.info(f"%s    - Build {symbol} age heat map @ window: {run_epoch}" % cmi_debug )
 
@@ -621,20 +942,23 @@ class CompositeScorer:
         unresolved_rows = []
         tag_tally = {"Pos": 0, "Neu": 0, "Neg": 0, "---": 0}
 
-        for article in articles:
-            urlhash10 = str(article.get("urlhash", "UNKNOWN"))[:10]
+        rows = list(rows)
+        row_weights = decay_weights(
+            [row.published_epoch for row in rows], run_epoch, self.half_life_hours).tolist()   # 1 vectorized pass
+
+        for row, row_weight in zip(rows, row_weights):
+            urlhash10 = row.urlhash[:10]
 
-            # One adapter call yields timestamp AND strengths - same
+            # One adapter row yields timestamp AND strengths - same
             # normalization the scorer uses, so the tag can never
             # disagree with the composite's view of the article.
-            profile = self.normalize_article(article)
-            published_epoch = profile["published_epoch"]
+            published_epoch = row.published_epoch
 
             # Dominant-bucket sentiment tag from article-level strengths
-            ps = profile["positive_strength"]
-            us = profile["neutral_strength"]
-            ns_ = profile["negative_strength"]
-            if profile["state"] != "scored":
+            ps = row.positive_strength
+            us = row.neutral_strength
+            ns_ = row.negative_strength
+            if row.state != "scored":
                 tag = "---"     # empty / unreadable: no sentiment claim
             elif ps > us and ps > ns_:
                 tag = "Pos"
@@ -652,7 +976,7 @@ class CompositeScorer:
             if age_seconds < 0.0:
                 age_seconds = 0.0   # same clock-skew clamp as the scorer
 
-            if profile["state"] != "scored":
+            if row.state != "scored":
                 # Timestamped but NOT scoreable (empty/unreadable): it
                 # casts no vote, so it must show no weight - the w
                 # column means VOTING weight, exactly as the scorer
@@ -660,9 +984,7 @@ class CompositeScorer:
                 resolved_rows.append((urlhash10, age_seconds, None, tag))
                 continue
 
-            age_hours = age_seconds / SECONDS_PER_HOUR
-            weight = 0.5 ** (age_hours / self.half_life_hours)
-            resolved_rows.append((urlhash10, age_seconds, weight, tag))
+            resolved_rows.append((urlhash10, age_seconds, row_weight, tag))
 
         # youngest first: heaviest voters read top-left, dead tail last
         resolved_rows.sort(key=lambda row: row[1])
@@ -769,6 +1091,18 @@ class CompositeScorer:
           positive/neutral/negative_strength,
           chunks_used, chunks_invalid, counts_consistent
         """
+        return self._normalize(article)[0]
+
+# ############################# Method #7a
+    def _normalize(
+            self,
+            article: Mapping[str, Any],
+            legacy: dict[str, dict[str, Any]] | None = None) -> tuple[dict[str, Any], tuple[int, int, int]]:
+        """
+        normalize_article core. Also returns the articles valid chunk
+        tally, and (when `legacy` is given) adds its chunks to the
+        legacy profile accumulator in the SAME chunk walk.
+        """
         cmi_debug = __name__+"::"+self.normalize_article.__name__
         self.processing_record += 1
         _urlhash = str(article.get("urlhash", "UNKNOWN"))
@@ -782,6 +1116,7 @@ class CompositeScorer:
         strength_keys = ("positive_strength", "neutral_strength", "negative_strength")
         present = [key for key in strength_keys if key in article]
         if len(present) == len(strength_keys):
+            tally = self._legacy_chunk_tally(article, legacy or self._legacy_accumulator())
             return {
                 "state": "scored",
                 "urlhash": _urlhash,
@@ -793,10 +1128,11 @@ class CompositeScorer:
                 "chunks_used": 0,
                 "chunks_invalid": 0,
                 "counts_consistent": True,
-            }
+            }, tally
         elif len(present) > 0:
             logging.error(f"%s          - PARTIAL explicit strengths {present} on {_urlhash} - record unreadable" % cmi_debug )
-            return self._unreadable_profile(_urlhash, published_epoch, provenance)
+            tally = self._legacy_chunk_tally(article, legacy or self._legacy_accumulator())
+            return self._unreadable_profile(_urlhash, published_epoch, provenance), tally
 
         # ---- path 2: LMDB chunk sub-dicts, mean-reduced ----
         sum_positive = 0.0
@@ -829,6 +1165,9 @@ class CompositeScorer:
             if sent_score < 0.0 or sent_score > 1.0:
                 logging.error(f"%s          - sent_score out of [0,1] ({sent_score:.4f}) on {_urlhash} - clamped" % cmi_debug )
                 sent_score = max(0.0, min(1.0, sent_score))
+            if legacy is not None:
+                legacy["tally"][sent_type] += 1
+                legacy["sums"][sent_type] += sent_score
 
             if sent_type == "positive":
                 sum_positive += sent_score
@@ -839,6 +1178,7 @@ class CompositeScorer:
             tally[sent_type] += 1
             chunks_used += 1
 
+        chunk_tally = (tally["positive"], tally["neutral"], tally["negative"])
         if chunks_used > 0:
             # R6: consistency check vs stored per-label tallies, only
             # when the stored counts exist to check against.
@@ -865,12 +1205,12 @@ class CompositeScorer:
                 "chunks_used": chunks_used,
                 "chunks_invalid": chunks_invalid,
                 "counts_consistent": counts_consistent,
-            }
+            }, chunk_tally
 
         if chunks_seen > 0:
             # chunks existed but every one was invalid
             return self._unreadable_profile(_urlhash, published_epoch, provenance,
-                                            chunks_invalid=chunks_invalid)
+                                            chunks_invalid=chunks_invalid), chunk_tally
 
         # ---- path 3: count fallback, share-normalized to mean scale ----
         pos_count = self._to_float(article.get("positive_count"))
@@ -892,7 +1232,7 @@ class CompositeScorer:
                 "chunks_used": 0,
                 "chunks_invalid": 0,
                 "counts_consistent": True,
-            }
+            }, chunk_tally
 
         # ---- nothing usable at all ----
         return {
@@ -906,7 +1246,7 @@ class CompositeScorer:
             "chunks_used": 0,
             "chunks_invalid": 0,
             "counts_consistent": True,
-        }
+        }, chunk_tally
 
 # ############################# Method #8
     @staticmethod
@@ -989,11 +1329,17 @@ class CompositeScorer:
             self,
             symbol: str,
             db_path: str | Path = DEFAULT_LMDB_PATH,
-            db_id: str = DEFAULT_DB_ID) -> Iterable[dict[str, Any]]:
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None,
+            since_epoch: float | None = None,
+            until_epoch: float | None = None) -> Iterable[dict[str, Any]]:
         """
-        Stream LMDB JSON article records for one ticker from Bespin's LMDB cache
+        Stream LMDB article records (v1 JSON or v2 msgpack) for one ticker from Bespin's LMDB cache
+        `env` = an already open lmdb.Environment to read through (left open). None = open db_path read-only
+        `since_epoch` / `until_epoch` = only articles published inside that window, read with a
+        pub_time index time range cursor (older articles are never decoded). None = no bound
         """
-        if lmdb is None:
+        if lmdb is None and env is None:
             raise RuntimeError("lmdb is not installed; install requirements before reading LMDB.")
 
         symbol = symbol.upper()
@@ -1003,35 +1349,575 @@ class CompositeScorer:
         db_path = Path(db_path)
         prefix = f"{db_id}.{symbol}.".encode("utf-8")
         logging.info(f"%s    - Scaning for LMDB data pattern: {prefix}" % cmi_debug )
-
-        env = lmdb.open(
-            str(db_path),
-            readonly=True,
-            lock=False,
-            readahead=False,
-            max_readers=126,
-        )
+        window = since_epoch is not None or until_epoch is not None
+
+        shared_env = env is not None
+        if not shared_env:
+            env = lmdb.open(
+                str(db_path),
+                readonly=True,
+                lock=False,
+                readahead=False,
+                max_readers=126,
+                max_dbs=8,
+            )
         try:
+            ptime_db = self._ptime_db(env) if window else None
             with env.begin() as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(prefix):
+                if window:
+                    items = self._window_items(txn, ptime_db, symbol, since_epoch, until_epoch, db_id)
+                else:
+                    cursor = txn.cursor()
+                    items = cursor.iternext() if cursor.set_range(prefix) else ()
                     logging.info(f"%s    - Opened LMDB database for READ-ONLY Txn..." % cmi_debug )
-                    for key, value in cursor:
-                        if not key.startswith(prefix):
-                            break
-                        try:
-                            record = json.loads(value.decode("utf-8"))
-                        except (UnicodeDecodeError, json.JSONDecodeError) as err:
-                            # R5: a half-written/corrupt record must
-                            # leave a trace, not vanish silently.
-                            logging.error(f"%s    - CORRUPT LMDB record {key!r}: {err}" % cmi_debug )
-                            continue
-                        if isinstance(record, dict):
-                            self.lmdb_record_count += 1
-                            yield record
+                for key, value in items:
+                    if not key.startswith(prefix):
+                        break
+                    if b"." in key[len(prefix):]:
+                        continue    # a longer symbol sharing this prefix (BRK.B under BRK)
+                    try:
+                        record = decode_record(value)     # v1 JSON or v2 msgpack
+                    except ValueError as err:
+                        # R5: a half-written/corrupt record must
+                        # leave a trace, not vanish silently.
+                        logging.error(f"%s    - CORRUPT LMDB record {key!r}: {err}" % cmi_debug )
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    if window and not self._in_window(self.resolve_published_epoch(record)[0], since_epoch, until_epoch):
+                        continue
+                    self.lmdb_record_count += 1
+                    yield record
         finally:
             logging.info(f"%s    - Close LMDB database / Populated {self.lmdb_record_count} records" % cmi_debug )
-            env.close()
+            if not shared_env:
+                env.close()
+
+# ############################# Method #11a
+    def load_rows_by_symbol_from_lmdb(
+            self,
+            symbols: Iterable[str] | None = None,
+            db_path: str | Path = DEFAULT_LMDB_PATH,
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None,
+            since_epoch: float | None = None,
+            until_epoch: float | None = None) -> dict[str, list[ArticleRow]]:
+        """
+        Stream MANY tickers out of LMDB in 1 env + 1 read txn, straight
+        into per-symbol ArticleRow lists (each record is normalized as it
+        is read, then dropped).
+
+        symbols = None -> walk the whole <db_id>.* keyspace ONCE and
+        group by the symbol in the key. A symbol list -> 1 prefix range
+        per symbol, all inside the same txn. Listed symbols with no
+        records still get an (empty) entry.
+        `env` = an already open lmdb.Environment (left open).
+
+        `since_epoch` / `until_epoch` -> 1 pub_time index time range
+        cursor per symbol instead (symbols = None: every indexed symbol).
+        Only articles published inside the window are decoded.
+        """
+        if lmdb is None and env is None:
+            raise RuntimeError("lmdb is not installed; install requirements before reading LMDB.")
+
+        cmi_debug = __name__+"::"+self.load_rows_by_symbol_from_lmdb.__name__
+        rows_by_symbol: dict[str, list[ArticleRow]] = {}
+        if symbols is not None:
+            for symbol in symbols:
+                rows_by_symbol.setdefault(symbol.upper(), [])
+        root = f"{db_id}.".encode("utf-8")
+        window = since_epoch is not None or until_epoch is not None
+
+        shared_env = env is not None
+        if not shared_env:
+            env = lmdb.open(
+                str(Path(db_path)),
+                readonly=True,
+                lock=False,
+                readahead=False,
+                max_readers=126,
+                max_dbs=8,
+            )
+        try:
+            ptime_db = self._ptime_db(env) if window else None
+            with env.begin() as txn:
+                if window and symbols is None and not self._index_complete(txn, ptime_db):
+                    logging.warning(f"%s    - pub_time index not COMPLETE - walk every record (run --build-time-index)" % cmi_debug )
+                if window and (symbols is not None or self._index_complete(txn, ptime_db)):
+                    if symbols is None:
+                        rows_by_symbol = {symbol: [] for symbol in self._indexed_symbols(txn, ptime_db)}
+                    logging.info(f"%s    - Scan {len(rows_by_symbol)} symbol time windows in 1 txn" % cmi_debug )
+                    items = ((symbol, key, value) for symbol in list(rows_by_symbol)
+                             for key, value in self._window_items(txn, ptime_db, symbol, since_epoch, until_epoch, db_id))
+                else:
+                    items = self._prefix_items(txn, root, None if symbols is None else list(rows_by_symbol))
+                for symbol_key, key, value in items:
+                    try:
+                        record = decode_record(value)     # v1 JSON or v2 msgpack
+                    except ValueError as err:
+                        logging.error(f"%s    - CORRUPT LMDB record {key!r}: {err}" % cmi_debug )
+                        continue
+                    if isinstance(record, dict):
+                        self.lmdb_record_count += 1
+                        rows = self._article_rows([record])
+                        if window:
+                            rows = [row for row in rows if self._in_window(row.published_epoch, since_epoch, until_epoch)]
+                        rows_by_symbol.setdefault(symbol_key, []).extend(rows)
+        finally:
+            logging.info(f"%s    - {len(rows_by_symbol)} symbols / {self.lmdb_record_count} records" % cmi_debug )
+            if not shared_env:
+                env.close()
+        return rows_by_symbol
+
+# ############################# Method #11b
+    def rank_symbols(
+            self,
+            symbols: Iterable[str] | None = None,
+            db_path: str | Path = DEFAULT_LMDB_PATH,
+            run_epoch: float | None = None,
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None,
+            since_epoch: float | None = None,
+            until_epoch: float | None = None) -> list[dict[str, Any]]:
+        """
+        Cross-symbol RANKING engine. 1 LMDB scan (or 1 txn over a symbol
+        list), 1 vectorized kernel call, ONE shared run_epoch for every
+        symbol - scores are only comparable against the same anchor.
+        since_epoch / until_epoch = rank on 1 published time window only
+        (pub_time index cursors, e.g. since_epoch=decay_horizon(...)).
+
+        Returns composite reports, best composite_score first. Symbols
+        with no score (no scoreable articles) sort last.
+        """
+        if run_epoch is None:
+            run_epoch = time.time()
+        self._reset_run_counters()
+
+        cmi_debug = __name__+"::"+self.rank_symbols.__name__
+        logging.info(f"%s    - Rank symbols @ shared time window: {run_epoch}." % cmi_debug )
+
+        rows_by_symbol = self.load_rows_by_symbol_from_lmdb(symbols, db_path, db_id, env, since_epoch, until_epoch)
+        reports = list(self.composite_many(rows_by_symbol, run_epoch).values())
+        reports.sort(key=lambda r: (r["composite_score"] is None, -(r["composite_score"] or 0.0)))
+        return reports
+
+# ############################# Method #11c
+    @staticmethod
+    def print_ranking(reports: list[dict[str, Any]], run_epoch: float | None = None) -> None:
+        """Print a rank_symbols() table: composite score, polarity, n_eff, state"""
+        print(f"=================== Composite Sentiment Ranking: {len(reports)} symbols ===================")
+        if run_epoch is not None:
+            print(f"Shared run_epoch: {run_epoch:.0f} ({datetime.fromtimestamp(run_epoch, timezone.utc).isoformat(timespec='seconds')})")
+        print(f"{'#':>4} {'Symbol':<8} {'Score':>8} {'Polarity':>9} {'N_eff':>7} {'Used':>5} {'Total':>6}  State")
+        for rank, report in enumerate(reports, 1):
+            score = f"{report['composite_score']:>8.4f}" if report["composite_score"] is not None else f"{'-':>8}"
+            polarity = f"{report['polarity']:>9.4f}" if report["polarity"] is not None else f"{'-':>9}"
+            print(f"{rank:>4} {report['symbol']:<8} {score} {polarity} {report['n_eff']:>7.2f} "
+                  f"{report['articles_used']:>5} {report['articles_total']:>6}  {report['state']}")
+        print()
+
+# ############################# Method #11d
+    def refresh_symbols(
+            self,
+            symbols: Iterable[str],
+            db_path: str | Path = DEFAULT_LMDB_PATH,
+            run_epoch: float | None = None,
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None) -> list[dict[str, Any]]:
+        """
+        INCREMENTAL composite scores. Exponential decay is memoryless:
+          P(t2) = P(t1) * 0.5 ** ((t2 - t1) / half_life) + new articles
+        (same for N, U, n_eff). Each symbol keeps a state record in the
+        score_state sub-DB: decayed sums + telemetry at an anchor epoch,
+        the (sorted) urlhash keys already folded in, 1 fingerprint per
+        folded record (value length + crc32) and a digest of both.
+
+        A refresh is a prefix scan that only fingerprints each value (no
+        decode). Unchanged digest -> just roll the sums forward. Otherwise
+        only the NEW keys are decoded + normalized and folded in. The
+        state is rebuilt from scratch when it is missing, the half-life
+        changed, run_epoch is older than the anchor, or a folded article
+        was deleted or re-written (its fingerprint changed).
+
+        Articles published AFTER run_epoch are scored (weight clamps to
+        1.0) but never folded - the clamp is not memoryless. Corrupt
+        records are not folded either, so a rebuilt record is picked up.
+
+        Needs a WRITABLE env (`env` = the persistent lmdb_io_eng env, or
+        db_path is opened read-write). Results match rank_symbols() to
+        float rounding. Returns composite reports, best score first.
+        """
+        if lmdb is None and env is None:
+            raise RuntimeError("lmdb is not installed; install requirements before reading LMDB.")
+        if run_epoch is None:
+            run_epoch = time.time()
+        self._reset_run_counters()
+
+        cmi_debug = __name__+"::"+self.refresh_symbols.__name__
+        shared_env = env is not None
+        if not shared_env:
+            env = lmdb.open(str(Path(db_path)), map_size=DEFAULT_MAP_SIZE, max_dbs=8, readahead=False)
+        reports = []
+        try:
+            state_db = env.open_db(STATE_DB)       # before the write txn. open_db() inside an active RW txn deadlocks
+            with env.begin(write=True) as txn:
+                for symbol in dict.fromkeys(s.upper() for s in symbols):
+                    reports.append(self._refresh_symbol(txn, state_db, symbol, run_epoch, db_id))
+        finally:
+            if not shared_env:
+                env.close()
+        reports.sort(key=lambda r: (r["composite_score"] is None, -(r["composite_score"] or 0.0)))
+        logging.info(f"%s    - Refreshed {len(reports)} symbols / {self.lmdb_record_count} records decoded" % cmi_debug )
+        return reports
+
+# ############################# Method #11e
+    def _refresh_symbol(
+            self,
+            txn: Any,
+            state_db: Any,
+            symbol: str,
+            run_epoch: float,
+            db_id: str) -> dict[str, Any]:
+        """refresh_symbols() for 1 symbol, inside the callers write txn"""
+        cmi_debug = __name__+"::"+self.refresh_symbols.__name__+"."+symbol
+        prefix = f"{db_id}.{symbol}.".encode("utf-8")
+
+        # fingerprint only - no decode, no normalize
+        current: dict[bytes, int] = {}
+        cursor = txn.cursor()
+        if cursor.set_range(prefix):
+            for key, value in cursor:
+                if not key.startswith(prefix):
+                    break
+                if b"." not in key[len(prefix):]:          # skip a longer symbol sharing this prefix (BRK.B under BRK)
+                    current[key[len(prefix):]] = self._fingerprint(value)
+        digest = self._key_digest(current.items())
+
+        state = self._load_state(txn, state_db, symbol)
+        folded: dict[bytes, int] = {}
+        if state is not None:
+            folded = dict(zip(state["keys"], state["fps"]))
+            if (state["hl"] != self.half_life_hours or run_epoch < state["anchor"]
+                    or any(current.get(k) != fp for k, fp in folded.items())):
+                logging.info(f"%s    - Score state is stale (deleted / re-written article) - rebuild" % cmi_debug )
+                state = None
+                folded = {}
+        if state is None:
+            state = self._empty_state()
+            state["anchor"] = run_epoch
+
+        # roll the decayed sums forward to run_epoch
+        factor = 0.5 ** (((run_epoch - state["anchor"]) / SECONDS_PER_HOUR) / self.half_life_hours)
+        for mass in ("P", "N", "U", "n_eff"):
+            state[mass] *= factor
+        state["anchor"] = run_epoch
+
+        if digest == state["digest"]:
+            logging.info(f"%s    - No new articles: roll forward only (x{factor:.4f})" % cmi_debug )
+            return self._state_report(symbol, state, [], run_epoch)
+
+        # decode + normalize ONLY the keys not folded yet
+        fold_rows = []
+        pending_rows = []
+        fold_keys = {}
+        for suffix, fp in current.items():
+            if suffix in folded:
+                continue
+            value = txn.get(prefix + suffix)
+            try:
+                record = decode_record(value)
+            except ValueError as err:
+                logging.error(f"%s    - CORRUPT LMDB record {prefix + suffix!r}: {err}" % cmi_debug )
+                continue
+            if not isinstance(record, dict):
+                continue
+            self.lmdb_record_count += 1
+            for row in self._article_rows([record]):
+                if row.state == "scored" and row.published_epoch is not None and row.published_epoch > run_epoch:
+                    pending_rows.append(row)    # future dated: clamped weight, not memoryless. Never folded
+                else:
+                    fold_rows.append(row)
+                    fold_keys[suffix] = fp
+
+        if fold_rows:
+            m = self._accumulate_rows(fold_rows, run_epoch)
+            for mass in ("P", "N", "U", "n_eff"):
+                state[mass] += m[mass]
+            state["tel"] = self._merge_telemetry(state["tel"], m)
+        folded.update(fold_keys)
+        state["keys"] = [k for k in current if k in folded]     # LMDB key order = sorted
+        state["fps"] = [folded[k] for k in state["keys"]]
+        state["digest"] = self._key_digest(zip(state["keys"], state["fps"]))
+        txn.put(symbol.encode("utf-8"), self._pack_state(state), db=state_db)
+        logging.info(f"%s    - Folded {len(fold_rows)} new articles / {len(pending_rows)} pending / {len(state['keys'])} in state" % cmi_debug )
+        return self._state_report(symbol, state, pending_rows, run_epoch)
+
+# ############################# Method #11f
+    def _state_report(
+            self,
+            symbol: str,
+            state: dict[str, Any],
+            pending_rows: list[ArticleRow],
+            run_epoch: float) -> dict[str, Any]:
+        """composite report = rolled state (+ pending future dated rows, not persisted)"""
+        m = dict(state["tel"], P=state["P"], N=state["N"], U=state["U"], n_eff=state["n_eff"])
+        if pending_rows:
+            p = self._accumulate_rows(pending_rows, run_epoch)
+            m = dict(self._merge_telemetry(m, p),
+                     P=m["P"] + p["P"], N=m["N"] + p["N"], U=m["U"] + p["U"], n_eff=m["n_eff"] + p["n_eff"])
+        return self._composite_report(symbol, m)
+
+# ############################# Method #11g
+    @staticmethod
+    def _merge_telemetry(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict[str, Any]:
+        """Add 2 _row_telemetry results (every counter is additive)"""
+        merged = {key: a[key] + b[key] for key in
+                  ("articles_total", "articles_used", "articles_skipped_no_timestamp")}
+        adapter = {}
+        for key in ("state_tally", "provenance_tally"):
+            tally = dict(a["adapter"][key])
+            for name, count in b["adapter"][key].items():
+                tally[name] = tally.get(name, 0) + count
+            adapter[key] = tally
+        for key in ("counts_inconsistent", "chunks_invalid_total"):
+            adapter[key] = a["adapter"][key] + b["adapter"][key]
+        merged["adapter"] = adapter
+        return merged
+
+# ############################# Method #11h
+    def _empty_state(self) -> dict[str, Any]:
+        return {
+            "v": STATE_VERSION,
+            "hl": self.half_life_hours,
+            "anchor": 0.0,
+            "P": 0.0, "N": 0.0, "U": 0.0, "n_eff": 0.0,
+            "tel": self._row_telemetry([], 0.0),
+            "keys": [],
+            "fps": [],
+            "digest": self._key_digest([]),
+        }
+
+    @staticmethod
+    def _fingerprint(value: bytes) -> int:
+        """Cheap record fingerprint: value length + crc32. A re-written record changes it"""
+        return (len(value) << 32) | zlib.crc32(value)
+
+    @staticmethod
+    def _key_digest(items: Iterable[tuple[bytes, int]]) -> bytes:
+        """Article set digest: sha256 over the (LMDB sorted) urlhash key suffixes + their record fingerprints"""
+        h = hashlib.sha256()
+        for key, fp in items:
+            h.update(bytes(key))
+            h.update(fp.to_bytes(8, "big"))
+        return h.digest()
+
+    @staticmethod
+    def _pack_state(state: Mapping[str, Any]) -> bytes:
+        return msgpack.packb(dict(state), use_bin_type=True)
+
+    def _load_state(self, txn: Any, state_db: Any, symbol: str) -> dict[str, Any] | None:
+        cmi_debug = __name__+"::"+self._load_state.__name__
+        value = txn.get(symbol.encode("utf-8"), db=state_db)
+        if value is None:
+            return None
+        try:
+            state = msgpack.unpackb(bytes(value), raw=False)
+            if state.get("v") != STATE_VERSION:
+                return None
+            state["keys"] = [bytes(k) for k in state["keys"]]
+            return state
+        except Exception as err:
+            logging.error(f"%s    - CORRUPT score state for {symbol}: {err} - rebuild" % cmi_debug )
+            return None
+
+# ############################# Method #11i
+    @staticmethod
+    def _ptime_db(env: Any) -> Any:
+        """
+        pub_time index sub-DB handle. None = this DB has no index yet.
+        Call before any txn - open_db() inside an active RW txn deadlocks.
+        """
+        try:
+            return env.open_db(PTIME_DB, create=False)
+        except lmdb.Error:
+            return None
+
+# ############################# Method #11j
+    def _window_items(
+            self,
+            txn: Any,
+            ptime_db: Any,
+            symbol: str,
+            since_epoch: float | None,
+            until_epoch: float | None,
+            db_id: str) -> Iterable[tuple[bytes, Any]]:
+        """
+        (key, value) of 1 symbols articles published inside the window:
+        1 cursor range SYMBOL|since .. SYMBOL|until over the pub_time
+        index, then 1 get() per article. The scan stops at the window
+        edge - nothing older is touched.
+
+        Index epochs are whole seconds and a re-written article can leave
+        a stale entry behind, so callers re-check the window against the
+        resolved epoch. The index is only trusted once it is COMPLETE for
+        the symbol (SYMBOL| or PTIME_ALL marker). Otherwise - a DB written
+        before the index existed, not backfilled yet - the symbol falls
+        back to its full prefix scan.
+        """
+        cmi_debug = __name__+"::"+self._window_items.__name__+"."+symbol
+        base = f"{symbol}|".encode("utf-8")
+        if not self._index_complete(txn, ptime_db, symbol):
+            cursor = txn.cursor(db=ptime_db) if ptime_db is not None else None
+            if cursor is not None and cursor.set_range(base) and cursor.key().startswith(base):
+                logging.warning(f"%s    - PARTIAL pub_time index for {symbol} - full prefix scan (run --build-time-index)" % cmi_debug )
+            else:
+                logging.info(f"%s    - No pub_time index for {symbol} - full prefix scan (see --build-time-index)" % cmi_debug )
+            prefix = f"{db_id}.{symbol}.".encode("utf-8")
+            cursor = txn.cursor()
+            if cursor.set_range(prefix):
+                for key, value in cursor:
+                    if not key.startswith(prefix):
+                        break
+                    if b"." in key[len(prefix):]:
+                        continue    # a longer symbol sharing this prefix (BRK.B under BRK)
+                    yield key, value
+            return
+
+        lo = ptime_key(symbol, since_epoch if since_epoch is not None else 0)       # > the SYMBOL| marker
+        # "}" sorts right after "|" -> the end of this symbols index range
+        hi = ptime_key(symbol, math.floor(until_epoch) + 1) if until_epoch is not None else f"{symbol}}}".encode("utf-8")
+        keys: dict[bytes, None] = {}
+        cursor = txn.cursor(db=ptime_db)
+        if cursor.set_range(lo):
+            for index_key, key in cursor:
+                if index_key >= hi:
+                    break
+                keys[bytes(key)] = None
+
+        logging.info(f"%s    - {len(keys)} articles in the pub_time window" % cmi_debug )
+        for key in keys:
+            value = txn.get(key)
+            if value is None:
+                logging.info(f"%s    - pub_time index entry w/o a record: {key!r}" % cmi_debug )
+                continue
+            yield key, value
+
+    @staticmethod
+    def _index_complete(txn: Any, ptime_db: Any, symbol: str | None = None) -> bool:
+        """pub_time index COMPLETE marker set for the whole DB (or for symbol)"""
+        if ptime_db is None:
+            return False
+        if txn.get(PTIME_ALL, db=ptime_db) is not None:
+            return True
+        return symbol is not None and txn.get(f"{symbol}|".encode("utf-8"), db=ptime_db) is not None
+
+# ############################# Method #11k
+    @staticmethod
+    def _prefix_items(
+            txn: Any,
+            root: bytes,
+            symbols: list[str] | None) -> Iterable[tuple[str, bytes, Any]]:
+        """
+        (symbol, key, value) of every <db_id>.* record (symbols = None),
+        or of each listed symbols prefix range, in 1 txn
+        """
+        cursor = txn.cursor()
+        ranges = [root] if symbols is None else [root + symbol.encode("utf-8") + b"." for symbol in symbols]
+        for prefix in ranges:
+            if not cursor.set_range(prefix):
+                continue
+            for key, value in cursor:
+                if not key.startswith(prefix):
+                    break
+                # <db_id>.<SYMBOL>.<urlhash> - symbols may hold a "." (BRK.B), urlhashes never do
+                symbol_key = key[len(root):].rsplit(b".", 1)[0].decode("utf-8", "replace")
+                if symbols is not None and root + symbol_key.encode("utf-8") + b"." != prefix:
+                    continue    # a longer symbol sharing this prefix (BRK.B under BRK)
+                yield symbol_key, key, value
+
+    @staticmethod
+    def _indexed_symbols(txn: Any, ptime_db: Any) -> Iterable[str]:
+        """Every symbol in the pub_time index - 1 cursor seek per symbol, not a walk of its entries"""
+        cursor = txn.cursor(db=ptime_db)
+        found = cursor.first()
+        while found:
+            symbol = bytes(cursor.key()).split(b"|", 1)[0]
+            if not symbol:
+                break       # PTIME_ALL marker sorts after every SYMBOL| range
+            yield symbol.decode("utf-8", "replace")
+            found = cursor.set_range(symbol + b"}")
+
+    @staticmethod
+    def _in_window(published_epoch: float | None, since_epoch: float | None, until_epoch: float | None) -> bool:
+        if published_epoch is None or math.isnan(published_epoch):
+            return False
+        if since_epoch is not None and published_epoch < since_epoch:
+            return False
+        return until_epoch is None or published_epoch <= until_epoch
+
+# ############################# Method #11l
+    def build_time_index(
+            self,
+            symbols: Iterable[str] | None = None,
+            db_path: str | Path = DEFAULT_LMDB_PATH,
+            db_id: str = DEFAULT_DB_ID,
+            env: Any = None) -> int:
+        """
+        (Re)build the pub_time index from the article records: DBs
+        written before the index existed, or to clear stale entries.
+        symbols = None -> the whole index. Sets the COMPLETE marker of each
+        symbol (or of the whole DB). Each article is indexed at the
+        same resolve_published_epoch() the scorer reads it back with.
+        Articles with no usable publish time are not indexed.
+
+        Needs a WRITABLE env. Returns index entries written.
+        """
+        if lmdb is None and env is None:
+            raise RuntimeError("lmdb is not installed; install requirements before reading LMDB.")
+        self._reset_run_counters()
+
+        cmi_debug = __name__+"::"+self.build_time_index.__name__
+        root = f"{db_id}.".encode("utf-8")
+        written = 0
+        shared_env = env is not None
+        if not shared_env:
+            env = lmdb.open(str(Path(db_path)), map_size=DEFAULT_MAP_SIZE, max_dbs=8, readahead=False)
+        try:
+            ptime_db = env.open_db(PTIME_DB)       # before the write txn. open_db() inside an active RW txn deadlocks
+            with env.begin(write=True) as txn:
+                if symbols is None:
+                    txn.drop(ptime_db, delete=False)
+                else:
+                    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+                    cursor = txn.cursor(db=ptime_db)
+                    for symbol in symbols:
+                        base = f"{symbol}|".encode("utf-8")
+                        if cursor.set_range(base):
+                            while cursor.key().startswith(base) and cursor.delete():
+                                pass
+                for symbol_key, key, value in self._prefix_items(txn, root, symbols):
+                    try:
+                        record = decode_record(value)
+                    except ValueError as err:
+                        logging.error(f"%s    - CORRUPT LMDB record {key!r}: {err}" % cmi_debug )
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    self.lmdb_record_count += 1
+                    published_epoch = self.resolve_published_epoch(record)[0]
+                    if published_epoch is None or not math.isfinite(published_epoch):
+                        continue
+                    urlhash = key[len(root):].rsplit(b".", 1)[1].decode("utf-8")
+                    txn.put(ptime_key(symbol_key, published_epoch, urlhash), bytes(key), db=ptime_db)
+                    written += 1
+                # COMPLETE markers: readers trust the index from now on
+                for mark in ([PTIME_ALL] if symbols is None else [f"{symbol}|".encode("utf-8") for symbol in symbols]):
+                    txn.put(mark, b"", db=ptime_db)
+        finally:
+            if not shared_env:
+                env.close()
+        logging.info(f"%s    - pub_time index: {written} entries / {self.lmdb_record_count} records" % cmi_debug )
+        return written
 
 # ############################# Method #12
     def params(self) -> dict[str, float]:
@@ -1177,7 +2063,7 @@ def main() -> int:
     parser = argparse.ArgumentParser(
         description="Compute one Bespin composite sentiment score from LMDB."
     )
-    parser.add_argument("symbol", help="Ticker symbol to score, e.g. WULF")
+    parser.add_argument("symbol", help="Ticker symbol to score, e.g. WULF. With --rank: 0+ symbols to rank", nargs="*")
     parser.add_argument(
         "--db-path",
         default=str(DEFAULT_LMDB_PATH),
@@ -1214,6 +2100,44 @@ def main() -> int:
         required=False,
         default=False,
     )
+    parser.add_argument(
+        "--rank",
+        help="cross-symbol ranking table in 1 LMDB scan (no symbols = every symbol in the DB)",
+        action="store_true",
+        dest="bool_rank",
+        required=False,
+        default=False,
+    )
+    parser.add_argument(
+        "--incremental",
+        help="with --rank: roll the persisted per-symbol decayed sums forward + fold in only new articles (opens the DB read-write)",
+        action="store_true",
+        dest="bool_incremental",
+        required=False,
+        default=False,
+    )
+    parser.add_argument(
+        "--window-hours",
+        type=float,
+        default=None,
+        help="only score articles published in the last N hours before --run-epoch (pub_time index time range scan)",
+    )
+    parser.add_argument(
+        "--horizon",
+        help="only score articles inside the decay horizon (decay weight >= 0.01). Scans stop there",
+        action="store_true",
+        dest="bool_horizon",
+        required=False,
+        default=False,
+    )
+    parser.add_argument(
+        "--build-time-index",
+        help="(re)build the pub_time index for the symbols given (no symbols = every article) and exit. Opens the DB read-write",
+        action="store_true",
+        dest="bool_build_index",
+        required=False,
+        default=False,
+    )
     parser.add_argument('-v','--verbose', help='verbose error logging', action='store_true', dest='bool_verbose', required=False, default=False)
 
     args = parser.parse_args()
@@ -1227,26 +2151,48 @@ def main() -> int:
     run_epoch = args.run_epoch if args.run_epoch is not None else time.time()
 
     scorer = CompositeScorer()
-    scorer._reset_run_counters()
-    # Materialize ONCE: the LMDB stream is single-use, but the legacy
-    # profile and the weighted metrics both need the full corpus.
-    records = list(scorer.load_symbol_articles_from_lmdb(args.symbol, args.db_path))
-
-    if args.bool_no_profile is False:
-        x_legacy_profile_report = scorer.legacy_corpus_profile(args.symbol.upper(), records)
-        
-    if args.bool_no_heatmap is False:
-        x_heatmap_report = scorer.age_heat_map(args.symbol.upper(), records, run_epoch)
-
-    report = scorer.composite_score(args.symbol.upper(), records, run_epoch)
-    print(json.dumps(report, indent=2, sort_keys=True))
-    x_composite_score_report = report
+    if args.bool_build_index is True:
+        written = scorer.build_time_index(args.symbol or None, args.db_path)
+        print(f"pub_time index: {written} entries written from {scorer.lmdb_record_count} article records")
+        return 0
+
+    since_epoch = None
+    if args.window_hours is not None:
+        since_epoch = run_epoch - args.window_hours * SECONDS_PER_HOUR
+    elif args.bool_horizon is True:
+        since_epoch = decay_horizon(run_epoch, scorer.half_life_hours)
+
+    if args.bool_rank is True and args.bool_incremental is True:
+        if not args.symbol:
+            parser.error("--incremental needs the symbols to refresh")
+        if since_epoch is not None:
+            parser.error("--incremental keeps every article in its state; drop --window-hours / --horizon")
+        reports = scorer.refresh_symbols(args.symbol, args.db_path, run_epoch)
+        scorer.print_ranking(reports, run_epoch)
+        return 0
+
+    if args.bool_rank is True:
+        reports = scorer.rank_symbols(args.symbol or None, args.db_path, run_epoch, since_epoch=since_epoch)
+        scorer.print_ranking(reports, run_epoch)
+        return 0
+
+    if len(args.symbol) != 1:
+        parser.error("score exactly 1 symbol (or use --rank)")
+    args.symbol = args.symbol[0]
+
+    # ONE pass: the LMDB stream is single-use, and every record is
+    # normalized once for the legacy profile, heat map + both scores.
+    bundle = scorer.score_all(
+        args.symbol,
+        scorer.load_symbol_articles_from_lmdb(args.symbol, args.db_path, since_epoch=since_epoch),
+        run_epoch,
+        profile=not args.bool_no_profile,
+        heatmap=not args.bool_no_heatmap)
+
+    print(json.dumps(bundle["composite"], indent=2, sort_keys=True))
 
     if args.bool_polarity is True:
-        polarity_report = scorer.recency_weighted_polarity(
-            args.symbol.upper(), records, run_epoch)
-        print(json.dumps(polarity_report, indent=2, sort_keys=True))
-        x_polarity_report = polarity_report
+        print(json.dumps(bundle["polarity"], indent=2, sort_keys=True))
     return 0
 
 
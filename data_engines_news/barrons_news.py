@@ -1,5 +1,6 @@
 #! python
 
+import asyncio
 import os
 import json
 import logging
@@ -10,8 +11,9 @@ from typing import List
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -28,6 +30,7 @@ class barrons_news:
     json_file = None
     DF_data = []
     DB_insert_data = {}
+    page_concurrency = 1    # pages crawled at once (news_cycle_runner sets this per source)
     
     def __init__(self, inst_id):
         cmi_debug = __name__+"::"+self.__init__.__name__
@@ -92,25 +95,30 @@ class barrons_news:
 
         
         print ("General news from BARRONS - Metrics")
-        count = 0
-        for i in range(len(urls)):
-            async with AsyncWebCrawler() as crawler:
-                logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
-                results: List[CrawlResult] = await crawler.arun(
-                        urls[i], config=config)
+        page_sem = asyncio.Semaphore(max(1, int(self.page_concurrency)))
+
+        async def page_crawl(url):
+            async with page_sem:
+                async with c4_browser_pool.crawler() as crawler:
+                    logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
+                    return await crawler.arun(url, config=config)
 
-                logging.info( '%s - Data wrangeling' % cmi_debug )
-                for result in results:
-                    if result.success:
-                        data = json.loads(result.extracted_content)
-                        logging.info( f'%s - cycle over data list {i}..' % cmi_debug )
-                        for idx, item in enumerate(data):
-                            try:
-                                t = (count, item)
-                                self.DF_data.append(t)      # append to working list
-                                count += 1
-                            except IndexError:
-                                logging.info( '%s - Failed to unwind JSON Dict package' % cmi_debug )
+        pages = await asyncio.gather(*(page_crawl(u) for u in urls))     # all pages in flight at once (page_concurrency)
+        count = 0
+        for i in range(len(urls)):                  # wrangle in page order
+            results: List[CrawlResult] = pages[i]
+            logging.info( '%s - Data wrangeling' % cmi_debug )
+            for result in results:
+                if result.success:
+                    data = json.loads(result.extracted_content)
+                    logging.info( f'%s - cycle over data list {i}..' % cmi_debug )
+                    for idx, item in enumerate(data):
+                        try:
+                            t = (count, item)
+                            self.DF_data.append(t)      # append to working list
+                            count += 1
+                        except IndexError:
+                            logging.info( '%s - Failed to unwind JSON Dict package' % cmi_debug )
 
         self.DB_insert_data = {} 
         logging.info( '%s - Build final DB insertion dict...' % cmi_debug )
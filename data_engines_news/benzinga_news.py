@@ -9,8 +9,9 @@ from typing import List
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -81,7 +82,7 @@ class benzinga_news:
         # for now, I am looping async with AsyncWebCrawler() as crawler:
         
         count = 0
-        async with AsyncWebCrawler() as crawler:
+        async with c4_browser_pool.crawler() as crawler:
             logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
             result = await crawler.arun(
                     url, config=config)
@@ -8,8 +8,9 @@ import hashlib
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -72,7 +73,7 @@ class forbes_news:
         url = "https://www.forbes.com/news/"
         
         cmi_debug = __name__+"::"+"async_data_get"+".#"+str(self.inst_id)
-        async with AsyncWebCrawler() as crawler:
+        async with c4_browser_pool.crawler() as crawler:
             logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
             result = await crawler.arun(
                     url, config=config)
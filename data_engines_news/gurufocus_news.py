@@ -8,8 +8,9 @@ import hashlib
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -71,7 +72,7 @@ class gurufocus_news:
         url = "https://www.gurufocus.com/news?page=1&per_page=20&cat=timeless"
         
         count = 0
-        async with AsyncWebCrawler() as crawler:
+        async with c4_browser_pool.crawler() as crawler:
             logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
             result = await crawler.arun(
                     url, config=config)
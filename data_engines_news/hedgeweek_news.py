@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import os
 import json
 import logging
@@ -8,8 +9,9 @@ import hashlib
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -26,6 +28,7 @@ class hedgeweek_news:
     json_file = None
     DF_data = []
     DB_insert_data = {}
+    page_concurrency = 1    # pages crawled at once (news_cycle_runner sets this per source)
     url = None
     
     def __init__(self, inst_id):
@@ -107,14 +110,20 @@ class hedgeweek_news:
             return
                             
         #self.page_cycle = 0
-        for i in range (1,5):
-            cmi_debug = __name__+"::"+"async_data_get"+".#"+str(self.inst_id)
+        cmi_debug = __name__+"::"+"async_data_get"+".#"+str(self.inst_id)
+        page_sem = asyncio.Semaphore(max(1, int(self.page_concurrency)))
+
+        async def page_crawl(i):
             url = self.url+str(i)
-            async with AsyncWebCrawler() as crawler:
-                logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
-                result = await crawler.arun(
-                        url, config=config)
-                multi_page_wrangeler(self, i, result)
+            async with page_sem:
+                async with c4_browser_pool.crawler() as crawler:
+                    logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
+                    return i, await crawler.arun(
+                            url, config=config)
+
+        # all pages in flight at once (page_concurrency). Wrangled in page order
+        for i, result in await asyncio.gather(*(page_crawl(i) for i in range (1,5))):
+            multi_page_wrangeler(self, i, result)
             logging.info( f"{cmi_debug} - Multi pager cycler complete: [ {i} ] / {result.success}" )
 
     ##########################################################
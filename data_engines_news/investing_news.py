@@ -8,8 +8,9 @@ import hashlib
 from pathlib import Path
 from typing import List
   
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, BrowserConfig, CrawlResult
+from crawl4ai import CrawlerRunConfig, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
 
 logging.basicConfig(level=logging.INFO)
 
@@ -115,7 +116,7 @@ class investing_news:
 
         cmi_debug = __name__+"::"+"async_data_get"+".#"+str(self.inst_id)
         #async with AsyncWebCrawler() as crawler:
-        async with AsyncWebCrawler(config=BrowserConfig(headless=True)) as crawler:
+        async with c4_browser_pool.crawler() as crawler:        # pool browser is headless
 
             logging.info(f'%s - doing async webcrawl NOW..' % cmi_debug )
             result = await crawler.arun(
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import asyncio
+import hashlib
+import logging
+import time
+
+from data_engines_news.barrons_news import barrons_news
+from data_engines_news.benzinga_news import benzinga_news
+from data_engines_news.forbes_news import forbes_news
+from data_engines_news.fxstreet_news import fxstreet_news
+from data_engines_news.investing_news import investing_news
+from data_engines_news.hedgeweek_news import hedgeweek_news
+
+logging.basicConfig(level=logging.INFO)
+
+# news cycle sources : name -> (engine class, pages crawled at once)
+# multi page engines (barrons / fxstreet / hedgeweek) crawl their pages concurrently, up to the limit
+SOURCES = {
+    'barrons': (barrons_news, 3),
+    'benzinga': (benzinga_news, 1),
+    'forbes': (forbes_news, 1),
+    'fxstreet': (fxstreet_news, 3),
+    'investing': (investing_news, 1),
+    'hedgeweek': (hedgeweek_news, 2),
+    }
+
+# ###################### Main class
+class news_cycle_runner:
+    """
+    Unified async runner for the --news-cycle data_engines_news sources
+    - 1 event loop. ALL sources (and their pages) are scheduled at once, sharing the warm c4_browser_pool
+    - per source page concurrency limit (SOURCES / page_concurrency)
+    - per source timing. Cycle time ~= the slowest source, not the sum of them all
+    - combined DB_insert_data rows, deduped ACROSS sources by urlhash. Each row is tagged with its source
+    """
+    # global class attributes
+    inst_id = 0
+    sources = None          # { name: (engine class, page concurrency) }
+    engines = None          # { name: engine instance } after run()
+    timing = None           # { name: { secs, rows, state } }
+    DB_insert_data = {}     # combined + cross source deduped rows { n: row dict{} }
+    dupes = 0               # rows dropped as cross source duplicates
+    cycle_secs = 0.0        # wall clock time of the whole cycle
+
+    def __init__(self, inst_id, sources=None, page_concurrency=None):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s - Instantiate.#{inst_id}' % cmi_debug )
+        self.inst_id = inst_id
+        self.sources = dict(sources or SOURCES)
+        if page_concurrency:                    # 1 override for every source
+            self.sources = { n: (c, int(page_concurrency)) for n, (c, _) in self.sources.items() }
+        self.engines = {}
+        self.timing = {}
+        self.DB_insert_data = {}
+        self.dupes = 0
+
+    # ###################### method : 1
+    async def run(self):
+        """
+        WARN: This is an asyncio function. must be called by asyncio.run()
+        RETURNS: number of unique rows across all sources
+        """
+        cmi_debug = __name__+"::"+self.run.__name__+".#"+str(self.inst_id)
+        logging.info( f'%s - Schedule {len(self.sources)} news sources NOW...' % cmi_debug )
+        _t0 = time.perf_counter()
+        await asyncio.gather(*(self._run_source(n) for n in self.sources))
+        self.cycle_secs = time.perf_counter() - _t0
+        self._merge()
+        logging.info( f'%s - News cycle complete: {len(self.DB_insert_data)} rows / {self.dupes} dupes / {self.cycle_secs:.1f}s' % cmi_debug )
+        return len(self.DB_insert_data)
+
+    # ###################### method : 2
+    def report(self):
+        """Print per source rows + timing, and cycle time vs the serial sum"""
+        print ( " " )
+        print ( f"{'Source':<10} {'Pages':>5} {'Rows':>5} {'Secs':>7}  State" )
+        for _n in self.sources:
+            _t = self.timing.get(_n)
+            if _t is None:
+                continue
+            print ( f"{_n:<10} {self.sources[_n][1]:>5} {_t['rows']:>5} {_t['secs']:7.1f}  {_t['state']}" )
+        _serial = sum( t['secs'] for t in self.timing.values() )
+        print ( f"Unique rows: {len(self.DB_insert_data)} / cross source dupes: {self.dupes}" )
+        print ( f"Cycle time:  {self.cycle_secs:.1f}s (sum of sources: {_serial:.1f}s / slowest: {max([ t['secs'] for t in self.timing.values() ] or [0.0]):.1f}s)" )
+        return
+
+    # ###################### Helper Method
+    # Helper method -> run()
+
+    async def _run_source(self, name):
+        cmi_debug = __name__+"::"+self._run_source.__name__+".#"+str(self.inst_id)+"."+name
+        _cls, _cc = self.sources[name]
+        _eng = _cls(self.inst_id)
+        _eng.DF_data = []                       # fresh working list per run (the engines class level list is shared)
+        _eng.page_concurrency = _cc
+        self.engines[name] = _eng
+        _state = "ok"
+        _t0 = time.perf_counter()
+        try:
+            await _eng.craw4ai_str_schema_extr()
+        except Exception as e:
+            logging.error( f'{cmi_debug} - News source FAILED: {e}' )
+            _state = f"failed: {e}"[:40]
+        self.timing[name] = dict(secs=time.perf_counter() - _t0, rows=len(_eng.DB_insert_data or {}), state=_state)
+        return
+
+    def _merge(self):
+        """Combine every sources DB_insert_data in SOURCES order. First source to list a urlhash keeps it"""
+        self.DB_insert_data = {}
+        self.dupes = 0
+        _seen = set()
+        for _n in self.sources:
+            _eng = self.engines.get(_n)
+            if _eng is None or self.timing[_n]['state'] != "ok":
+                continue
+            for _row in (_eng.DB_insert_data or {}).values():
+                _h = _row.get('urlhash') or hashlib.sha256(str(_row.get('Ext_url', '')).encode()).hexdigest()
+                if _h in _seen:
+                    self.dupes += 1
+                    continue
+                _seen.add(_h)
+                self.DB_insert_data[len(self.DB_insert_data)] = dict(_row, urlhash=_h, source=_n)
+        return
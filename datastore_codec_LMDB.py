@@ -0,0 +1,218 @@
+#! python3
+
+"""
+LMDB article cache : record codec (v1 JSON / v2 msgpack)
+
+v1 (legacy)   : UTF-8 JSON. Long key names, base64 zstd_blob, 64 char hex urlhash
+v2 (current)  : 1 version byte + msgpack
+                - minified root + chunk sub-dict key names (no "key name tax")
+                - zstd_blob stored as RAW zstd bytes (no base64 33% overhead)
+                - urlhash stored as 32 raw bytes (bytes.fromhex)
+
+Readers ALWAYS get the same v1 shaped dict{} back (long key names, hex urlhash),
+except zstd_blob which is raw zstd bytes. Use article_text() to decompress it.
+
+Split records : encode_article() splits 1 article into 2 LMDB values
+- metrics value : everything EXCEPT the article text. Read on every cache hit (hot path)
+- text value    : raw zstd bytes, stored under the SAME key in the article_text sub-DB
+                  only read + decompressed when someone asks for the text (lazy)
+
+Text values : v3 header = 1 version byte + 4 byte zstd dictionary id (0 = no dictionary) + zstd frame
+- the dictionary is trained over the article corpus (dump_db.py --train-dict) and lives in the zstd_dict sub-DB
+- raw zstd frames (no header) are still readable
+
+pub_time index : 1 entry per article in the pub_time sub-DB. KEY=SYMBOL|published_epoch|urlhash, value=article KV key
+- published_epoch = whole seconds, zero padded. Byte order == time order, so a cursor reads 1 symbols time window
+- COMPLETE markers (empty values) : SYMBOL| = every article of SYMBOL is indexed / PTIME_ALL = every article in the DB
+"""
+
+import base64
+import binascii
+import json
+import logging
+import struct
+
+import msgpack
+import zstandard as zstd
+
+REC_V1 = 1
+REC_V2 = 2
+REC_HEADER_V2 = b"\x02"     # v2 version byte. v1 values always start with b"{" (JSON dict)
+REC_VERSION = REC_V2        # version written by encode_record()
+TEXT_HEADER_V3 = b"\x03"    # text value version byte. Followed by a 4 byte big endian zstd dictionary id
+PTIME_WIDTH = 10            # digits of the published_epoch in a pub_time index key (epoch seconds up to year 2286)
+PTIME_ALL = b"|"            # pub_time COMPLETE marker for the whole DB (sorts after every SYMBOL| range)
+
+# long key -> minified key. Unknown keys pass through unchanged
+ROOT_KEYS = {
+    'article': 'a',
+    'urlhash': 'u',
+    'chunk_count': 'cc',
+    'scentence': 'sc',
+    'paragraph': 'pg',
+    'random': 'rn',
+    'zstd_blob': 'z',
+    'skim_age': 'ka',
+    'iso_age': 'ia',
+    'positive_count': 'p',
+    'neutral_count': 'n',
+    'negative_count': 'g',
+    'chars_count': 'ch',
+    'total_words': 'w',
+    'total_tokens': 't',
+    'status': 'st',
+    'text_hash': 'th',
+    }
+
+CHUNK_KEYS = {
+    'symbol': 'y',
+    'chunk': 'c',
+    'n-grams': 'ng',
+    'tokenz': 'tk',
+    'alphas': 'al',
+    'sent_type': 'l',
+    'sent_score': 's',
+    'trct_state': 'tr',
+    }
+
+_ROOT_LONG = { v: k for k, v in ROOT_KEYS.items() }
+_CHUNK_LONG = { v: k for k, v in CHUNK_KEYS.items() }
+
+
+def record_version(value):
+    """Version of a raw LMDB value: 1 = JSON, 2 = msgpack, 0 = unknown"""
+    if not value:
+        return 0
+    _b = bytes(value[:1])
+    if _b == REC_HEADER_V2:
+        return REC_V2
+    if _b == b"{":
+        return REC_V1
+    return 0
+
+
+def encode_record(record, version=REC_VERSION):
+    """
+    Serialize 1 article dict{} for LMDB
+    - accepts the v1 shape (base64 str zstd_blob) or raw zstd bytes
+    """
+    if version == REC_V1:
+        _rec = dict(record)
+        if isinstance(_rec.get('zstd_blob'), (bytes, bytearray)):
+            _rec['zstd_blob'] = base64.b64encode(_rec['zstd_blob']).decode('utf-8')
+        return json.dumps(_rec, default=str).encode('utf-8')
+
+    _packed = dict()
+    for _k, _v in record.items():
+        if isinstance(_v, dict):                        # chunk sub-dict "000", "001"...
+            _packed[_k] = { CHUNK_KEYS.get(ck, ck): cv for ck, cv in _v.items() }
+            continue
+        if _k == 'urlhash' and isinstance(_v, str) and len(_v) == 64:
+            try:
+                _v = bytes.fromhex(_v)
+            except ValueError:
+                pass                                    # not a sha256 hex digest. Keep as str
+        elif _k == 'zstd_blob' and isinstance(_v, str):
+            _v = base64.b64decode(_v)
+        _packed[ROOT_KEYS.get(_k, _k)] = _v
+    return REC_HEADER_V2 + msgpack.packb(_packed, use_bin_type=True, default=str)
+
+
+def encode_article(record, version=REC_VERSION):
+    """
+    Split 1 article dict{} into its 2 LMDB values -> (metrics_value, text_value)
+    - text_value = raw zstd bytes of the article text, or None if the record has no text
+    """
+    _metrics = dict(record)
+    _blob = _metrics.pop('zstd_blob', None)
+    if isinstance(_blob, str):
+        _blob = base64.b64decode(_blob)
+    return encode_record(_metrics, version), (bytes(_blob) if _blob else None)
+
+
+def decode_record(value):
+    """
+    Deserialize 1 LMDB value (v1 or v2) -> v1 shaped dict{}
+    RAISES: ValueError on a corrupt / unknown value
+    """
+    match record_version(value):
+        case 1:
+            _rec = json.loads(bytes(value).decode('utf-8'))
+            if not isinstance(_rec, dict):
+                raise ValueError("v1 record is not a JSON dict")
+            return _rec
+        case 2:
+            try:
+                _packed = msgpack.unpackb(bytes(value[1:]), raw=False, strict_map_key=False)
+            except Exception as e:
+                raise ValueError(f"v2 record msgpack decode: {e}") from e
+            if not isinstance(_packed, dict):
+                raise ValueError("v2 record is not a msgpack map")
+            _rec = dict()
+            for _k, _v in _packed.items():
+                if isinstance(_v, dict):
+                    _rec[_k] = { _CHUNK_LONG.get(ck, ck): cv for ck, cv in _v.items() }
+                    continue
+                _k = _ROOT_LONG.get(_k, _k)
+                if _k == 'urlhash' and isinstance(_v, bytes):
+                    _v = _v.hex()
+                _rec[_k] = _v
+            return _rec
+        case _:
+            raise ValueError("unknown LMDB record version")
+
+
+def pack_text(zframe, dict_id=0):
+    """Wrap 1 zstd frame in a v3 text header. dict_id = id of the zstd dictionary it was compressed with (0 = none)"""
+    return TEXT_HEADER_V3 + struct.pack(">I", dict_id) + bytes(zframe)
+
+
+def text_dict_id(blob):
+    """zstd dictionary id of 1 text value. 0 = no dictionary (or a headerless raw zstd frame)"""
+    if blob and bytes(blob[:1]) == TEXT_HEADER_V3:
+        return struct.unpack(">I", bytes(blob[1:5]))[0]
+    return 0
+
+
+def decompress_text(blob, dict_lookup=None):
+    """
+    Decompress 1 article text value (v3 header or raw zstd frame). None in -> None out
+    - dict_lookup(dict_id) must return the zstd.ZstdCompressionDict for dictionary compressed text
+    RAISES: ValueError if the dictionary cant be resolved
+    """
+    if not blob:
+        return None
+    _blob = bytes(blob)
+    _dict_id = 0
+    if _blob[:1] == TEXT_HEADER_V3:
+        _dict_id = struct.unpack(">I", _blob[1:5])[0]
+        _blob = _blob[5:]
+    if _dict_id == 0:
+        return zstd.ZstdDecompressor().decompress(_blob).decode('utf-8')
+    _zdict = dict_lookup(_dict_id) if dict_lookup is not None else None
+    if _zdict is None:
+        raise ValueError(f"zstd dictionary {_dict_id} not found")
+    return zstd.ZstdDecompressor(dict_data=_zdict).decompress(_blob).decode('utf-8')
+
+
+def article_text(record, dict_lookup=None):
+    """Decompress the article text held INSIDE a decoded record (v1 base64 or v2 raw bytes). None if there is no text"""
+    _blob = record.get('zstd_blob')
+    if not _blob:
+        return None
+    if isinstance(_blob, str):
+        try:
+            _blob = base64.b64decode(_blob)
+        except binascii.Error as e:
+            logging.info( f'{__name__}::article_text - Bad base64 zstd_blob: {e}' )
+            return None
+    return decompress_text(_blob, dict_lookup)
+
+
+def ptime_key(symbol, published_epoch, urlhash=""):
+    """
+    pub_time index key -> b"SYMBOL|published_epoch|urlhash"
+    - urlhash "" = the cursor bound for a time range scan (sorts before every article at that second)
+    """
+    _epoch = min(max(0, int(published_epoch)), 10**PTIME_WIDTH - 1)
+    return f"{symbol.upper()}|{_epoch:0{PTIME_WIDTH}d}|{urlhash}".encode('utf-8')
@@ -5,12 +5,20 @@ from datetime import datetime
 import json
 import lmdb
 import logging
+import math
 import random
 from rich import print
+import os
 import string
 import sys
+import struct
+import threading
+import time
 from typing import Any, Dict, List, Tuple, Optional
 
+from datastore_codec_LMDB import article_text, decode_record, decompress_text, encode_record, pack_text, ptime_key, PTIME_ALL
+import zstandard as zstd
+
 # ML / NLP section #############################################################
 class lmdb_io_eng:
     """
@@ -22,6 +30,13 @@ class lmdb_io_eng:
 
     # global attribute
     args = []           # class dict to hold global args being passed in from main() methods
+    ccache_db = b"chunk_sent"      # named sub-DB : content addressed chunk sentiment cache. KEY=sha256(blocklet text + model id)
+    text_db = b"article_text"      # named sub-DB : raw zstd article text. SAME key as the article metrics record (lazy read)
+    dict_db = b"zstd_dict"         # named sub-DB : trained zstd dictionaries. KEY=4 byte dict id, b"active" = id used for new text
+    mark_db = b"skim_mark"         # named sub-DB : incremental depth 0 skim WATERMARK. KEY=SYMBOL (newest cached urlhashes)
+    thash_db = b"text_hash"        # named sub-DB : article TEXT hash side index. KEY=sha256(cleaned text + chunker + model), value=article KV key
+    state_db = b"score_state"      # named sub-DB : CompositeScorer incremental state. KEY=SYMBOL (decayed sums @ anchor epoch + folded urlhashes)
+    ptime_db = b"pub_time"         # named sub-DB : per symbol published_epoch index. KEY=SYMBOL|published_epoch|urlhash, value=article KV key
     cr_package = None   # full reslts dict{} of dict_processor ruin
     cursor = None       # current LMDB Transaction Cursor - not sure if this is safe to store as global attribute
     cycle = 0           # class thread loop counter
@@ -29,11 +44,21 @@ class lmdb_io_eng:
     db_name = "DB_name_not_set"    # LMDB Database instance name
     db_open_state = {}  #
     lmdb_env = {}       # LMDB global instance, opened @ main::newsai_sent
+    max_dbs = 8         # max num of named sub-DBs inside the LMDB env (main article DB is not counted)
+    max_readers = 126   # LMDB reader lock table slots (1 per concurrent read txn / thread). sized from args['lmdb_readers']
+    map_size = 1024*1024*1024   # Maximum size DB = 1GB
+    _envs = {}          # PERSISTENT process wide LMDB envs. 1 per DB path { abs_path: lmdb.Environment }
+    _env_lock = threading.Lock()   # guards _envs (open once per process)
+    _dbis = {}          # named sub-DB handles, opened once per env { (abs_path, name): handle }
+    _zdicts = {}        # zstd dictionaries, loaded once per env { (abs_path, dict_id): ZstdCompressionDict }
+    _zcomp = {}         # zstd compressor for NEW article text { abs_path: (dict_id, ZstdCompressor) }
+    sub_dbs = [ccache_db, text_db, dict_db, mark_db, thash_db, state_db, ptime_db]   # ALL named sub-DBs. Handles opened once in open_env()
     rehy_count = 0      # global counter tracking how many articles KV Cache Engine sucessfully rehydrated
     RO_env = {}         # LMDB environment instance for RO mode
     RW_env = {}         # LMDB environment instance for RW mode
     sent_ai = None      # sentiment_ai instance, set by main() before calling kv_cache_engine()
     yti = 0
+    probe_miss = set()  # KV keys the bulk probe already knows are MISSES (kv_cache_engine skips the lookup)
     _n = 0             # negative sentiment count
     _p = 0             # positive sentiment count
     _z = 0             # neutral sentiment count
@@ -49,6 +74,9 @@ class lmdb_io_eng:
         self._p = 0
         self._z = 0
         self.rehy_count = int(0)
+        self.max_readers = int(self.args.get('lmdb_readers') or lmdb_io_eng.max_readers) if isinstance(self.args, dict) else lmdb_io_eng.max_readers
+        self.env = None     # persistent env handle (see open_env)
+        self.probe_miss = set()
         return
 
 ################# 1
@@ -57,7 +85,7 @@ class lmdb_io_eng:
         logging.info( f'%s    - Caller.#{_yti}' % cmi_debug )
         db_inst = self.db_path+self.db_name
         try:
-            self.RO_env = lmdb.open(db_inst, readonly=True)     # map_size: Maximum size DB = 1GB
+            self.RO_env = lmdb.open(db_inst, readonly=True, max_dbs=self.max_dbs)     # map_size: Maximum size DB = 1GB
             logging.info( f'%s    - Successfully opened KVstore - READ-ONLY mode' % cmi_debug )
             logging.info( f'%s    - LMDB {self.RO_env} remains globally open!' % cmi_debug )
             self.db_open_state[self.db_name] = self.RO_env      # {LMBD_0001: <class env> }
@@ -77,7 +105,7 @@ class lmdb_io_eng:
         logging.info( f'%s    - open_lmdb_RW.#{self.yti} Instance: {self.db_name}' % cmi_debug )
         db_inst = self.db_path+self.db_name
         try:
-            self.RW_env = lmdb.open(db_inst, map_size=1024*1024*1024, readonly=False)     # map_size: Maximum size DB = 1GB
+            self.RW_env = lmdb.open(db_inst, map_size=1024*1024*1024, readonly=False, max_dbs=self.max_dbs)     # map_size: Maximum size DB = 1GB
             logging.info( f'%s    - Successfully openend KVstore - READ-WRITE mode.#{self.yti} {self.db_name}' % cmi_debug )
             logging.info( f'%s    - Warning instance remains globally open' % cmi_debug )
             self.db_open_state[self.db_name] = self.RW_env
@@ -106,7 +134,7 @@ class lmdb_io_eng:
                 count = 0
                 for key, value in cursor:
                     key_str = key.decode('utf-8')
-                    value_str = value.decode('utf-8')
+                    value_str = value.decode('utf-8', errors='replace')    # named sub-DB entries are binary
                     print(f"{count:03} / KEY: {key_str} -> VALUE: {value_str[:50]}{'...' if len(value_str) > 50 else ''}")
                     count += 1            
             return 1
@@ -125,12 +153,16 @@ class lmdb_io_eng:
         logging.info( f'%s   - Caller #{_yti} {self.db_name} assumed RO Inst: {self.RO_env}' % cmi_debug )
         db_inst = self.db_path+self.db_name
         try:
-            self.RW_env = lmdb.open(db_inst, map_size=1024*1024*1024, max_dbs=0, readonly=False)  # max_dbs=0 for default DB only
+            self.RW_env = lmdb.open(db_inst, map_size=1024*1024*1024, max_dbs=self.max_dbs, readonly=False)  # max_dbs for the named sub-DBs
             # self.RW_env = lmdb.open(db_inst, map_size=1024*1024*1024, readonly=False)     # map_size: Maximum size DB = 1GB 
             logging.info( f'%s   - Caller #{_yti} {self.db_name} Opened in RW mode: {self.RW_env}' % cmi_debug )
             self.db_open_state[self.db_name] = self.RW_env
             _db0 = self.RW_env.open_db(key=None)            # default DB addressed by key=None, returns handle of default DB
             with self.RW_env.begin(write=True) as txn:
+                for _sub_name in self.sub_dbs:              # named sub-DBs live inside db0 as keys. Drop them 1st
+                    if txn.get(_sub_name) is not None:
+                        txn.drop(self.RW_env.open_db(_sub_name, txn=txn), delete=True)
+                        logging.info( f'%s - DROPPED named sub-DB {_sub_name} - RW mode.#{_yti} {self.db_name}' % cmi_debug )
                 txn.drop(_db0, delete=False)            # delete all keys in db0, do not delete db0 virtual named DB)
                 logging.info( f'%s - DROPPED default LMDB {type(_db0)} - RW mode.#{_yti} {self.db_name}' % cmi_debug )
             self.RW_env.close()
@@ -200,14 +232,11 @@ class lmdb_io_eng:
         
         logging.info( f'%s  - Prepare LMDB Read txn...' % cmi_debug )
 
-        if self.db_open_state.get(self.db_name) is not None:    # is LMDB allready Open ?
-            #print (f"debug-203: DB open state: {type(self.db_open_state.get(self.db_name))} / RO: {self.RO_env} / RW: {self.RW_env}")
-            # force close any open instance before we open RO
-            self.close_lmdb("GLOBAL")      # force close any open instance before we open RO for Deep Cache reads
-            #print (f"debug-207: DB open state: {type(self.db_open_state.get(self.db_name))} / RO: {self.RO_env} / RW: {self.RW_env}")
-        
-        self.RO_env = self.open_lmdb_RO("GLOBAL")
-        #print (f"debug-210: DB open state: {type(self.db_open_state.get(self.db_name))} / RO: {self.RO_env} / RW: {self.RW_env}")
+        _env = self.open_env("GLOBAL")     # persistent env. Opened once per process, no open/close churn per article
+        if _env is None:
+            logging.info( f"%s - Error.#4 KV Cache engine / LMDB env cant open" % cmi_debug )
+            print (f"=========== End.#4 KV Cache MISS / LMDB env open failure ! Do Net read... {item_idx} ===========" )
+            return 4, 0, 0, None, None   # LMDB I/O FAILURE : Failed to open DB
 
         ################# LMDB Deep Cache KV store Engine loop #################
         # KVstore REHYDRATON Engine
@@ -217,23 +246,24 @@ class lmdb_io_eng:
         _url_hash = data_row['urlhash']             # get current article URL hash from master candidate list
         _key = "0001"+"."+symbol+"."+_url_hash      # construct key for an artile - we test for this KV key
         bs4_kvs_key = _key.encode('utf-8')          # byte encode key
+        if bs4_kvs_key in self.probe_miss:          # bulk probe already resolved this key as a MISS. Dont look again
+            self.probe_miss.discard(bs4_kvs_key)    # 1 shot. We are about to write it
+            logging.info( f'%s - KV Cache engine MISS : Known from bulk probe !' % cmi_debug )
+            return 3, 0, 0, None, None
         logging.info( f'%s  - Check Deep Cache KVstore for key... \n\t [ {_key} ]' % cmi_debug )
         #print (f"debug-221: DB open state: {type(self.db_open_state.get(self.db_name))} / RO: {self.RO_env} / RW: {self.RW_env}")
-        with self.RO_env.begin() as txn:            # WARN: "with" context mgr auto close() LMDB trans mode, even on errors!
+        with self.read_txn() as txn:                # cheap read txn on the persistent env. "with" context mgr auto ends the txn, even on errors!
             _key_found = txn.get(bs4_kvs_key)       # CACHE HIT? - lookup key in LMDB KVstore
             if _key_found is not None:
                 logging.info( f'%s - Deep Cache KV entry found: validating...' % cmi_debug )
                 _final_results = dict()                 # ensure _final_results = empty
                 try:
-                    _v_str = _key_found.decode('utf-8') # lookup KEY & Deserialiize into string
-                    # TODO: read_data = msgpack.unpackb(_key_found, raw=False)    # NEW msgpack optomization
-                    #
-                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    _final_results = decode_record(_key_found)  # v1 JSON or v2 msgpack -> v1 shaped dict{}
+                except ValueError as e:
                     logging.info( f'%s - Error.#1 Deserializing data: {e}"...' % cmi_debug )
                     print (f"=========== End.#1 KV Cache Hit ! / Data Corrupt (deserializing) - Do Net read... {item_idx} ===========" )
                     return 1, 0, 0, None, None   #  LMDB I/O FAILURE : cant deserialize data
                 else:
-                    _final_results = json.loads(_v_str)        # load + parse JSON payload
                     try:
                         kv_url_hash = _final_results['urlhash']
                     except KeyError as _f:
@@ -305,11 +335,395 @@ class lmdb_io_eng:
                 logging.info( f'%s - KV Cache engine MISS : Key not found !' % cmi_debug )
                 #print (f"##-debug-306 KV Cache.#3:   [ Cache MISS.#3 / No LMDB entry ! Forcing article read via net... ] {item_idx}" )
                 return 3, 0, 0, None, None
-                # WARN:  "with" context mgr -> auto forces LMDB close()
+                # WARN:  "with" context mgr -> auto ends the read txn (env stays open)
+
+    ################# 7
+    def ccache_get(self, _keys):
+        """
+        Content addressed CHUNK sentiment cache : bulk lookup
+        - 1 read txn for all keys of 1 article (on the persistent env)
+        - _keys = list[] of 32 byte sha256 keys (see ml_sentiment.ccache_key)
+        - returns a dict{} of HITS only -> { key: (label, score) }
+        """
+        cmi_debug = __name__+"::"+self.ccache_get.__name__+".#"+str(self.yti)
+        _hits = dict()
+        _ccdb = self.sub_db(self.ccache_db)
+        if _ccdb is None:                               # no LMDB env = all MISS
+            return _hits
+
+        with self.read_txn(db=_ccdb) as txn:
+            for _k in _keys:
+                _v = txn.get(_k)
+                if _v is not None:
+                    try:
+                        _d = json.loads(_v)
+                        _hits[_k] = (_d['l'], _d['s'])       # older entries also hold a 't' token count. Not used
+                    except (ValueError, KeyError) as e:
+                        logging.info( f'%s - Corrupt chunk cache entry / treat as MISS: {e}' % cmi_debug )
+        logging.info( f'%s - Chunk cache lookup: {len(_keys)} keys / {len(_hits)} hits' % cmi_debug )
+        return _hits
+
+    ################# 8
+    def ccache_put(self, _txn, _entries):
+        """
+        Content addressed CHUNK sentiment cache : bulk write
+        - writes inside the callers open RW txn (same txn as the article KV write)
+        - _entries = dict{} of { key: (label, score) }
+        """
+        cmi_debug = __name__+"::"+self.ccache_put.__name__+".#"+str(self.yti)
+        if not _entries:
+            return 0
+        _ccdb = self.sub_db(self.ccache_db)
+        for _k, (_label, _score) in _entries.items():
+            _txn.put(_k, json.dumps({'l': _label, 's': _score}, separators=(',', ':')).encode('utf-8'), db=_ccdb)
+        logging.info( f'%s - Chunk cache write: {len(_entries)} entries' % cmi_debug )
+        return len(_entries)
+
+    ################# 9
+    def open_env(self, _yti="GLOBAL"):
+        """
+        PERSISTENT LMDB environment : opened ONCE per process, per DB path
+        - RW capable env. Hands out cheap read txns + short write txns (see read_txn / write_txn)
+        - reader lock table sized to our concurrency (max_readers)
+        - replaces the open RO -> close -> open RW -> close churn per article (syscalls + mmap setup each time)
+        - LMDB forbids opening the same env twice in 1 process. So every lmdb_io_eng instance shares it
+        RETURNS: lmdb.Environment or None on failure
+        """
+        cmi_debug = __name__+"::"+self.open_env.__name__+".#"+str(_yti)
+        if self.env is not None:
+            return self.env
+
+        _path = os.path.abspath(self.db_path+self.db_name)
+        with self._env_lock:
+            _env = self._envs.get(_path)
+            if _env is None:
+                try:
+                    _env = lmdb.open(_path, map_size=self.map_size, max_dbs=self.max_dbs, max_readers=self.max_readers, readonly=False)
+                    for _name in self.sub_dbs:              # open sub-DB handles NOW. open_db() inside an active RW txn deadlocks
+                        self._dbis[(_path, _name)] = _env.open_db(_name)
+                    self._envs[_path] = _env
+                    logging.info( f'%s - Opened PERSISTENT LMDB env: {_path} / readers: {self.max_readers}' % cmi_debug )
+                except lmdb.Error as e:
+                    print(f"LMDB {_path} - Persistent env open Error: {e}")
+                    return None
+        self.env = _env
+        self.db_open_state[self.db_name] = _env
+        return _env
+
+    ################# 10
+    def read_txn(self, db=None):
+        """cheap read-only txn on the persistent env. Use as a context manager"""
+        return self.open_env().begin(db=db)
+
+    ################# 11
+    def write_txn(self, db=None):
+        """short write txn on the persistent env. Use as a context manager (commit on exit, abort on exception)"""
+        return self.open_env().begin(write=True, db=db)
+
+    ################# 12
+    def sub_db(self, _name):
+        """named sub-DB handle on the persistent env. Opened (+ created) once per process by open_env(), then re-used"""
+        if self.open_env() is None:
+            return None
+        return self._dbis.get((os.path.abspath(self.db_path+self.db_name), _name))
+
+    ################# 13
+    def close_env(self, _yti="GLOBAL"):
+        """Close the PERSISTENT env. Call once at the end of the run"""
+        cmi_debug = __name__+"::"+self.close_env.__name__+".#"+str(_yti)
+        _path = os.path.abspath(self.db_path+self.db_name)
+        with self._env_lock:
+            _env = self._envs.pop(_path, None)
+            for _dkey in [ k for k in self._dbis if k[0] == _path ]:
+                self._dbis.pop(_dkey)
+            for _dkey in [ k for k in self._zdicts if k[0] == _path ]:
+                self._zdicts.pop(_dkey)
+            self._zcomp.pop(_path, None)
+        if _env is not None:
+            _env.close()
+            logging.info( f'%s - Closed PERSISTENT LMDB env: {_path}' % cmi_debug )
+        self.env = None
+        self.db_open_state[self.db_name] = None
+        return 1
+
+    ################# 14
+    def probe_ml_ingest(self, _ml_ingest):
+        """
+        BULK cache probe : classify EVERY ml_ingest candidate as hit / miss / corrupt
+        - 1 read txn for all the 0001.SYMBOL.urlhash keys (no network, no sentiment work)
+        - only type 0 (real news) rows are probed. Everything else never reaches depth 3
+        - remembers the MISS keys, so kv_cache_engine() doesnt probe them again
+        RETURNS: 3 sets of ml_ingest item_idx -> (hits, misses, corrupt)
+        """
+        cmi_debug = __name__+"::"+self.probe_ml_ingest.__name__+".#"+str(self.yti)
+        _hits, _misses, _corrupt = set(), set(), set()
+        if self.open_env("GLOBAL") is None:
+            logging.info( f'%s - LMDB env cant open / treat ALL candidates as MISS' % cmi_debug )
+            return _hits, { k for k, v in _ml_ingest.items() if v.get('type') == 0 }, _corrupt
+
+        with self.read_txn() as txn:
+            for _idx, _row in _ml_ingest.items():
+                if _row.get('type') != 0 or 'urlhash' not in _row:
+                    continue
+                _key = ("0001"+"."+_row['symbol'].upper()+"."+_row['urlhash']).encode('utf-8')
+                _v = txn.get(_key)
+                if _v is None:
+                    _misses.add(_idx)
+                    self.probe_miss.add(_key)
+                    continue
+                try:
+                    decode_record(_v)['urlhash']
+                except (ValueError, KeyError):
+                    _corrupt.add(_idx)      # kv_cache_engine() will re-validate + force a Net read
+                else:
+                    _hits.add(_idx)
+        logging.info( f'%s - Bulk probe: {len(_hits)} hits / {len(_misses)} misses / {len(_corrupt)} corrupt' % cmi_debug )
+        return _hits, _misses, _corrupt
+
+    ################# 15
+    def put_article(self, _txn, _key, _metrics_value, _text_value=None, _epoch=None):
+        """
+        Write 1 SPLIT article record inside the callers open RW txn
+        - metrics value -> main DB (small, read on every cache hit)
+        - text value    -> article_text sub-DB, same key (only read on demand)
+        - _epoch        -> pub_time index entry, same txn (None = article has no publish time / not indexed)
+        - values come pre-serialized from datastore_codec_LMDB.encode_article() (serialize outside the txn)
+        """
+        _txn.put(_key, _metrics_value)
+        if _text_value is not None:
+            _txn.put(_key, _text_value, db=self.sub_db(self.text_db))
+        self.ptime_put(_txn, _key, _epoch)
+        return 1
+
+    ################# 16
+    def get_article_text(self, _key, _record=None):
+        """
+        LAZY article text fetch + decompress. Only callers that need the text pay for it
+        - looks in the article_text sub-DB first
+        - falls back to a zstd_blob still held inside an old unsplit record (_record)
+        RETURNS: article text str or None
+        """
+        cmi_debug = __name__+"::"+self.get_article_text.__name__+".#"+str(self.yti)
+        if isinstance(_key, str):
+            _key = _key.encode('utf-8')
+        _tdb = self.sub_db(self.text_db)
+        if _tdb is not None:
+            with self.read_txn() as txn:
+                _blob = txn.get(_key, db=_tdb)
+            if _blob is not None:
+                return decompress_text(_blob, self.zstd_dict)
+        if _record is not None:
+            return article_text(_record, self.zstd_dict)       # legacy record, text still inline
+        logging.info( f'%s - No article text for: {_key}' % cmi_debug )
+        return None
+
+    ################# 17
+    def zstd_dict(self, _dict_id=None):
+        """
+        zstd dictionary lookup (cached per env). _dict_id=None -> the ACTIVE dictionary
+        Also the dict_lookup callback for datastore_codec_LMDB.decompress_text()
+        RETURNS: zstd.ZstdCompressionDict or None
+        """
+        _ddb = self.sub_db(self.dict_db)
+        if _ddb is None:
+            return None
+        _path = os.path.abspath(self.db_path+self.db_name)
+        if _dict_id is None:
+            with self.read_txn() as txn:
+                _active = txn.get(b"active", db=_ddb)
+            if _active is None:
+                return None
+            _dict_id = struct.unpack(">I", _active)[0]
+        _zdict = self._zdicts.get((_path, _dict_id))
+        if _zdict is None:
+            with self.read_txn() as txn:
+                _raw = txn.get(struct.pack(">I", _dict_id), db=_ddb)
+            if _raw is None:
+                return None
+            _zdict = zstd.ZstdCompressionDict(_raw)
+            self._zdicts[(_path, _dict_id)] = _zdict
+        return _zdict
+
+    ################# 18
+    def put_zstd_dict(self, _zdict, _activate=True):
+        """Store 1 trained zstd dictionary under its dict id. _activate = use it for all NEW article text"""
+        cmi_debug = __name__+"::"+self.put_zstd_dict.__name__+".#"+str(self.yti)
+        _dict_id = _zdict.dict_id()
+        with self.write_txn() as txn:
+            _ddb = self.sub_db(self.dict_db)
+            txn.put(struct.pack(">I", _dict_id), _zdict.as_bytes(), db=_ddb)
+            if _activate is True:
+                txn.put(b"active", struct.pack(">I", _dict_id), db=_ddb)
+        self._zcomp.pop(os.path.abspath(self.db_path+self.db_name), None)     # next compress picks up the new active dict
+        logging.info( f'%s - Stored zstd dictionary: {_dict_id} / {len(_zdict)} bytes / active: {_activate}' % cmi_debug )
+        return _dict_id
+
+    ################# 19
+    def compress_text(self, _text_bytes):
+        """
+        Compress NEW article text w/ the ACTIVE zstd dictionary (if one was trained)
+        - compressor is built once per env + active dict (dict digest is expensive)
+        RETURNS: v3 text value -> header (dict id) + zstd frame
+        """
+        _path = os.path.abspath(self.db_path+self.db_name)
+        _zc = self._zcomp.get(_path)
+        if _zc is None:
+            _zdict = self.zstd_dict() if self.open_env("GLOBAL") is not None else None
+            if _zdict is not None:
+                _zc = (_zdict.dict_id(), zstd.ZstdCompressor(level=3, dict_data=_zdict))
+            else:
+                _zc = (0, zstd.ZstdCompressor(level=3))
+            self._zcomp[_path] = _zc
+        return pack_text(_zc[1].compress(_text_bytes), _zc[0])
+
+    ################# 20
+    def clone_article(self, _txn, _urlhash, _src_symbol, _dst_symbol, _epoch_of=None):
+        """
+        Cross symbol DEDUPE : copy 1 article record already built for _src_symbol to the _dst_symbol key
+        - the same urlhash is often listed under several tickers. No network / LLM work to re-build it
+        - writes inside the callers open RW txn. Text value (article_text sub-DB) is copied as raw bytes
+        - chunk 'symbol' tags are re-written to _dst_symbol
+        - _epoch_of(record) -> published_epoch. Given = the clone is also written to the pub_time index
+        RETURNS: 1 = cloned, 0 = no source record (or corrupt) / dst already exists
+        """
+        cmi_debug = __name__+"::"+self.clone_article.__name__+".#"+str(self.yti)
+        _src = ("0001"+"."+_src_symbol.upper()+"."+_urlhash).encode('utf-8')
+        _dst = ("0001"+"."+_dst_symbol.upper()+"."+_urlhash).encode('utf-8')
+        if _txn.get(_dst) is not None:
+            return 0
+        _v = _txn.get(_src)
+        if _v is None:
+            return 0
+        try:
+            _record = decode_record(_v)
+        except ValueError as e:
+            logging.info( f'%s - Source record corrupt / not cloning: {_src} {e}' % cmi_debug )
+            return 0
+        for _cv in _record.values():
+            if isinstance(_cv, dict) and 'symbol' in _cv:
+                _cv['symbol'] = _dst_symbol.upper()
+        _txn.put(_dst, encode_record(_record))
+        _tdb = self.sub_db(self.text_db)
+        _text = _txn.get(_src, db=_tdb)
+        if _text is not None:
+            _txn.put(_dst, _text, db=_tdb)
+        if _epoch_of is not None:
+            self.ptime_put(_txn, _dst, _epoch_of(_record))
+        self.probe_miss.discard(_dst)       # its a HIT now
+        logging.info( f'%s - Cloned article: {_src} -> {_dst}' % cmi_debug )
+        return 1
+
+    ################# 21
+    def get_skim_mark(self, _symbol):
+        """
+        Incremental depth 0 skim WATERMARK for 1 symbol
+        RETURNS: dict{} -> h: [urlhashes] / u: [urls] newest first (same order) / t: epoch written. None = no mark yet
+        """
+        cmi_debug = __name__+"::"+self.get_skim_mark.__name__+".#"+str(self.yti)
+        _mdb = self.sub_db(self.mark_db)
+        if _mdb is None:
+            return None
+        with self.read_txn() as txn:
+            _v = txn.get(_symbol.upper().encode('utf-8'), db=_mdb)
+        if _v is None:
+            return None
+        try:
+            _mark = json.loads(bytes(_v).decode('utf-8'))
+        except ValueError as e:
+            logging.info( f'%s - Skim mark corrupt for {_symbol}: {e}' % cmi_debug )
+            return None
+        logging.info( f'%s - Skim mark for {_symbol}: {len(_mark.get("h", []))} urlhashes' % cmi_debug )
+        return _mark
+
+    ################# 22
+    def put_skim_mark(self, _symbol, _hashes, _urls):
+        """Write the incremental depth 0 skim WATERMARK for 1 symbol (urlhashes + urls, newest first)"""
+        cmi_debug = __name__+"::"+self.put_skim_mark.__name__+".#"+str(self.yti)
+        _mdb = self.sub_db(self.mark_db)
+        if _mdb is None:
+            return 0
+        _v = json.dumps({'h': list(_hashes), 'u': list(_urls), 't': time.time()}, separators=(',', ':')).encode('utf-8')
+        with self.write_txn() as txn:
+            txn.put(_symbol.upper().encode('utf-8'), _v, db=_mdb)
+        logging.info( f'%s - Skim mark for {_symbol}: {len(_hashes)} urlhashes' % cmi_debug )
+        return len(_hashes)
+
+    ################# 23
+    def thash_get(self, _thash):
+        """
+        Article TEXT hash side index : lookup
+        - finds a previously SCORED article with the exact same cleaned text (syndicated copy / re-written record)
+        - the record must still carry the same text_hash. A record re-written with new text is a MISS (stale index entry)
+        RETURNS: (article KV key, decoded record) or None
+        """
+        cmi_debug = __name__+"::"+self.thash_get.__name__+".#"+str(self.yti)
+        _hdb = self.sub_db(self.thash_db)
+        if _hdb is None:
+            return None
+        with self.read_txn() as txn:
+            _key = txn.get(_thash, db=_hdb)
+            if _key is None:
+                return None
+            _key = bytes(_key)
+            _v = txn.get(_key)
+        if _v is None:
+            logging.info( f'%s - Text hash index entry w/o a record: {_key}' % cmi_debug )
+            return None
+        try:
+            _record = decode_record(_v)
+        except ValueError as e:
+            logging.info( f'%s - Text hash record corrupt: {_key} {e}' % cmi_debug )
+            return None
+        if _record.get('text_hash') != _thash.hex() or 'urlhash' not in _record:
+            logging.info( f'%s - Stale text hash index entry: {_key}' % cmi_debug )
+            return None
+        logging.info( f'%s - Text hash HIT: {_key}' % cmi_debug )
+        return _key, _record
+
+    ################# 24
+    def thash_put(self, _txn, _thash, _key):
+        """Article TEXT hash side index : write inside the callers open RW txn (same txn as the article KV write)"""
+        if not _thash:
+            return 0
+        _txn.put(_thash, _key, db=self.sub_db(self.thash_db))
+        return 1
+
+    ################# 25
+    def ptime_put(self, _txn, _key, _epoch):
+        """
+        pub_time index : write 1 SYMBOL|published_epoch|urlhash entry for article KV key _key (0001.SYMBOL.urlhash)
+        - inside the callers open RW txn, AFTER the article KV write (same txn)
+        - a re-written article with a new publish time leaves its old entry behind. Readers re-check the record
+        - COMPLETE markers : readers only trust the index for a symbol (SYMBOL|) or the whole DB (PTIME_ALL) once every
+          article in it is indexed. Set here when _key is the FIRST article of its symbol / of the DB, else by a
+          backfill (composite_score.py --build-time-index). Without one, readers fall back to a prefix scan
+        """
+        if _epoch is None or not math.isfinite(_epoch):
+            return 0
+        _pdb = self.sub_db(self.ptime_db)
+        _db_id, _rest = bytes(_key).decode('utf-8').split(".", 1)
+        _symbol, _urlhash = _rest.rsplit(".", 1)
+        _txn.put(ptime_key(_symbol, _epoch, _urlhash), _key, db=_pdb)
+        if _txn.get(PTIME_ALL, db=_pdb) is None:
+            _mark = f"{_symbol.upper()}|".encode('utf-8')
+            if _txn.get(_mark, db=_pdb) is None and self._only_article(_txn, f"{_db_id}.{_symbol}.".encode('utf-8'), _key):
+                _txn.put(_mark, b"", db=_pdb)
+                if self._only_article(_txn, f"{_db_id}.".encode('utf-8'), _key):
+                    _txn.put(PTIME_ALL, b"", db=_pdb)
+        return 1
 
-        logging.info( f"%s - Error.#4 KV Cache engine / LMDB cant open RO mode" % cmi_debug )
-        print (f"=========== End.#4 KV Cache MISS / LMDB RO open failure ! Do Net read... {item_idx} ===========" )
-        return 4, 0, 0, None, None   # LMDB I/O FAILURE : Failed to open DB in RO mode
+    def _only_article(self, _txn, _prefix, _key):
+        """True if _key is the only article under _prefix (a longer symbol sharing the prefix, BRK.B under BRK, is ignored)"""
+        _cursor = _txn.cursor()
+        if not _cursor.set_range(_prefix):
+            return True
+        _depth = _prefix.count(b".")
+        for _k in _cursor.iternext(keys=True, values=False):
+            if not _k.startswith(_prefix):
+                return True
+            if _k != _key and (_depth == 1 or b"." not in _k[len(_prefix):]):
+                return False
+        return True
 
     # ##################################
     # private helper function 
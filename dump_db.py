@@ -10,13 +10,16 @@ from pprint import pprint
 import random
 from rich import print
 import string
+import struct
 import sys
+import time
 import zstandard as zstd
 
 from typing import Any, Dict, List, Tuple, Optional
 
 
 from datastore_eng_LMDB import lmdb_io_eng
+from datastore_codec_LMDB import article_text, decode_record, decompress_text, encode_article, record_version, text_dict_id, REC_V1
 
 logging.basicConfig(level=logging.INFO)
 global args
@@ -28,6 +31,11 @@ parser.add_argument('-b','--basic', help='Simple 1-line view of all LMBD KV entr
 parser.add_argument('-d','--deep', help='Deep dump of values. Requires -k|--key TICKER/URLHASH', action='store_true', dest='bool_deep', required=False, default=False)
 parser.add_argument('-i','--init', help='Reset empty KV db of all data', action='store_true', dest='bool_init', required=False, default=False)
 parser.add_argument('-k','--key', help='Filter output by KEY sub-string', action='store', dest='key_filter', required=False, default=None)
+parser.add_argument('-m','--migrate', help='Rewrite records -> v2 msgpack split (metrics + text) records, in place', action='store_true', dest='bool_migrate', required=False, default=False)
+parser.add_argument('--batch', help='Records per write txn for --migrate', action='store', type=int, dest='batch_size', required=False, default=500)
+parser.add_argument('-t','--train-dict', help='Train + activate a zstd dictionary over the stored article text', action='store_true', dest='bool_train_dict', required=False, default=False)
+parser.add_argument('--samples', help='Max article text samples for --train-dict', action='store', type=int, dest='dict_samples', required=False, default=2000)
+parser.add_argument('--dict-size', help='zstd dictionary size in bytes for --train-dict', action='store', type=int, dest='dict_size', required=False, default=112640)
 parser.add_argument('-v','--verbose', help='Verbose error logging', action='store_true', dest='bool_verbose', required=False, default=False)
 parser.add_argument('-x','--xray', help='Full dict record XRAY. Requires -k|--key TICKER/URLHASH', action='store_true', dest='bool_xray', required=False, default=False)
 
@@ -43,6 +51,31 @@ if args['bool_verbose'] is True:        # Logging level
 else:
     logging.disable(20)                 # Log lvel = INFO
 
+def _json_default(o):
+    # v2 records hold raw bytes (zstd_blob). Show them as Base64, same as a v1 record
+    if isinstance(o, (bytes, bytearray)):
+        return base64.b64encode(o).decode('utf-8')
+    return str(o)
+
+def _text_blob(lmdb_instance, txn, key):
+    # raw zstd article text value from the article_text sub-DB (split records). None if not there
+    try:
+        _tdb = lmdb_instance.RO_env.open_db(lmdb_instance.text_db, txn=txn, create=False)
+    except lmdb.NotFoundError:
+        return None
+    return txn.get(key, db=_tdb)
+
+def _dict_lookup(lmdb_instance, txn):
+    # resolves zstd dictionaries (zstd_dict sub-DB) inside the callers RO txn. For decompress_text()
+    def _lookup(dict_id):
+        try:
+            _ddb = lmdb_instance.RO_env.open_db(lmdb_instance.dict_db, txn=txn, create=False)
+        except lmdb.NotFoundError:
+            return None
+        _raw = txn.get(struct.pack(">I", dict_id), db=_ddb)
+        return zstd.ZstdCompressionDict(_raw) if _raw is not None else None
+    return _lookup
+
 ################# 1
 # book_deep
 def dump_lmdb_by_key(lmdb_instance, key_filter):
@@ -81,11 +114,11 @@ def dump_lmdb_by_key(lmdb_instance, key_filter):
                 matched_on = "ticker" if ticker_match else "url_hash"
                 #value_str = value.decode('utf-8')
 
-                _v_dict = json.loads(value.decode('utf-8'))
+                _v_dict = decode_record(value)              # v1 JSON or v2 msgpack
                 working_article = _v_dict["article"]        # article number
-                print ( f"LMBD Database: {db_id} / Ticker: {ticker} / Filtering by:{matched_on}" ) 
+                print ( f"LMBD Database: {db_id} / Ticker: {ticker} / Filtering by:{matched_on} / Record: v{record_version(value)} {len(value)} bytes" ) 
                 print ( f"============================ Begin News article:  {working_article} ====================================" )
-                print(json.dumps(_v_dict, indent=4))
+                print(json.dumps(_v_dict, indent=4, default=_json_default))
                 print ( f"============================ End News article:  {working_article} ====================================" )
 
                 #print( f"URL hash:  {_v_dict["urlhash"]}" )
@@ -96,9 +129,13 @@ def dump_lmdb_by_key(lmdb_instance, key_filter):
 
                 try:
                     _zstd_article_text = _v_dict["zstd_blob"]  # test if dic has ZSTD compressed article entry
-                    print ( f"ZSTD article blob: {_zstd_article_text[:100]}{'...' if len(_zstd_article_text) > 1 else ''}" )
+                    print ( f"ZSTD article blob: {len(_zstd_article_text)} {'bytes' if isinstance(_zstd_article_text, bytes) else 'Base64 chars'}" )
                 except KeyError:
-                    print ( f"LMDB entry has no ZSTD compressed article entry." )
+                    _zstd_article_text = _text_blob(lmdb_instance, txn, key)    # split record. Text lives in the article_text sub-DB
+                    if _zstd_article_text is not None:
+                        print ( f"ZSTD article blob: {len(_zstd_article_text)} bytes (article_text sub-DB) / zstd dict: {text_dict_id(_zstd_article_text)}" )
+                    else:
+                        print ( f"LMDB entry has no ZSTD compressed article entry." )
 
                 print ( f"Text metrics:  Total characters: {_v_dict["chars_count"]} / Total words: {_v_dict["total_words"]} Total tokens: {_v_dict["total_tokens"]}" )
                 print ( f"\nChunk sub-dict data")
@@ -165,16 +202,15 @@ def dump_lmdb_xray(lmdb_instance, key_filter):
                 total += 1
                 if key_filter not in key_str:
                     continue
-                value_str = value.decode('utf-8')
                 matches += 1
                 print(f"\n{'='*70}")
-                print(f"[{matches:03}] KEY: {key_str}")
+                print(f"[{matches:03}] KEY: {key_str} / Record: v{record_version(value)} {len(value)} bytes")
                 print(f"{'='*70}")
                 try:
-                    parsed = json.loads(value_str)
-                    print(json.dumps(parsed, indent=2))
-                except (json.JSONDecodeError, ValueError):
-                    print(value_str)
+                    parsed = decode_record(value)
+                    print(json.dumps(parsed, indent=2, default=_json_default))
+                except ValueError:
+                    print(value.decode('utf-8', errors='replace'))
             print(f"\n{'='*70}")
             print(f"Deep dump '{key_filter}': {matches} match(es) from {total} total entries")
     except lmdb.Error as e:
@@ -192,8 +228,11 @@ def dump_lmdb_basic(lmdb_instance):
             count = 0
             for key, value in cursor:
                 key_str = key.decode('utf-8')
-                value_str = value.decode('utf-8')
-                print(f"{count:03} / KEY: {key_str} / {value_str[:40]}{'...' if len(value_str) > 40 else ''}")
+                try:
+                    value_str = json.dumps(decode_record(value), default=_json_default)
+                except ValueError:
+                    value_str = value.decode('utf-8', errors='replace')     # named sub-DBs + corrupt entries
+                print(f"{count:03} / KEY: {key_str} / v{record_version(value)} / {value_str[:40]}{'...' if len(value_str) > 40 else ''}")
                 count += 1            
         return 1
     except lmdb.Error as e:
@@ -231,17 +270,18 @@ def dump_lmdb_articles(lmdb_instance, ticker_filter, article_limit):
                     total += 1
                     continue
                 else:
-                    _v_dict = json.loads(value.decode('utf-8'))
+                    _v_dict = decode_record(value)              # v1 JSON or v2 msgpack
                     working_article = _v_dict["article"]        # article number
                     print ( f"LMBD Database: {db_id} / Dumping {article_limit} Articles entries for: {ticker_filter}" ) 
                     print ( f"================= News article:  {working_article} / Item {matches} of {article_limit}  ====================================" )
                     try:
-                        _zstd_article_text = _v_dict["zstd_blob"]  # test if dic has ZSTD compressed article entry
-                        b64_binencd_cmprssd_data = base64.b64decode(_zstd_article_text)
-                        #print ( f"ZSTD article blob: {_zstd_article_text[:100]}{'...' if len(_zstd_article_text) > 1 else ''}" )
-                        decompressor = zstd.ZstdDecompressor()
-                        zstd_blob_uncompressed = decompressor.decompress(b64_binencd_cmprssd_data).decode('utf-8')
-                        #= zstd.ZstdDecompressor().decompress(_zstd_article_text).decode('utf-8')
+                        if "zstd_blob" in _v_dict:
+                            zstd_blob_uncompressed = article_text(_v_dict, _dict_lookup(lmdb_instance, txn))     # unsplit record. v1 Base64 or v2 raw zstd bytes
+                        else:
+                            _blob = _text_blob(lmdb_instance, txn, key)         # split record. LAZY text fetch from article_text sub-DB
+                            if _blob is None:
+                                raise KeyError("zstd_blob")
+                            zstd_blob_uncompressed = decompress_text(_blob, _dict_lookup(lmdb_instance, txn))
                         print ( f"{zstd_blob_uncompressed}" )                                                        
                         matches += 1
                         if matches > article_limit:
@@ -262,7 +302,149 @@ def dump_lmdb_articles(lmdb_instance, ticker_filter, article_limit):
     except Exception as e:
         print( f"dump_lmdb_by_key Error: {e}")
     return 0
-        
+
+################# 5
+# -m or --migrate
+def migrate_lmdb_v2(lmdb_instance, batch_size):
+    """
+    Offline IN PLACE migration of article records -> v2 msgpack SPLIT records
+    - v1 JSON records + unsplit v2 records (text still inline) are rewritten
+    - metrics -> main DB, article text -> article_text sub-DB (same key)
+    - scans with a read txn, rewrites batch_size records per short write txn
+    - split v2 records, named sub-DBs and other non-article keys are left alone
+    - corrupt v1 records are reported + left as is (kv_cache_engine forces a Net read on them)
+    """
+    if lmdb_instance.open_env("MIGRATE") is None:
+        print ( f"LMDB Error: cant open {lmdb_instance.db_path}{lmdb_instance.db_name} for migration" )
+        return 1
+
+    _last = b""
+    migrated, v2_count, corrupt = 0, 0, 0
+    v1_bytes, v2_bytes = 0, 0
+    while True:
+        _batch = []
+        with lmdb_instance.read_txn() as txn:
+            cursor = txn.cursor()
+            if not cursor.set_range(_last):
+                break
+            for key, value in cursor:
+                if key == _last:
+                    continue                            # already handled by the previous batch
+                _last = key
+                if not key.startswith(b"0001.") or b'.' not in key[5:]:
+                    continue                            # named sub-DB / malformed key
+                _db_id, _rest = key.split(b'.', 1)
+                _symbol, _urlhash = _rest.rsplit(b'.', 1)  # symbols may hold a "." (BRK.B), urlhashes never do
+                if not _symbol or not _urlhash:
+                    continue
+                try:
+                    _record = decode_record(value)
+                except ValueError as e:
+                    print ( f"CORRUPT record: {key.decode('utf-8', errors='replace')} / {e}" )
+                    corrupt += 1
+                    continue
+                if record_version(value) != REC_V1 and "zstd_blob" not in _record:
+                    v2_count += 1
+                    continue
+                _v2_value, _v2_text = encode_article(_record)
+                _batch.append((key, _v2_value, _v2_text, len(value)))
+                if len(_batch) >= batch_size:
+                    break
+        if not _batch:
+            break
+
+        with lmdb_instance.write_txn() as txn:
+            for key, _v2_value, _v2_text, _v1_len in _batch:
+                lmdb_instance.put_article(txn, key, _v2_value, _v2_text)
+                v1_bytes += _v1_len
+                v2_bytes += len(_v2_value)
+        migrated += len(_batch)
+        print ( f"Migrated batch: {len(_batch)} records / total: {migrated}" )
+
+    print ( " " )
+    print ( f"Migrated -> v2 split: {migrated} / already v2 split: {v2_count} / corrupt: {corrupt}" )
+    if v1_bytes > 0:
+        print ( f"Metrics value bytes: {v1_bytes} -> {v2_bytes} ({v2_bytes / v1_bytes * 100:.1f} pct)" )
+    lmdb_instance.close_env("MIGRATE")
+    return 0
+
+################# 6
+# -t or --train-dict
+def train_zstd_dict(lmdb_instance, sample_max, dict_size):
+    """
+    Train a zstd dictionary over a random sample of the stored article text (article_text sub-DB)
+    - Yahoo articles share lots of boilerplate (disclaimers, "Story Continues", promo tails)
+    - per-record compression cant see it. A shared dictionary can
+    - stores the dictionary under its id in the zstd_dict sub-DB + makes it ACTIVE for NEW article text
+    - old text values keep their own dict id in their header, so they stay readable
+    - reports size + compress/decompress throughput, before (no dict) vs after (dict) on held out samples
+    """
+    if lmdb_instance.open_env("TRAIN_DICT") is None:
+        print ( f"LMDB Error: cant open {lmdb_instance.db_path}{lmdb_instance.db_name} for dictionary training" )
+        return 1
+
+    _samples = []
+    _seen = 0
+    with lmdb_instance.read_txn() as txn:
+        cursor = txn.cursor(db=lmdb_instance.sub_db(lmdb_instance.text_db))
+        for key, value in cursor:
+            try:
+                _text = decompress_text(value, lmdb_instance.zstd_dict).encode('utf-8')
+            except (ValueError, zstd.ZstdError) as e:
+                print ( f"Skipping unreadable text value: {key.decode('utf-8', errors='replace')} / {e}" )
+                continue
+            _seen += 1
+            if len(_samples) < sample_max:          # reservoir sample. Even spread over the whole corpus
+                _samples.append(_text)
+            else:
+                j = random.randint(0, _seen - 1)
+                if j < sample_max:
+                    _samples[j] = _text
+
+    if len(_samples) < 10:
+        print ( f"Not enough article text to train a dictionary: {len(_samples)} samples (min 10). Run --migrate first?" )
+        lmdb_instance.close_env("TRAIN_DICT")
+        return 1
+
+    if len(_samples) >= 50:                         # hold out 1 in 5 samples. Dont benchmark on the training set
+        _eval = _samples[::5]
+        _train = [ t for i, t in enumerate(_samples) if i % 5 != 0 ]
+    else:
+        _eval = _train = _samples
+
+    print ( f"Training zstd dictionary: {len(_train)} samples / {sum(len(t) for t in _train)} bytes / dict size: {dict_size}..." )
+    try:
+        _zdict = zstd.train_dictionary(dict_size, _train)
+    except zstd.ZstdError as e:
+        print ( f"zstd dictionary training failed: {e}" )
+        lmdb_instance.close_env("TRAIN_DICT")
+        return 1
+
+    def _bench(_cctx, _dctx):
+        t0 = time.perf_counter()
+        _frames = [ _cctx.compress(t) for t in _eval ]
+        t1 = time.perf_counter()
+        for f in _frames:
+            _dctx.decompress(f)
+        t2 = time.perf_counter()
+        return sum(len(f) for f in _frames), t1 - t0, t2 - t1
+
+    _raw_bytes = sum(len(t) for t in _eval)
+    _mb = _raw_bytes / (1024 * 1024)
+    _b_size, _b_ct, _b_dt = _bench(zstd.ZstdCompressor(level=3), zstd.ZstdDecompressor())
+    _a_size, _a_ct, _a_dt = _bench(zstd.ZstdCompressor(level=3, dict_data=_zdict), zstd.ZstdDecompressor(dict_data=_zdict))
+    _dict_id = lmdb_instance.put_zstd_dict(_zdict, True)
+
+    print ( " " )
+    print ( f"zstd dictionary: {_dict_id} / {len(_zdict.as_bytes())} bytes / ACTIVE for new article text" )
+    print ( f"Eval samples:    {len(_eval)} / {_raw_bytes} raw bytes" )
+    print ( f"                 {'Size bytes':>12} {'Ratio':>8} {'Compress MB/s':>14} {'Decompress MB/s':>16}" )
+    print ( f"Before (no dict) {_b_size:>12} {_b_size / _raw_bytes * 100:>7.1f}% {_mb / max(_b_ct, 1e-9):>14.1f} {_mb / max(_b_dt, 1e-9):>16.1f}" )
+    print ( f"After  (dict)    {_a_size:>12} {_a_size / _raw_bytes * 100:>7.1f}% {_mb / max(_a_ct, 1e-9):>14.1f} {_mb / max(_a_dt, 1e-9):>16.1f}" )
+    print ( f"Size reduction:  {(1 - _a_size / max(_b_size, 1)) * 100:.1f} pct" )
+    lmdb_instance.close_env("TRAIN_DICT")
+    return 0
+
 ################# Main()
 lmdb_dbname = "LMDB_0001"
 lmdb_inst = lmdb_io_eng("RO_DUMP", lmdb_dbname, args)
@@ -279,6 +461,8 @@ lmdb_inst.open_lmdb_RO("RO_DUMP")
 # 2. dump_lmdb_xray         : bool_xray        : -x or --xray
 # 3. dump_lmdb_basic()      : no switches / no options
 # 4. dump_lmdb_articles()   : bool_articles     : -a or --articles
+# 5. migrate_lmdb_v2()      : bool_migrate      : -m or --migrate [--batch N]
+# 6. train_zstd_dict()      : bool_train_dict   : -t or --train-dict [--samples N] [--dict-size N]
 #    NOTE: -k or --key = your supplied filter
 
 # -b' or '--basic'
@@ -357,6 +541,16 @@ elif args['bool_xray'] is True:
         parser.print_help()
         sys.exit(1)
 
+elif args['bool_migrate'] is True:
+    print ( f"Migrate records -> v2 msgpack split records @ {lmdb_inst.db_path}{lmdb_dbname} / batch: {args['batch_size']}..." )
+    lmdb_inst.close_lmdb("MIGRATE_CLOSE")     # RO env must be closed first. Migration uses the RW persistent env
+    sys.exit(migrate_lmdb_v2(lmdb_inst, args['batch_size']))
+
+elif args['bool_train_dict'] is True:
+    print ( f"Train zstd dictionary @ {lmdb_inst.db_path}{lmdb_dbname} / samples: {args['dict_samples']} / size: {args['dict_size']}..." )
+    lmdb_inst.close_lmdb("TRAIN_DICT_CLOSE")  # RO env must be closed first. Training uses the RW persistent env
+    sys.exit(train_zstd_dict(lmdb_inst, args['dict_samples'], args['dict_size']))
+
 elif args['bool_init'] is True:
     lmdb_dbname = "LMDB_0001"
     print ( f"Init empty LMDB by dropping data from: {lmdb_inst.RO_env} @ {lmdb_inst.db_path}{lmdb_dbname}..." )
@@ -28,12 +28,7 @@ from y_topgainers import y_topgainers
 
 # NEWS Data Extractor engines
 from data_engines_fundamentals.polygon_md import polygon_md
-from data_engines_news.barrons_news import barrons_news
-from data_engines_news.benzinga_news import benzinga_news
-from data_engines_news.forbes_news import forbes_news
-from data_engines_news.fxstreet_news import fxstreet_news
-from data_engines_news.investing_news import investing_news
-from data_engines_news.hedgeweek_news import hedgeweek_news
+from data_engines_news.news_cycle import news_cycle_runner
 #from data_engines_news.gurufocus_news import gurufocus_news
 
 """
@@ -206,21 +201,10 @@ def main():
 # Notes for: AI coding assistance @claude
 
     if args['news_cycle'] is True:
-        #'''
-        ext_count = 0
-        barrons_news_reader = barrons_news(1)
-        ext_count += asyncio.run(barrons_news_reader.craw4ai_str_schema_extr())
-        benzinga_news_reader = benzinga_news(1)
-        ext_count += asyncio.run(benzinga_news_reader.craw4ai_str_schema_extr())
-        forbes_news_reader = forbes_news(1)
-        ext_count += asyncio.run(forbes_news_reader.craw4ai_str_schema_extr())
-        fxstreet_news_reader = fxstreet_news(1)
-        ext_count += asyncio.run(fxstreet_news_reader.craw4ai_str_schema_extr())
-        investing_news_reader = investing_news(1)
-        ext_count += asyncio.run(investing_news_reader.craw4ai_str_schema_extr())
-        hedgeweek_news_reader = hedgeweek_news(1)
-        ext_count += asyncio.run(hedgeweek_news_reader.craw4ai_str_schema_extr())
-        #'''
+        # ALL sources + their pages scheduled at once on 1 event loop (cycle time ~= slowest source)
+        news_cycle = news_cycle_runner(1)
+        ext_count = asyncio.run(news_cycle.run())    # combined rows, deduped across sources by urlhash -> news_cycle.DB_insert_data
+        news_cycle.report()
             
         #gurufocus_news_reader = gurufocus_news(1)
         #asyncio.run(gurufocus_news_reader.craw4ai_str_schema_extr())
@@ -0,0 +1,269 @@
+#! python3
+
+import asyncio
+import logging
+import random
+import time
+from pathlib import Path
+
+from c4_browser_pool import c4_browser_pool
+from composite_score import CompositeScorer
+from ml_news_pipeline import news_pipeline
+from ml_sentiment import ml_sentiment
+from ml_yf_nlp_orchestrator import ml_nlpreader, NewsAgeResolver
+
+# ML / NLP section #############################################################
+class news_batch:
+    """
+    Multi symbol --newsai-sent BATCH mode. 1 process for the whole symbol list
+    - classifier loaded ONCE (background preload runs while the depth 0 skims work)
+    - 1 warm browser pool, 1 pooled HTTP client per host (1 cookie warm-up), 1 persistent LMDB env
+    - depth 0 + 1 skims for ALL symbols run concurrently (bounded by batch_skim)
+    - GLOBAL urlhash dedupe : an article already built for an earlier symbol in this batch is cloned
+      to the new symbol key in LMDB (lmdb_io_eng.clone_article). No depth 2 / depth 3 / LLM work again
+    - 1 shared run_epoch anchor + 1 CompositeScorer -> 1 cross symbol ranking table
+    """
+
+    # global accessors
+    args = []               # class dict to hold global args being passed in from main() methods
+    cloned = 0              # articles cloned from another symbol (dedupe hits)
+    dateageresolver = None  # singleton class of News Article Age date Resolver(). Shared by every reader
+    lmdb_env = None         # lmdb_io_eng instance. 1 persistent env for the whole batch
+    readers = None          # { symbol: ml_nlpreader } 1 news reader per symbol (own yfn reader + ml_ingest)
+    run_epoch = None        # 1 shared scoring anchor for every symbol (cross symbol comparable)
+    seen = None             # { urlhash: [symbols] } symbols in this batch that already processed the urlhash
+    sent_ai = None          # ml_sentiment instance. Shared by every symbol
+    skim_time = 0.0
+    stats = None            # { symbol: { candidates, cloned, read, failed } }
+    symbols = None          # list[] of symbols in this batch (de-duplicated, in order)
+    yti = 0
+
+    ######################## init ########################
+    def __init__(self, yti, symbols, lmdb_env, global_args):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s   Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        self.args = global_args
+        self.lmdb_env = lmdb_env
+        self.symbols = list(dict.fromkeys( s.upper() for s in symbols ))
+        self.readers = dict()
+        self.seen = dict()
+        self.stats = dict()
+        self.cloned = 0
+        self.dateageresolver = NewsAgeResolver()
+        return
+
+    # #################################### 1
+    async def skim_all(self):
+        """
+        Depth 0 + 1 skim for EVERY symbol at once (asyncio.gather, bounded by args['batch_skim'])
+        - each symbol gets its own ml_nlpreader / yfn reader. The browser pool + HTTP clients are shared
+        RETURNS: number of symbols with candidate articles
+        """
+        cmi_debug = __name__+"::"+self.skim_all.__name__+".#"+str(self.yti)
+        _sem = asyncio.Semaphore(max(1, int(self.args.get('batch_skim', 4) or 4)))
+        _t0 = time.perf_counter()
+
+        async def _skim(_yti, _symbol):
+            async with _sem:
+                _reader = ml_nlpreader(_yti, self.args, caller="news_batch")
+                _reader.dateageresolver = self.dateageresolver
+                _reader.lmdb_env = self.lmdb_env
+                try:
+                    await _reader.nlp_read_one(_symbol, self.args)
+                except Exception as e:
+                    logging.error( f'{cmi_debug} - Depth 0 skim FAILED for {_symbol}: {e}' )
+                    return
+                if _reader.yfn is not None and _reader.yfn.ml_ingest:
+                    self.readers[_symbol] = _reader
+
+        await asyncio.gather( *(_skim(_i + 1, _s) for _i, _s in enumerate(self.symbols)) )
+        self.skim_time = time.perf_counter() - _t0
+        logging.info( f'%s - Skimmed {len(self.readers)} / {len(self.symbols)} symbols in {self.skim_time:.1f}s' % cmi_debug )
+        return len(self.readers)
+
+    # #################################### 2
+    def run(self):
+        """
+        Depth 2 + 3 + sentiment for each symbol in list order, with global urlhash dedupe
+        - ml_sentiment is built AFTER the skims (the classifier preload overlaps the skim network time)
+        RETURNS: total articles read (built + rehydrated + cloned)
+        """
+        cmi_debug = __name__+"::"+self.run.__name__+".#"+str(self.yti)
+        self.sent_ai = ml_sentiment(1, self.args)
+        self.sent_ai.chunk_cache = self.lmdb_env
+        self.run_epoch = time.time()
+        _total = 0
+        for _symbol in self.symbols:
+            _reader = self.readers.get(_symbol)
+            if _reader is None:
+                print ( f"Batch: {_symbol} - NO new articles found / skipping" )
+                continue
+            print ( " " )
+            print ( f"=================== Batch: AI News Sentiment for [ {_symbol} ] ===================" )
+            _total += self.run_symbol(_symbol, _reader)
+        logging.info( f'%s - Batch done: {_total} articles / {self.cloned} cloned' % cmi_debug )
+        return _total
+
+    # #################################### 3
+    def run_symbol(self, symbol, news_ai):
+        """
+        1 symbol : dedupe -> bulk KV probe -> (optional fetch stage / pipeline) -> depth 2 + 3 LOOP
+        RETURNS: articles read for this symbol
+        """
+        cmi_debug = __name__+"::"+self.run_symbol.__name__+".#"+str(self.yti)
+        _yfn = news_ai.yfn
+        _cycle = int(self.args.get('batch_cycle', 0) or 0)      # 0 = read every candidate
+        _st = dict(candidates=len(_yfn.ml_ingest), cloned=0, read=0, failed=0)
+        self.stats[symbol] = _st
+
+        _dupes = self._dedupe(symbol, _yfn.ml_ingest)
+        _st['cloned'] = len(_dupes)
+        _cloned_rows = { _idx: _yfn.ml_ingest.pop(_idx) for _idx in _dupes }    # already built for another symbol + cloned. No depth 2 / 3 work
+        kv_hits, kv_misses, kv_corrupt = self.lmdb_env.probe_ml_ingest(_yfn.ml_ingest)
+        print ( f"KV cache probe: {len(kv_hits)} hits / {len(kv_misses)} misses / {len(kv_corrupt)} corrupt / {len(_dupes)} cloned from another symbol" )
+
+        _fetch_q = None
+        _prefetch = set()
+        _fetch_cc = self.args.get('fetch_concurrency', 0) or (4 if self.args.get('pipeline') else 0)
+        if _fetch_cc > 0:
+            _work = []
+            for _idx in sorted(kv_misses | kv_corrupt):
+                _row = _yfn.ml_ingest[_idx]
+                if _row.get('thint') == 0.0 and 'exturl' not in _row and 'urlhash' in _row:
+                    _work.append((_idx, _row['url'], _row['urlhash']))
+            if _work:
+                _prefetch = { w[0] for w in _work }
+                _fetch_q = _yfn.c4_prefetch(_work, _fetch_cc, self.args.get('host_delay', 1.0))
+
+        _pipe = None
+        if self.args.get('pipeline'):
+            _pipe = news_pipeline(1, news_ai, self.sent_ai, self.lmdb_env, self.args)
+            _pipe.start(_fetch_q, _prefetch)
+            _ingest = _pipe.results()
+        else:
+            _ingest = ( (_i, None) for _i in _yfn.ingest_order(_fetch_q) )
+
+        antibot_load_balancer = 0
+        for item_idx, _piped in _ingest:
+            if _piped is not None:
+                thint, final_results = _piped['thint'], _piped['final_results']
+            else:
+                thint = news_ai.nlp_summary_report(3, item_idx)
+                final_results = None
+                if thint == 0.0:
+                    if antibot_load_balancer == 0 or item_idx in _prefetch:     # randomize craw4ai / BS4 scrapers (pre-fetched = C4)
+                        _atc, _awc, final_results = _yfn.artdata_C4_depth3(item_idx, self.sent_ai, self.lmdb_env)
+                    else:
+                        _atc, _awc, final_results = _yfn.artdata_BS4_depth3(item_idx, self.sent_ai, self.lmdb_env)
+                    antibot_load_balancer = random.randint(1, 100) % 2
+            if thint != 0.0:
+                continue
+            if final_results is None:
+                _st['failed'] += 1
+                continue
+            _st['read'] += 1
+            _urlhash = _yfn.ml_ingest[item_idx].get('urlhash')
+            if _urlhash:
+                self.seen.setdefault(_urlhash, []).append(symbol)
+            if _cycle and _st['read'] >= _cycle:
+                print ( f"\n** Batch: {symbol} exiting cycle @ article: {_st['read']}..." )
+                break
+
+        _yfn.c4_prefetch_stop()
+        if _pipe is not None:
+            _pipe.stop()
+            _pipe.join(5)
+        _yfn.ml_ingest = dict(sorted({ **_yfn.ml_ingest, **_cloned_rows }.items()))   # feed order again (cloned rows are cached too)
+        _yfn.skim_watermark(self.lmdb_env)
+        logging.info( f'%s - {symbol}: {_st["read"]} read / {_st["cloned"]} cloned / {_st["failed"]} failed' % cmi_debug )
+        return _st['read'] + _st['cloned']
+
+    # #################################### 4
+    def rank(self):
+        """
+        1 CompositeScorer, 1 shared run_epoch, every symbol ranked in 1 read txn on the SAME persistent LMDB env
+        RETURNS: list[] of composite reports, best score first (unscored symbols last)
+        """
+        cmi_debug = __name__+"::"+self.rank.__name__+".#"+str(self.yti)
+        scorer = CompositeScorer()
+        _env = self.lmdb_env.open_env("GLOBAL")
+        _epoch = self.run_epoch or time.time()
+        try:
+            return [ dict(_r) for _r in scorer.rank_symbols(self.symbols, run_epoch=_epoch, env=_env) ]     # 1 txn, 1 kernel call
+        except Exception as e:
+            logging.error( f'{cmi_debug} - Composite ranking FAILED: {e}' )
+            return []
+
+    # #################################### 5
+    def report(self, reports):
+        """Print the cross symbol ranking table + batch run stats"""
+        print ( " " )
+        print ( f"=================== Batch Composite Sentiment Ranking: {len(reports)} symbols ===================" )
+        print ( f"{'#':>3} {'Symbol':<8} {'Score':>8} {'Polarity':>9} {'Density':>8} {'Volume':>7} {'N_eff':>6} {'Used':>5} {'Total':>6}  State" )
+        for _r, _rep in enumerate(reports, 1):
+            _fmt = lambda v, w: f"{v:>{w}.4f}" if v is not None else f"{'-':>{w}}"
+            print ( f"{_r:>3} {_rep['symbol']:<8} {_fmt(_rep['composite_score'], 8)} {_fmt(_rep['polarity'], 9)} "
+                    f"{_fmt(_rep['directional_density'], 8)} {_fmt(_rep['volume_factor'], 7)} {_rep['n_eff']:>6.2f} "
+                    f"{_rep['articles_used']:>5} {_rep['articles_total']:>6}  {_rep['state']}" )
+        print ( "--------------------------------" )
+        _read = sum( s['read'] for s in self.stats.values() )
+        print ( f"Batch symbols:       {len(self.readers)} / {len(self.symbols)} with candidates / skim time: {self.skim_time:.1f}s" )
+        print ( f"Articles read:       {_read} / cloned from another symbol: {self.cloned}" )
+        print ( f"Rehydrated / LLM:    {self.sent_ai.kv_rehydrated if self.sent_ai else 0} articles / {self.sent_ai.sen_llm_eng if self.sent_ai else 0} chunks" )
+        print ( f"Unchanged text:      {self.sent_ai.thash_hit if self.sent_ai else 0} articles / {self.sent_ai.sen_thash_eng if self.sent_ai else 0} LLM chunk calls saved" )
+        print ( f"Browser launches:    {c4_browser_pool.launches} / crawls: {c4_browser_pool.borrows}" )
+        return
+
+    # #################################### 6
+    def close(self):
+        """End of batch : stop any fetch stage + close the pooled HTTP clients (shared by every reader)"""
+        for _reader in self.readers.values():
+            _reader.yfn.c4_prefetch_stop()
+        if self.readers:
+            next(iter(self.readers.values())).yfn.http_close()
+        return
+
+    # ###################### Helper Method
+    # Helper method -> run_symbol
+
+    def _dedupe(self, symbol, ml_ingest):
+        """
+        GLOBAL urlhash dedupe : clone every type 0 article an earlier symbol in this batch already built
+        - 1 short write txn for the whole symbol. Each clone is also written to the pub_time index
+        RETURNS: set{} of ml_ingest item_idx that were cloned (skip them)
+        """
+        cmi_debug = __name__+"::"+self._dedupe.__name__+".#"+str(self.yti)
+        _dupes = set()
+        _todo = [ (_idx, _row['urlhash']) for _idx, _row in ml_ingest.items()
+                  if _row.get('type') == 0 and _row.get('urlhash') in self.seen ]
+        if not _todo or self.lmdb_env.open_env("GLOBAL") is None:
+            return _dupes
+        _scorer = CompositeScorer()
+        _epoch_of = lambda _record: _scorer.resolve_published_epoch(_record)[0]
+        with self.lmdb_env.write_txn() as _txn:
+            for _idx, _urlhash in _todo:
+                for _src in self.seen[_urlhash]:
+                    if self.lmdb_env.clone_article(_txn, _urlhash, _src, symbol, _epoch_of):
+                        _dupes.add(_idx)
+                        self.seen[_urlhash].append(symbol)
+                        break
+        self.cloned += len(_dupes)
+        logging.info( f'%s - {symbol}: cloned {len(_dupes)} / {len(_todo)} cross symbol duplicates' % cmi_debug )
+        return _dupes
+
+
+def load_symbols(_specs):
+    """
+    Batch symbol list from the CLI -> list[] of symbols
+    - each spec is a symbol, a comma separated list, or @file (1+ symbols per line, # comments)
+    """
+    _symbols = []
+    for _spec in _specs or []:
+        if _spec.startswith("@"):
+            for _line in Path(_spec[1:]).read_text(encoding="utf-8").splitlines():
+                _line = _line.split("#", 1)[0]
+                _symbols.extend( s for s in _line.replace(",", " ").split() )
+        else:
+            _symbols.extend( s for s in _spec.split(",") if s.strip() )
+    return [ s.strip().upper() for s in _symbols if s.strip() ]
@@ -0,0 +1,294 @@
+#! python3
+
+import logging
+import queue
+import random
+import threading
+import time
+
+from ml_sentiment import ml_sentiment
+
+# ML / NLP section #############################################################
+class news_pipeline:
+    """
+    Producer / consumer pipeline for the --newsai-sent Depth 3 path
+    Overlaps network I/O with LLM classification (the serial LOOP only ever does one OR the other)
+
+    fetch thread     -> depth 2 page read + interpret (nlp_summary_report). Depth 3 article crawls come from the concurrent
+                        c4 fetch stage (yfnews_reader.c4_prefetch) via ingest_order(). Produces ml_ingest item_idx
+        |  class_q (bounded)
+    classify thread  -> holds the warm classifier. artdata_*_depth3() text extract (+ BS4 network read when not
+                        pre-fetched) + sentiment. LMDB writes + sen_stats_df rows are DEFERRED into the result dict{}
+        |  result_q (bounded)
+    collector        -> callers thread (results() generator). Deferred LMDB writes + yfn.sen_stats_df accumulation.
+                        The caller does its own final_sent_df / merge work on the yielded results (same thread)
+
+    - bounded queues = backpressure. A slow classifier stalls the fetch thread, not memory
+    - every stage records busy / idle / blocked time (see report())
+    """
+
+    # global accessors
+    args = []               # class dict to hold global args being passed in from main() methods
+    class_q = None          # fetch -> classify queue.Queue (bounded)
+    result_q = None         # classify -> collector queue.Queue (bounded)
+    fetch_q = None          # c4 fetch stage completion queue (see yfnews_reader.c4_prefetch)
+    lmdb_env = None         # lmdb_io_eng instance. The collector does ALL the article LMDB writes
+    news_ai = None          # ml_yf_nlp_orchestrator instance (depth 2 page interpreter + yfn reader)
+    pending = None          # list[] of (item_idx, result_dict{}) classified but never collected (stop). join() writes them
+    prefetched = None       # set{} of item_idx crawled by the c4 fetch stage. Always go to the C4 extractor
+    sent_ai = None          # ml_sentiment instance
+    stats = None            # { stage: { busy, idle, blocked, items } }
+    threads = None          # list[] of stage threads
+    _stop = None            # threading.Event -> stops all stages
+    _EOS = None             # end of stream marker
+    yti = 0
+
+    ######################## init ########################
+    def __init__(self, yti, news_ai, sent_ai, lmdb_env, global_args):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s   Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        self.args = global_args
+        self.news_ai = news_ai
+        self.sent_ai = sent_ai
+        self.lmdb_env = lmdb_env
+        _depth = max(1, int(self.args.get('pipeline_depth', 4) or 4))
+        self.class_q = queue.Queue(maxsize=_depth)
+        self.result_q = queue.Queue(maxsize=_depth)
+        self.prefetched = set()
+        self.pending = []
+        self.threads = []
+        self._stop = threading.Event()
+        self.stats = { _s: dict(busy=0.0, idle=0.0, blocked=0.0, items=0) for _s in ('fetch', 'classify', 'collect') }
+        return
+
+    # #################################### 1
+    def start(self, fetch_q=None, prefetched=None):
+        """
+        Start the fetch + classify stage threads
+        - fetch_q / prefetched : from yfnews_reader.c4_prefetch(). None = no concurrent c4 fetch stage
+        """
+        cmi_debug = __name__+"::"+self.start.__name__+".#"+str(self.yti)
+        self.fetch_q = fetch_q
+        self.prefetched = prefetched or set()
+        self.threads = [
+            threading.Thread(target=self._fetch_worker, name="pipeline_fetch", daemon=True),
+            threading.Thread(target=self._classify_worker, name="pipeline_classify", daemon=True)
+            ]
+        for _t in self.threads:
+            _t.start()
+        logging.info( f'%s - Pipeline started / queue depth: {self.class_q.maxsize}' % cmi_debug )
+        return
+
+    # #################################### 2
+    def results(self):
+        """
+        Collector stage (runs in the CALLERS thread)
+        - drains result_q, does the deferred LMDB writes for each article in 1 short write txn
+        - appends the deferred sentiment row to yfn.sen_stats_df (only ever touched on this thread)
+        - yields (item_idx, result_dict{}) in classification order
+          result_dict keys: thint, atc, awc, final_results, urlhash, mean
+        """
+        cmi_debug = __name__+"::"+self.results.__name__+".#"+str(self.yti)
+        _st = self.stats['collect']
+        while True:
+            _t0 = time.perf_counter()
+            _item = self.result_q.get()
+            _t1 = time.perf_counter()
+            _st['idle'] += _t1 - _t0
+            if _item is self._EOS:
+                logging.info( '%s - End of stream' % cmi_debug )
+                return
+            item_idx, _res = _item
+            self._write(item_idx, _res)
+            _sen_rows = _res.pop('sen_rows', None)
+            if _sen_rows:
+                self.news_ai.yfn.sen_stats_put(_sen_rows)
+            _st['busy'] += time.perf_counter() - _t1
+            _st['items'] += 1
+            yield item_idx, _res
+
+    # #################################### 3
+    def stop(self):
+        """
+        Stop all stages (e.g. the -c cycle limit was hit)
+        - unclassified items are dropped. Classified but uncollected results are kept in pending for join() to write
+          (their LMDB writes were deferred, so dropping them would throw the classify work away)
+        """
+        self._stop.set()
+        self.news_ai.yfn.c4_prefetch_stop()
+        for _q in (self.class_q, self.result_q):       # unblock any stage stuck on a full queue
+            try:
+                while True:
+                    _item = _q.get_nowait()
+                    if _q is self.result_q and _item is not self._EOS:
+                        self.pending.append(_item)
+            except queue.Empty:
+                pass
+        return
+
+    # #################################### 4
+    def join(self, timeout=None):
+        """
+        Wait for the stage threads to exit
+        - fetch stage : up to timeout (it may be stuck on the network. It never touches sent_ai)
+        - classify stage : ALWAYS until it exits. It shares sent_ai + yfn with the caller, so an in flight article
+          must finish before they are re-used (e.g. the next batch symbol)
+        - then writes any classified results stop() kept back (pending)
+        """
+        cmi_debug = __name__+"::"+self.join.__name__+".#"+str(self.yti)
+        for _t in self.threads:
+            if _t.name == "pipeline_classify":
+                if _t.is_alive():
+                    logging.info( '%s - Wait for the classify stage to finish its in flight article...' % cmi_debug )
+                _t.join()
+            else:
+                _t.join(timeout)
+        self._flush_pending()
+        return
+
+    # #################################### 5
+    def report(self):
+        """Print per stage busy / idle / blocked time + utilization"""
+        print ( f"Pipeline stages: queue depth {self.class_q.maxsize}" )
+        for _name, _st in self.stats.items():
+            _total = _st['busy'] + _st['idle'] + _st['blocked']
+            _util = (_st['busy'] / _total * 100) if _total > 0 else 0.0
+            print ( f"  {_name:<9} items: {_st['items']:>4} / busy: {_st['busy']:8.2f}s / idle: {_st['idle']:8.2f}s / blocked: {_st['blocked']:8.2f}s / util: {_util:5.1f}%" )
+        return
+
+    # ###################### Helper Method
+    # Helper method -> stage threads
+
+    def _put(self, _q, _item, _st):
+        """Bounded put that gives up when the pipeline is stopped. Time spent waiting = blocked (backpressure)"""
+        _t0 = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                _q.put(_item, timeout=0.2)
+                _st['blocked'] += time.perf_counter() - _t0
+                return True
+            except queue.Full:
+                continue
+        _st['blocked'] += time.perf_counter() - _t0
+        return False
+
+    def _write(self, item_idx, _res):
+        """Do the deferred LMDB writes of 1 classified article in 1 short write txn (collector / callers thread only)"""
+        cmi_debug = __name__+"::"+self._write.__name__+".#"+str(self.yti)
+        for _w in _res.pop('writes', None) or ():
+            _lmdb_inst, _key, _metrics_value, _text_value, _ccache, _thash, _epoch = _w
+            if _lmdb_inst.open_env("PIPE") is None:
+                logging.info( f'%s - FAILED to access KVstore / not writing cache entry [ {item_idx} ]' % cmi_debug )
+                continue
+            with _lmdb_inst.write_txn() as _txn:
+                _lmdb_inst.put_article(_txn, _key, _metrics_value, _text_value, _epoch)
+                _lmdb_inst.ccache_put(_txn, _ccache)
+                _lmdb_inst.thash_put(_txn, _thash, _key)
+        return
+
+    def _flush_pending(self):
+        """Write the classified results stop() kept back. Only after the classify stage exited (it can still add one)"""
+        cmi_debug = __name__+"::"+self._flush_pending.__name__+".#"+str(self.yti)
+        if any(_t.name == "pipeline_classify" and _t.is_alive() for _t in self.threads):
+            return
+        try:
+            while True:                                 # a put already in flight when stop() drained result_q
+                _item = self.result_q.get_nowait()
+                if _item is not self._EOS:
+                    self.pending.append(_item)
+        except queue.Empty:
+            pass
+        _pending, self.pending = self.pending, []
+        for item_idx, _res in _pending:
+            self._write(item_idx, _res)
+        if _pending:
+            logging.info( f'%s - Wrote {len(_pending)} classified but uncollected articles to LMDB' % cmi_debug )
+        return
+
+    def _get(self, _q):
+        """Blocking get that gives up when the pipeline is stopped (stop() drains the queues, so the EOS may never come)"""
+        while not self._stop.is_set():
+            try:
+                return _q.get(timeout=0.2)
+            except queue.Empty:
+                continue
+        return self._EOS
+
+    def _fetch_worker(self):
+        """
+        Fetch stage: ml_ingest items in ingest_order() (pre-fetched items as their crawls complete)
+        + the depth 2 page interpreter (nlp_summary_report) -> (item_idx, thint) on class_q
+        """
+        cmi_debug = __name__+"::"+self._fetch_worker.__name__+".#"+str(self.yti)
+        _st = self.stats['fetch']
+        try:
+            _order = self.news_ai.yfn.ingest_order(self.fetch_q)
+            while not self._stop.is_set():
+                _t0 = time.perf_counter()
+                try:
+                    item_idx = next(_order)             # blocks on the c4 fetch stage (network)
+                except StopIteration:
+                    break
+                _t1 = time.perf_counter()
+                _st['idle'] += _t1 - _t0
+                thint = self.news_ai.nlp_summary_report(3, item_idx)
+                _st['busy'] += time.perf_counter() - _t1
+                _st['items'] += 1
+                if not self._put(self.class_q, (item_idx, thint), _st):
+                    break
+        except Exception as e:
+            logging.error( f'{cmi_debug} - Fetch stage FAILED: {e}' )
+        self._put(self.class_q, self._EOS, _st)
+        return
+
+    def _classify_worker(self):
+        """
+        Classify stage: owns the warm classifier + the ml_sentiment instance
+        - runs artdata_*_depth3() with LMDB writes (yfn.kv_defer) + sen_stats_df rows (yfn.sen_defer) DEFERRED to the collector
+        - per article result dict{} -> result_q
+        """
+        cmi_debug = __name__+"::"+self._classify_worker.__name__+".#"+str(self.yti)
+        _st = self.stats['classify']
+        _yfn = self.news_ai.yfn
+        _t0 = time.perf_counter()
+        ml_sentiment._get_classifier()                  # wait for the background preload HERE, not in the collector
+        _st['idle'] += time.perf_counter() - _t0
+        antibot_load_balancer = 0
+        try:
+            while not self._stop.is_set():
+                _t0 = time.perf_counter()
+                _item = self._get(self.class_q)
+                _t1 = time.perf_counter()
+                _st['idle'] += _t1 - _t0
+                if _item is self._EOS:
+                    break
+                item_idx, thint = _item
+                _res = dict(thint=thint, atc=0, awc=0, final_results=None, urlhash=None, mean=None, writes=None, sen_rows=None)
+                if thint == 0.0:
+                    _yfn.kv_defer = []
+                    _yfn.sen_defer = []
+                    try:
+                        if antibot_load_balancer == 0 or item_idx in self.prefetched:     # randomize craw4ai / BS4 scrapers (pre-fetched = C4)
+                            _atc, _awc, _fr = _yfn.artdata_C4_depth3(item_idx, self.sent_ai, self.lmdb_env)
+                        else:
+                            _atc, _awc, _fr = _yfn.artdata_BS4_depth3(item_idx, self.sent_ai, self.lmdb_env)
+                        antibot_load_balancer = random.randint(1, 100) % 2
+                        _res.update(atc=_atc, awc=_awc, final_results=_fr, writes=_yfn.kv_defer, sen_rows=_yfn.sen_defer)
+                        if _fr:
+                            _res['urlhash'] = self.sent_ai.active_urlhash
+                            _res['mean'] = self.sent_ai.sen_acc.urlhash_mean(self.sent_ai.active_urlhash)
+                    except Exception as e:
+                        logging.error( f'{cmi_debug} - Article [ {item_idx} ] classify FAILED: {e}' )
+                    finally:
+                        _yfn.kv_defer = None
+                        _yfn.sen_defer = None
+                _st['busy'] += time.perf_counter() - _t1
+                _st['items'] += 1
+                if not self._put(self.result_q, (item_idx, _res), _st):
+                    self.pending.append((item_idx, _res))      # stopped. join() writes it
+                    break
+        except Exception as e:
+            logging.error( f'{cmi_debug} - Classify stage FAILED: {e}' )
+        self._put(self.result_q, self._EOS, _st)
+        return
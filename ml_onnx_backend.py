@@ -0,0 +1,231 @@
+#! python3
+
+import os
+import json
+import logging
+import argparse
+import time
+import numpy as np
+from pathlib import Path
+
+# ML / NLP section #############################################################
+class onnx_classifier:
+    """
+    ONNX Runtime backend for the HF financial news sentiment classifier
+    Drop-in replacement for transformers.pipeline("sentiment-analysis") on CPU-only hosts
+    - exports the PyTorch model to ONNX ONCE, and caches it on disk
+    - optional dynamic int8 quantization of the exported model (onnx-int8)
+    - serves inference via onnxruntime, no torch import needed once the model is cached
+    - SAME output contract as the HF pipeline:
+        str input    -> [ {'label': str, 'score': float} ]
+        list[] input -> [ {'label': str, 'score': float}, ... ] (1 per text)
+    - exposes .tokenizer (fast tokenizer w/ model_max_length + offsets) like the pipeline does
+    """
+
+    # global accessors
+    model_id = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+    cache_dir = "datastore/onnx/"   # exported ONNX models live here (1 sub dir per model id)
+    opset = 14                      # ONNX opset used for the export
+    args = []                       # class dict to hold global args being passed in from main() methods
+    batch_size = 16                 # default num of texts per onnxruntime forward pass
+    id2label = None                 # model label map, e.g. {0: 'negative', 1: 'neutral', 2: 'positive'}
+    model_path = None               # path to the ONNX model being served
+    quantize = False                # True = serve the dynamic int8 quantized model
+    session = None                  # onnxruntime InferenceSession
+    tokenizer = None                # HF fast tokenizer (same one the pipeline would use)
+    yti = 0
+
+    ######################## init ########################
+    def __init__(self, yti=1, model_id=None, quantize=False, cache_dir=None):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s   Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        self.model_id = model_id or onnx_classifier.model_id
+        self.quantize = quantize
+        self.cache_dir = Path(cache_dir or onnx_classifier.cache_dir) / self.model_id.replace("/", "__")
+        self.model_path = self.cache_dir / ("model.int8.onnx" if self.quantize else "model.onnx")
+
+        if not self.model_path.exists():
+            self.export()
+
+        from transformers import AutoTokenizer
+        import onnxruntime as ort
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.cache_dir)
+        with open(self.cache_dir / "config.json", "r") as _f:
+            _config = json.load(_f)
+        self.id2label = { int(k): v for k, v in _config["id2label"].items() }
+
+        _so = ort.SessionOptions()
+        _so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(str(self.model_path), sess_options=_so, providers=["CPUExecutionProvider"])
+        self._input_names = { i.name for i in self.session.get_inputs() }
+        logging.info( f'%s - ONNX classifier ready: {self.model_path}' % cmi_debug )
+
+    # #################################### 1
+    def export(self):
+        """
+        One time export of the PyTorch model -> ONNX (+ optional dynamic int8 quantization)
+        Tokenizer + config are saved next to the ONNX model, so later loads dont need torch
+        """
+        cmi_debug = __name__+"::"+self.export.__name__+".#"+str(self.yti)
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        _fp32_path = self.cache_dir / "model.onnx"
+        if not _fp32_path.exists():
+            print ( f"ONNX backend: exporting {self.model_id} -> {_fp32_path} (one time only)..." )
+            logging.info( f'%s - Export PyTorch model -> ONNX: {_fp32_path}' % cmi_debug )
+            tokenizer = AutoTokenizer.from_pretrained(self.model_id)
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_id)
+            model.eval()
+            _sample = tokenizer(["Shares rallied after earnings beat estimates."], return_tensors="pt")
+            with torch.no_grad():
+                torch.onnx.export(
+                    model,
+                    (_sample["input_ids"], _sample["attention_mask"]),
+                    str(_fp32_path),
+                    input_names=["input_ids", "attention_mask"],
+                    output_names=["logits"],
+                    dynamic_axes={
+                        "input_ids": {0: "batch", 1: "seq"},
+                        "attention_mask": {0: "batch", 1: "seq"},
+                        "logits": {0: "batch"}
+                        },
+                    opset_version=self.opset
+                    )
+            tokenizer.save_pretrained(self.cache_dir)
+            model.config.save_pretrained(self.cache_dir)
+
+        if self.quantize and not self.model_path.exists():
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            print ( f"ONNX backend: dynamic int8 quantization -> {self.model_path}..." )
+            logging.info( f'%s - Dynamic int8 quantization: {self.model_path}' % cmi_debug )
+            quantize_dynamic(str(_fp32_path), str(self.model_path), weight_type=QuantType.QInt8)
+
+        return
+
+    # #################################### 2
+    def __call__(self, inputs, truncation=True, batch_size=None, **kwargs):
+        """
+        Classify 1 text or a list[] of texts. Output contract = HF sentiment-analysis pipeline
+        Texts are length sorted before batching (less padding), results are returned in input order
+        """
+        _single = isinstance(inputs, str)
+        _texts = [inputs] if _single else list(inputs)
+        _bs = int(batch_size or self.batch_size)
+        _results = [None] * len(_texts)
+        _order = sorted(range(len(_texts)), key=lambda i: len(_texts[i]))
+
+        for b in range(0, len(_order), _bs):
+            _idx = _order[b:b+_bs]
+            _enc = self.tokenizer(
+                [ _texts[i] for i in _idx ],
+                truncation=truncation,
+                max_length=self.tokenizer.model_max_length,
+                padding=True,
+                return_tensors="np"
+                )
+            _feed = { k: v.astype(np.int64) for k, v in _enc.items() if k in self._input_names }
+            logits = self.session.run(["logits"], _feed)[0]
+            logits = logits - logits.max(axis=1, keepdims=True)    # stable softmax
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+            for row, i in enumerate(_idx):
+                _l = int(probs[row].argmax())
+                _results[i] = { 'label': self.id2label[_l], 'score': float(probs[row][_l]) }
+
+        if _single:
+            return [_results[0]]
+        return _results
+
+# ############################################################################
+# Parity check : ONNX backend vs. PyTorch pipeline on a fixed corpus
+# ############################################################################
+PARITY_CORPUS = [
+    "Shares surged 12% after the company reported record quarterly revenue and raised full-year guidance.",
+    "The company missed analyst estimates and cut its outlook, sending the stock sharply lower.",
+    "The board declared a regular quarterly dividend of $0.24 per share, payable next month.",
+    "Regulators opened an investigation into the bank's lending practices.",
+    "Operating margin expanded for the third consecutive quarter on lower input costs.",
+    "The retailer will close 150 stores and cut 2,000 jobs as sales continue to decline.",
+    "The annual shareholder meeting will be held on June 4 in Austin, Texas.",
+    "Net loss widened to $85 million as research spending doubled.",
+    "Analysts upgraded the stock to buy, citing strong demand for its data center chips.",
+    "The merger was terminated after the parties failed to secure antitrust approval.",
+    "Revenue was flat year over year at $1.2 billion.",
+    "The company completed its previously announced acquisition of a software startup.",
+    "Credit rating agencies downgraded the issuer to junk status amid rising debt levels.",
+    "Free cash flow rose 40% allowing the company to accelerate share buybacks.",
+    "The chief executive will step down at the end of the year, the company said.",
+    "Oil prices slumped as inventories rose more than expected.",
+    "Bookings hit an all-time high, and management expects the momentum to continue.",
+    "The drug failed to meet its primary endpoint in a late-stage trial.",
+    "The firm reiterated its full-year forecast and said trends are in line with expectations.",
+    "Investors cheered the surprise profit, pushing shares to a 52-week high.",
+    ]
+
+def parity_check(backend, corpus=None, batch_size=8):
+    """
+    Compare an ONNX backend against the PyTorch HF pipeline labels on a fixed corpus
+    Returns a dict{} report: agree rate, mismatched rows, max score delta, timings
+    """
+    cmi_debug = __name__+"::"+parity_check.__name__
+    from transformers import pipeline
+    corpus = corpus or PARITY_CORPUS
+
+    logging.info( f'%s - Build PyTorch reference pipeline...' % cmi_debug )
+    _ref = pipeline(task="sentiment-analysis", model=backend.model_id)
+
+    t0 = time.perf_counter()
+    ref_out = _ref(corpus, truncation=True, batch_size=batch_size)
+    t1 = time.perf_counter()
+    onx_out = backend(corpus, truncation=True, batch_size=batch_size)
+    t2 = time.perf_counter()
+
+    mismatch = []
+    max_delta = 0.0
+    for i, (r, o) in enumerate(zip(ref_out, onx_out)):
+        if r['label'] != o['label']:
+            mismatch.append((i, r['label'], o['label']))
+        else:
+            max_delta = max(max_delta, abs(r['score'] - o['score']))
+
+    return {
+        'rows': len(corpus),
+        'agree': (len(corpus) - len(mismatch)) / len(corpus),
+        'mismatch': mismatch,
+        'max_score_delta': max_delta,
+        'torch_secs': t1 - t0,
+        'onnx_secs': t2 - t1
+        }
+
+def main():
+    parser = argparse.ArgumentParser(prog="ml_onnx_backend", description="ONNX classifier backend: export + parity check vs. PyTorch")
+    parser.add_argument('--int8', help='use the dynamic int8 quantized model', action='store_true', dest='bool_int8', required=False, default=False)
+    parser.add_argument('--min-agree', help='min label agreement rate to pass (0.0 - 1.0)', action='store', type=float, dest='min_agree', required=False, default=1.0)
+    parser.add_argument('-v','--verbose', help='verbose error logging', action='store_true', dest='bool_verbose', required=False, default=False)
+    args = vars(parser.parse_args())
+
+    logging.basicConfig(level=logging.INFO if args['bool_verbose'] else logging.WARNING)
+    backend = onnx_classifier(1, quantize=args['bool_int8'])
+    report = parity_check(backend)
+
+    print ( f"ONNX backend:     {backend.model_path}" )
+    print ( f"Corpus rows:      {report['rows']}" )
+    print ( f"Label agreement:  {report['agree']:.1%}  (min: {args['min_agree']:.1%})" )
+    print ( f"Max score delta:  {report['max_score_delta']:.5f}  (agreeing rows)" )
+    print ( f"PyTorch time:     {report['torch_secs']:.3f} secs" )
+    print ( f"ONNX time:        {report['onnx_secs']:.3f} secs" )
+    for i, r_label, o_label in report['mismatch']:
+        print ( f"MISMATCH row {i:02}: torch={r_label} / onnx={o_label} : {PARITY_CORPUS[i]}" )
+
+    if report['agree'] < args['min_agree']:
+        print ( "Parity check: FAILED" )
+        return 1
+    print ( "Parity check: PASSED" )
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
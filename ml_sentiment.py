@@ -7,14 +7,104 @@ import re
 import logging
 import threading
 from rich import print
-import base64
+import hashlib
+import unicodedata
 import zstandard as zstd
 
 from ml_cvbow import ml_cvbow
+from datastore_codec_LMDB import pack_text
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
 # ML / NLP section #############################################################
+class sent_accumulator:
+    """
+    Append-only columnar buffer of per-chunk sentiment rows
+    Replaces the old 1-row DataFrame + pd.concat() per chunk (quadratic copies on big runs)
+    - 1 preallocated numpy array per column, grown geometrically (x2) when full
+    - sen_df0 DataFrame is only materialized on demand (cached until the next append)
+    - per-urlhash row index gives O(1) access to 1 articles chunks
+    """
+
+    # global accessors
+    columns = [ 'Row', 'Symbol', 'art', 'urlhash', 'chk', 'rnk', 'snt' ]
+    _dtypes = {
+        'Row': np.int64,
+        'Symbol': object,
+        'art': object,
+        'urlhash': object,
+        'chk': object,
+        'rnk': np.float64,
+        'snt': object
+        }
+
+    ######################## init ########################
+    def __init__(self, capacity=256):
+        self.rows = 0                   # num of rows appended
+        self.grows = 0                  # num of geometric re-allocations
+        self._cap = max(int(capacity), 1)
+        self._cols = { c: np.empty(self._cap, dtype=t) for c, t in self._dtypes.items() }
+        self._uh_index = dict()         # urlhash -> list[] of row positions
+        self._df = None                 # materialized DataFrame cache
+
+    def __len__(self):
+        return self.rows
+
+    # #################################### 1
+    def append(self, row, sym, art, urlhash, chk, rnk, snt):
+        """Append 1 sentiment chunk row. Amortized O(1)"""
+        if self.rows == self._cap:      # full: grow geometrically
+            self._cap *= 2
+            for c, col in self._cols.items():
+                _new = np.empty(self._cap, dtype=col.dtype)
+                _new[:self.rows] = col[:self.rows]
+                self._cols[c] = _new
+            self.grows += 1
+
+        i = self.rows
+        self._cols['Row'][i] = row
+        self._cols['Symbol'][i] = sym
+        self._cols['art'][i] = art
+        self._cols['urlhash'][i] = urlhash
+        self._cols['chk'][i] = chk
+        self._cols['rnk'][i] = rnk
+        self._cols['snt'][i] = snt
+        self._uh_index.setdefault(urlhash, []).append(i)
+        self.rows += 1
+        self._df = None                 # invalidate materialized DF
+        return
+
+    # #################################### 2
+    def to_df(self):
+        """Materialize (and cache) the sen_df0 DataFrame. index = Row (same shape as the old concat DF)"""
+        if self._df is None:
+            n = self.rows
+            self._df = pd.DataFrame({ c: self._cols[c][:n].copy() for c in self.columns }, index=self._cols['Row'][:n].copy())
+        return self._df
+
+    # #################################### 3
+    def urlhash_view(self, urlhash):
+        """O(1) columnar view of all chunk rows for 1 article. dict{} of column -> list[]"""
+        _idx = self._uh_index.get(urlhash, [])
+        return { c: self._cols[c][_idx].tolist() for c in self.columns }
+
+    # #################################### 4
+    def urlhash_mean(self, urlhash):
+        """
+        Mean rank per sentiment label for 1 article
+        Same result as sen_df0.loc[sen_df0['urlhash'] == urlhash].groupby('snt')['rnk'].mean()
+        """
+        _sums = dict()
+        _cnts = dict()
+        for i in self._uh_index.get(urlhash, []):
+            _s = self._cols['snt'][i]
+            _sums[_s] = _sums.get(_s, 0.0) + self._cols['rnk'][i]
+            _cnts[_s] = _cnts.get(_s, 0) + 1
+
+        _labels = sorted(_sums)         # groupby() sorts the group keys
+        _means = pd.Series([ _sums[k] / _cnts[k] for k in _labels ], index=pd.Index(_labels, name='snt'), name='rnk', dtype=np.float64)
+        return _means
+
 class ml_sentiment:
     """
     Class to manage the Global Database of NLP Sentiment data
@@ -27,7 +117,18 @@ class ml_sentiment:
     art_buffer = []         # Buffer to hold article text for processing
     blocket_udid = 0        # working blocklet UID
     chunk_udid = 0          # working chunk UID
+    chunker_mode = "chars"  # blocklet chunker engine: "chars" = tokenizer_mml char windows, "tokens" = real LLM token windows
+    chunk_stride = 0        # token chunker only: num of tokens overlap between consecutive blocklets
     classifier = None       # NLP classidier pipeline - real AI model LLM computation. GPU goes brrrr....!!
+    clsfr_backend = "torch" # classifier backend: "torch" (HF pipeline), "onnx" (onnxruntime fp32), "onnx-int8" (onnxruntime int8)
+    clsfr_model = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"   # HF model id
+    clsfr_batch_size = 16   # default num of blocklets pushed through the LLM pipeline in 1 batched forward pass
+    _clsfr_batch = {}       # pre-computed batch LLM results for this article. Key=chunk_udid, value=[{label, score}]
+    chunk_cache = None      # lmdb_io_eng instance hosting the content addressed chunk sentiment cache (None = disabled)
+    ccache_hit = 0          # chunk cache HITS (blocklet sentiment re-used, no LLM call)
+    ccache_miss = 0         # chunk cache MISSES (blocklet sent to the LLM)
+    _ccache_udids = set()   # chunk_udids of this article served from the chunk cache
+    _ccache_pending = {}    # new chunk cache entries waiting to be written in the next article KV write txn
     _classifier = None      # optomized singleton (Class attribute) NLP classidier pipeline (class global)
     _load_thread = None         # Track the background initialization worker
     _lock = threading.Lock()    # Thread lock
@@ -41,11 +142,13 @@ class ml_sentiment:
     kv_json_dataset = None  # JSON dataset to be used for kvstore
     kv_rehydrated = 0       # only used when ZERO articles are cached via KV Cache engine
     mlnlp_uh = None         # URL Hinter instance
-    sen_df0 = None          # sentiment for this artile ONLY (gets overwritten each time per article)
+    sen_acc = None          # sent_accumulator{} columnar buffer of ALL sentiment chunk rows. sen_df0 is materialized from it
     sen_cache_eng = 0       # count of article chunks rehydrated from KV cache engine
+    sen_ccache_eng = 0      # count of article chunks re-used from the content addressed chunk cache
     sen_llm_eng = 0         # count of article chunks computed by LLM pipeline engine
+    sen_thash_eng = 0       # count of article chunks cloned from a prior scored article with the SAME text (text hash index)
+    thash_hit = 0           # articles whose text hash matched a prior scored version (no LLM / chunker / vectorizer work)
     sen_df3 = None          # ? unknown - unused ?
-    sen_data = []           # Data to be added to the DataFrame
     sentiment_count = None  # Sentiment counts for this article
     summary_report = {}     # summary report dict for this full stock ticker run
     summary_metrics = {}    # sentiment metrics math results dict supporting final sentiment report
@@ -90,6 +193,14 @@ class ml_sentiment:
         self._cs_count = 0
         self._cp_count = 0
         self._cr_count = 0
+        self._clsfr_batch = dict()
+        self._ccache_udids = set()
+        self._ccache_pending = dict()
+        self.sen_acc = sent_accumulator()
+        self.clsfr_batch_size = int(self.args.get('llm_batch_size') or ml_sentiment.clsfr_batch_size)
+        self.chunker_mode = self.args.get('chunker_mode') or ml_sentiment.chunker_mode
+        self.chunk_stride = int(self.args.get('chunk_stride') or 0)
+        self._tk_enc = (None, None)     # token chunker: (text, encoding) of the last text tokenized
 
         #return      # techncially as Class init does not require a return
 
@@ -111,12 +222,7 @@ class ml_sentiment:
     def _bg_load_worker(cls):
         """The worker method executed by the background thread."""
         try:
-            from transformers import pipeline
-            print ( "Thread initalizer: worker imported HF LLM pipeline module..." )
-            model_pipeline = pipeline(
-                task="sentiment-analysis",
-                model="mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
-            )
+            model_pipeline = cls._build_classifier()
             with cls._lock:
                 cls._classifier = model_pipeline
                 cmi_debug = __name__+"::"+"Thread bg_load_worker"
@@ -140,16 +246,43 @@ class ml_sentiment:
         with cls._lock:
             if cls._classifier is None:
                 cmi_debug = __name__+"::"+"Thread get_classifier"
-                from transformers import pipeline
                 logging.info( f"%s - Main thread: Model pipeline is COLD / forcing import now"  % cmi_debug )
                 #print ( "Main thread: Forcing COLD Transformer pipeline module import NOW..." )
-                cls._classifier = pipeline(
+                cls._classifier = cls._build_classifier()
+            return cls._classifier
+
+    # init class @decorator #4
+    @classmethod
+    def _build_classifier(cls):
+        """
+        Pluggable classifier backend factory (cls.clsfr_backend)
+        - "torch"     : HF transformers pipeline (PyTorch)
+        - "onnx"      : onnxruntime, model exported to ONNX once + cached on disk
+        - "onnx-int8" : onnxruntime, dynamic int8 quantized ONNX model
+        All backends honor the same pipeline contract: [ {'label', 'score'} ] + .tokenizer
+        """
+        cmi_debug = __name__+"::"+"Thread build_classifier"
+        match cls.clsfr_backend:
+            case "onnx" | "onnx-int8":
+                from ml_onnx_backend import onnx_classifier
+                logging.info( f"%s - Build ONNX Runtime classifier backend: {cls.clsfr_backend}" % cmi_debug )
+                print ( f"Thread initalizer: worker building ONNX Runtime backend [ {cls.clsfr_backend} ]..." )
+                return onnx_classifier(1, model_id=cls.clsfr_model, quantize=(cls.clsfr_backend == "onnx-int8"))
+            case _:
+                from transformers import pipeline
+                logging.info( f"%s - Build PyTorch HF pipeline classifier backend" % cmi_debug )
+                print ( "Thread initalizer: worker imported HF LLM pipeline module..." )
+                return pipeline(
                     task="sentiment-analysis",
-                    model="mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+                    model=cls.clsfr_model
                     )
-            return cls._classifier
 
 
+    @property
+    def sen_df0(self):
+        """sentiment chunks DataFrame. Built on demand from the sen_acc columnar buffer"""
+        return self.sen_acc.to_df()
+
     # General class factory methods
     # #################################### 1
     def compute_sentiment(self, symbol, item_idx, scentxt, urlhash, ext):
@@ -189,6 +322,9 @@ class ml_sentiment:
         classifier = self._get_classifier()
         self.tokenizer_mml = classifier.tokenizer.model_max_length
         self.classifier = classifier
+        # token chunker window = real LLM token limit, less the special tokens (<s> </s>) the pipeline adds
+        _special = getattr(classifier.tokenizer, "num_special_tokens_to_add", None)
+        self.token_window = self.tokenizer_mml - (_special() if _special is not None else 2)
 
         self.ttc = 0
         self.twc = 0
@@ -238,19 +374,25 @@ class ml_sentiment:
 
             _zstd_article_blob = self.zstd_text_compressor(scentxt, self.ext_type)       # compress article text into a ZSTD binary blob
             
+            _work_queue = list()    # all blocklet dicts for this article, staged for 1 batched LLM pass
             for i in range(0, len(scentxt)):    # this = 1 b/c C4 sends a list[] of 1 big blob of text
                 logging.info( f"%s - C4 Eval pre-chunker @row: {i:03} / TEXT length: {len(scentxt[i])} chars" % cmi_debug )
                 truncated = "Undef"
-                if len(scentxt[i]) >= self.tokenizer_mml:   # self.tokenizer_mml: only chunk into blocklets on truncation alert
+                if self.chunker_mode == "tokens":
+                    _overflow = self.token_overflow(scentxt[i])         # real LLM token count > token window
+                else:
+                    _overflow = len(scentxt[i]) >= self.tokenizer_mml   # self.tokenizer_mml: only chunk into blocklets on truncation alert
+                if _overflow:
                     truncated = "Truncation!"
                     _dpro_eng = 3                  # C4 + Truncated
-                    logging.info( f"%s - {truncated} Long text blocklet / sending to unfied_chunker.#1..." % cmi_debug )
+                    logging.info( f"%s - {truncated} Long text blocklet / sending to {self.chunker_mode} chunker.#1..." % cmi_debug )
                     blocklet_l = list()
                     blocklet_l.append(scentxt[i])  # stack full article text -> list[]. uified_chunker takes list[] input only
-                    blocklet_d, self.chunk_udid = self.unified_chunker(blocklet_l, self.tokenizer_mml, self.ext_type, self.chunk_udid)   # send list[], result = {} of blocklets
-                    self.ttc, _i_twc, _tr_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # Exec AI NLP classifier inside dict_processor() !!
-                    self.twc += _i_twc
-                    self.cr_package.update(_tr_final_results)  # merge the final results into the cr_package
+                    if self.chunker_mode == "tokens":
+                        blocklet_d, self.chunk_udid = self.token_chunker(blocklet_l, self.token_window, self.ext_type, self.chunk_udid)     # send list[], result = {} of blocklets
+                    else:
+                        blocklet_d, self.chunk_udid = self.unified_chunker(blocklet_l, self.tokenizer_mml, self.ext_type, self.chunk_udid)   # send list[], result = {} of blocklets
+                    _work_queue.append((blocklet_d, _dpro_eng))
                     continue
                 else:
                     truncated = "Clean"     # no need to for unified chunker
@@ -259,11 +401,15 @@ class ml_sentiment:
                     blocklet_d = dict()
                     blocklet_d.update({self.chunk_udid: scentxt[i]})    # create 1 row dict for dict_processor() for NATURAL short/clean text blocklet
                     self.chunk_udid += 1
-                    self.ttc, _i_twc, _cl_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # send dict{}, Exec AI NLP classifier inside dict_processor() !!
-                    self.twc += _i_twc
-                    self.cr_package.update(_cl_final_results)  # merge the final results into the cr_package
+                    _work_queue.append((blocklet_d, _dpro_eng))
                     continue
 
+            self.batch_classifier(_work_queue)      # Exec AI NLP classifier NOW. All blocklets in batched forward passes !!
+            for blocklet_d, _dpro_eng in _work_queue:
+                self.ttc, _i_twc, _x_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # consumes batched LLM results inside dict_processor()
+                self.twc += _i_twc
+                self.cr_package.update(_x_final_results)  # merge the final results into the cr_package
+
             self.cr_package.update({'zstd_blob': _zstd_article_blob})  # merge the ZSTD compressed binary blob into the _x_cr_package dict
             self.blocket_udid = 0   # after this entire article is processed, reset the blocklet counter
             return self.ttc, self.twc, self.cr_package
@@ -293,19 +439,25 @@ class ml_sentiment:
 
             _zstd_article_blob = self.zstd_text_compressor(scentxt, self.ext_type)    # compress article text into a ZSTD binary blob
 
+            _work_queue = list()    # all blocklet dicts for this article, staged for 1 batched LLM pass
             for i in range(0, len(scentxt)):    # this = num of rows of <p> tag text
                 logging.info( f"%s - BS4 Eval pre-chunker @row: {i:03} / TEXT length: {len(scentxt[i].text)} chars" % cmi_debug )   # cycle through all scentenses/paragraphs sent to us
                 truncated = "Undef"
-                if len(scentxt[i].text) > self.tokenizer_mml:      # only chunk into blocklets on truncation altert
+                if self.chunker_mode == "tokens":
+                    _overflow = self.token_overflow(scentxt[i].text)        # real LLM token count > token window
+                else:
+                    _overflow = len(scentxt[i].text) > self.tokenizer_mml   # only chunk into blocklets on truncation altert
+                if _overflow:
                     truncated = "Truncation!"
                     _dpro_eng = 1   # BS4 + Truncated
-                    logging.info( f"%s - {truncated} Long text blocklet / send LIST to unfied_chunker.#1..." % cmi_debug )
+                    logging.info( f"%s - {truncated} Long text blocklet / send LIST to {self.chunker_mode} chunker.#1..." % cmi_debug )
                     blocklet_l = list()
                     blocklet_l.append(scentxt[i].text) # create 1 row list[], extracting <p> text (from html.element) for dict_processor() ( needs chunking)
-                    blocklet_d, self.chunk_udid = self.unified_chunker(blocklet_l, self.tokenizer_mml, self.ext_type, self.chunk_udid)   # send = list[], result = {} of chunked blocklets
-                    self.ttc, _i_twc, _tr_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # Exec AI NLP classifier inside dict_processor() !!
-                    self.twc += _i_twc 
-                    self.cr_package.update(_tr_final_results)  # merge the final results into the cr_package
+                    if self.chunker_mode == "tokens":
+                        blocklet_d, self.chunk_udid = self.token_chunker(blocklet_l, self.token_window, self.ext_type, self.chunk_udid)     # send = list[], result = {} of chunked blocklets
+                    else:
+                        blocklet_d, self.chunk_udid = self.unified_chunker(blocklet_l, self.tokenizer_mml, self.ext_type, self.chunk_udid)   # send = list[], result = {} of chunked blocklets
+                    _work_queue.append((blocklet_d, _dpro_eng))
                     continue
                 else:
                     truncated = "Clean"     # no need for unified chunker
@@ -314,10 +466,14 @@ class ml_sentiment:
                     blocklet_d = dict()
                     blocklet_d.update({self.chunk_udid: scentxt[i].text}) # create 1 row dict for dict_processor() (ths is a short/clean <p>) text blocklet
                     self.chunk_udid += 1
-                    self.ttc, _i_twc, _cl_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # send dict{}, Exec AI NLP classifier inside dict_processor() !!
-                    self.twc += _i_twc
-                    self.cr_package.update(_cl_final_results)  # merge the final results into the cr_package
+                    _work_queue.append((blocklet_d, _dpro_eng))
                     continue
+
+            self.batch_classifier(_work_queue)      # Exec AI NLP classifier NOW. All <p> blocklets in batched forward passes !!
+            for blocklet_d, _dpro_eng in _work_queue:
+                self.ttc, _i_twc, _x_final_results, self.blocket_udid = self.dict_processor(symbol, blocklet_d, _dpro_eng, self.blocket_udid)    # consumes batched LLM results inside dict_processor()
+                self.twc += _i_twc
+                self.cr_package.update(_x_final_results)  # merge the final results into the cr_package
     
             self.cr_package.update({'zstd_blob': _zstd_article_blob})  # merge the ZSTD compressed binary blob into the _x_cr_package dict
             self.blocket_udid = 0   # after this entire article is processed, reset the blocklet counter
@@ -412,6 +568,140 @@ class ml_sentiment:
 
         return chunks, self.chunk_index   # {} of perfect blockelts < tokenizer_mml
     
+    # #################################### 2.1
+    # Helper function
+    def token_overflow(self, text):
+        """
+        Token chunker helper
+        True if text holds more real LLM tokens than the token window (i.e. the LLM would truncate it)
+        The encoding is kept, so token_chunker() doesnt have to tokenize the same text twice
+        """
+        _enc = self.classifier.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        self._tk_enc = (text, _enc)
+        return len(_enc['input_ids']) > self.token_window
+
+    # #################################### 2.2
+    # Helper function
+    def token_chunker(self, st_list, token_window, _ext_type, _curr_chunk_udid):
+        """
+        Token aware chunker
+        Alternative to unified_chunker() - selected by args['chunker_mode'] = "tokens"
+        unified_chunker() cuts at tokenizer_mml CHARS, but the LLM limit is tokenizer_mml TOKENS.
+        i.e. a char window only fills ~1/4 of the models context = 3-4x more LLM forward passes than needed
+
+        - Uses the LLM tokenizer char offsets to pack each blocklet up to token_window real tokens
+        - Cuts on a scentence boundary (. ! ?) when one exists in the back half of the window
+        - else cuts on the last word boundary (doesnt split a word)
+        - optional chunk_stride = num of tokens overlap carried into the next blocklet
+
+        WARN:
+        Input MUST be a list [ ] (same contract as unified_chunker)
+        Ouput IS a dict { } of {chunk_udid: blocklet text}, plus the next chunk_udid
+        """
+        cmi_debug = __name__+"::"+self.token_chunker.__name__+".#"+str(self.yti)
+        ext_type_decode = {
+            0: "C4_extr",
+            1: "BS4_extr"
+        }
+
+        self.chunk_index = _curr_chunk_udid     # sub-dict key
+        if not st_list:     # empty
+            return {}, self.chunk_index
+
+        text = st_list[0]
+        if self._tk_enc[0] == text:             # already tokenized by token_overflow()
+            _enc = self._tk_enc[1]
+        else:
+            _enc = self.classifier.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        offs = _enc['offset_mapping']
+        abs_ttoks = len(offs)
+        logging.info( f"%s   - Start {ext_type_decode.get(_ext_type, 'Unknown')} token chunker - tokens: {abs_ttoks} @ window: {token_window} / stride: {self.chunk_stride}" % cmi_debug )
+
+        chunks = {}         # dict holds the final output. Key=0...n, value="blocklet of text < token_window tokens"
+        start = 0           # token positional indexers
+        while start < abs_ttoks:
+            end = min(start + token_window, abs_ttoks)     # exclusive token index
+            cut = end
+            if end < abs_ttoks:
+                # a boundary @ j means: whitespace gap between token j-1 and token j
+                _floor = start + (token_window // 2)
+                _word_cut = None
+                for j in range(end, start, -1):
+                    if offs[j][0] > offs[j-1][1]:          # whitespace gap = word boundary
+                        if _word_cut is None:
+                            _word_cut = j
+                        if text[offs[j-1][1]-1] in ".!?":   # scentence boundary
+                            cut = j
+                            break
+                    if j <= _floor and _word_cut is not None:
+                        cut = _word_cut                     # no scentence end in back half of window
+                        break
+                else:
+                    if _word_cut is not None:
+                        cut = _word_cut
+
+            blocklet = text[offs[start][0]:offs[cut-1][1]]
+            if blocklet:
+                chunks[self.chunk_index] = blocklet
+                logging.info( f"%s - Eng.#T Blocklet: {self.chunk_index:03} Contains:  {cut-start:03} tokens / {len(blocklet):03} chars @ token [ {start:04} -> {cut:04} ] / remaining [ {abs_ttoks-cut:04} ] tokens" % cmi_debug )
+                self.chunk_index += 1
+
+            if cut >= abs_ttoks:
+                break
+            _next = cut - self.chunk_stride if self.chunk_stride > 0 else cut
+            if _next <= start:                      # stride must never stall the chunker
+                _next = cut
+            while _next < cut and offs[_next][0] <= offs[_next-1][1]:
+                _next += 1                          # overlap starts on a word boundary
+            start = _next
+
+        self._tk_enc = (None, None)
+        return chunks, self.chunk_index   # {} of perfect blockelts < token_window
+
+    # #################################### 1.1
+    def clone_sentiment(self, symbol, item_idx, scentxt, urlhash, ext, record):
+        """
+        Text hash HIT : same article text was already scored (under another urlhash / symbol, or a record we lost)
+        - clones the prior records chunk scores for this article. NO chunker / vectorizer / LLM work
+        - rehydrates sen_df0 + sentiment_count exactly like the LLM path does (engine_id 3 = text hash clone)
+        - the text blob is re-compressed from scentxt. The prior records text value is not read
+        RETURNS: same shape as compute_sentiment() -> ttc, twc, cr_package
+        """
+        self.yti = item_idx
+        self.item_idx = item_idx
+        self.active_urlhash = urlhash
+        self.ext_type = ext
+        cmi_debug = __name__+"::"+self.clone_sentiment.__name__+".#"+str(self.yti)
+        self.sentiment_count["positive"] = 0
+        self.sentiment_count["negative"] = 0
+        self.sentiment_count["neutral"] = 0
+        self.cr_package = dict()
+        _ttc = 0
+        for _k, _v in record.items():
+            if _k == 'zstd_blob':
+                continue
+            if isinstance(_v, dict):
+                _v = dict(_v, symbol=symbol)
+                _ttc += int(_v.get('tokenz', 0))
+                sen_package = dict(sym=symbol,
+                                   urlhash=urlhash,
+                                   article=item_idx,
+                                   chunk=_v['chunk'],
+                                   sent=_v['sent_type'],
+                                   rank=_v['sent_score'] )
+                self.save_sentiment_df(item_idx, sen_package, 3)    # 3 = text hash clone did this work !
+                self.sentiment_count[_v['sent_type']] += 1
+            self.cr_package[_k] = _v
+        self.cr_package.update({ 'urlhash': urlhash, 'article': item_idx })
+        self.cr_package.update({ 'zstd_blob': self.zstd_text_compressor(scentxt, ext) })
+        self.kv_json_dataset = self.cr_package
+        self.ttc = int(record.get('total_tokens') or _ttc)
+        self.twc = int(record.get('total_words') or 0)
+        _saved = sum(self.sentiment_count.values())
+        self.thash_hit += 1
+        logging.info( f"%s - Text hash clone: {_saved} chunk scores re-used / LLM calls saved" % cmi_debug )
+        return self.ttc, self.twc, self.cr_package
+
     # #################################### 3
     # LLM Helper function
     def dict_processor(self, symbol, _text_dict, _dpro_eng, _blocklet_udid):
@@ -422,6 +712,7 @@ class ml_sentiment:
         - truncated due to being longer than the hard-coded LLM truncation limit window
         -  clean... shorter than the LLM truncation limit window
         - It executes the LLM NLP Classifier pipeline on each blocklet within the full input dict
+        - unless batch_classifier() already computed the blocklet in a batched forward pass (the normal path)
         
         WARN: can only intake a dict {} of text blocklets
         - The UNIFEID_CHUNKER prepares chunks into a nice dict {} of blocklets
@@ -478,7 +769,9 @@ class ml_sentiment:
             # THIS IS THE HEAVY LIFTING - LLM CLASSIFIER PIPELINE #
             #######################################################
             #
-            clsfr_result = self.classifier(chunk, truncation=True)      # LLM sentimewnt classifier NOW !!!
+            clsfr_result = self._clsfr_batch.pop(_chunk_udid, None)     # batched LLM result (pre-computed by batch_classifier)
+            if clsfr_result is None:
+                clsfr_result = self.classifier(chunk, truncation=True)  # LLM sentimewnt classifier NOW !!! (un-batched fallback)
             #
             #print (f"DP-chunk: {_chunk_udid:03} ({clsfr_result[0]['score']}) ", end="" )
             #print ( f"##-@320: CHUNK: {_chunk_udid:03}  {dpro_eng_decode.get(_dpro_eng, 'Unknown')}\n{chunk}" )
@@ -526,7 +819,8 @@ class ml_sentiment:
                 print ( f"Chunk: {_chunk_udid:03} / Type: {self._chunk_type} / Words: {tnc:03} / tokenz: {len(ngram_tkzed):03} / alphas: {len(chunk):03} ", end="" )
 
             _this_chunk = f'{_chunk_udid:03}'     # format chunk
-            _ec = self.nlp_sent_engine(_this_chunk, symbol, ngram_tkzed, ngram_count, clsfr_result[0], _x_cr_package)
+            _engine_id = 2 if _chunk_udid in self._ccache_udids else 1     # 2 = chunk cache / 1 = LLM pipeline
+            _ec = self.nlp_sent_engine(_this_chunk, symbol, ngram_tkzed, ngram_count, clsfr_result[0], _x_cr_package, _engine_id)
             match _ec:
                 case 0:
                     # merge this single row dict dataset with JSON dataset for this article
@@ -548,9 +842,104 @@ class ml_sentiment:
                     print ("Unknown LLM/Vect error!")
         return ttc, tnc, _x_cr_package, self.element_udid
 
+    # #################################### 3.1
+    # LLM Helper function
+    def batch_classifier(self, _work_queue):
+        '''
+        Batched LLM inference engine
+        - Executes the LLM NLP Classifier pipeline ONCE over every blocklet of the article
+        - Input is a list[] of (blocklet dict{}, _dpro_eng) tuples staged by compute_sentiment()
+        - The HF pipeline receives 1 list[] of texts and runs them in forward passes of clsfr_batch_size
+        - Results are parked in self._clsfr_batch{} keyed by chunk_udid, where dict_processor() picks them up
+        - The per-chunk _x_cr_package / save_sentiment_df() bookkeeping in dict_processor() is unchanged
+
+        INFO: a work queue can hold blocklets from multiple articles, as long as chunk_udid keys dont collide
+        WARN: Heavy CPU / GPU utilization will be triggered NOW !
+        '''
+        cmi_debug = __name__+"::"+self.batch_classifier.__name__+".#"+str(self.yti)
+        _udids = []
+        _texts = []
+        for blocklet_d, _dpro_eng in _work_queue:
+            for _chunk_udid, chunk in blocklet_d.items():
+                _udids.append(_chunk_udid)
+                _texts.append(chunk)
+
+        self._clsfr_batch = dict()
+        self._ccache_udids = set()
+        if not _texts:
+            return 0
+
+        # Content addressed chunk cache : re-use sentiment of any blocklet text seen before (any ticker / any URL)
+        _keys = [ self.ccache_key(t) for t in _texts ]
+        _hits = self.chunk_cache.ccache_get(_keys) if self.chunk_cache is not None else {}
+        _miss = dict()          # unique miss key -> text (identical blocklets only go to the LLM once)
+        for _chunk_udid, _k, _t in zip(_udids, _keys, _texts):
+            if _k in _hits:
+                _label, _score = _hits[_k]
+                self._clsfr_batch[_chunk_udid] = [{ 'label': _label, 'score': _score }]
+                self._ccache_udids.add(_chunk_udid)
+            else:
+                _miss.setdefault(_k, _t)
+        self.ccache_miss += len(_miss)                  # 1 miss per unique text. Repeats in this batch re-use its LLM result
+        self.ccache_hit += len(_texts) - len(_miss)
+
+        if _miss:
+            _m_keys = list(_miss)
+            _m_texts = list(_miss.values())
+            logging.info( f"%s - ======== Exec batched LLM classifier: {len(_m_texts)} blocklets @ batch_size: {self.clsfr_batch_size} / chunk cache hits: {len(_texts)-len(_m_texts)} ========" % cmi_debug )
+            _results = self.classifier(_m_texts, truncation=True, batch_size=self.clsfr_batch_size)     # LLM sentimewnt classifier NOW !!!
+            _by_key = dict()
+            for _k, _r in zip(_m_keys, _results):
+                # single text input returns [ {label, score} ], list input returns 1 {label, score} per text
+                # normalize to the single input shape that dict_processor() + nlp_sent_engine() expect
+                _r = _r if isinstance(_r, list) else [_r]
+                _by_key[_k] = _r
+                self._ccache_pending[_k] = (_r[0]['label'], float(_r[0]['score']))
+            for _chunk_udid, _k in zip(_udids, _keys):
+                if _chunk_udid not in self._clsfr_batch:
+                    self._clsfr_batch[_chunk_udid] = _by_key[_k]
+
+        return len(_miss)
+
+    # #################################### 3.2
+    # Helper function
+    def ccache_key(self, text):
+        '''
+        Content addressed chunk cache KEY = sha256( normalized blocklet text + model id + backend )
+        - normalize = unicode NFC + collapse all whitespace runs
+        - backend is part of the key b/c int8 quantized scores are not identical to fp32 scores
+        '''
+        _norm = " ".join(unicodedata.normalize("NFC", text).split())
+        _model = f"{self.clsfr_model}|{self.clsfr_backend}"
+        return hashlib.sha256(f"{_norm}\x00{_model}".encode('utf-8')).digest()
+
+    # #################################### 3.3
+    # Helper function
+    def ccache_drain(self):
+        '''
+        Hand over (and reset) the new chunk cache entries computed since the last article KV write
+        called by the artdata_*_depth3() LMDB writers, inside their RW txn
+        '''
+        _pending = self._ccache_pending
+        self._ccache_pending = dict()
+        return _pending
+
+    # #################################### 3.4
+    # Helper function
+    def text_hash(self, scentxt, ext):
+        '''
+        Article TEXT hash = sha256( cleaned article text + extractor + chunker settings + model id + backend )
+        - scentxt is the same input compute_sentiment() gets (BS4 <p> tags or the C4 text blob list[])
+        - each row is normalized like ccache_key(). Row boundaries are kept (BS4 chunks per <p> row)
+        - chunker + extractor are part of the key b/c they decide the blocklets, i.e. the chunk scores we would clone
+        '''
+        _rows = [ " ".join(unicodedata.normalize("NFC", (_r.text if ext == 1 else _r) or "").split()) for _r in scentxt ]
+        _cfg = f"{ext}|{self.chunker_mode}|{self.chunk_stride}|{self.clsfr_model}|{self.clsfr_backend}"
+        return hashlib.sha256(("\x1e".join(_rows) + "\x00" + _cfg).encode('utf-8')).digest()
+
     # #################################### 4
     # LLM Helper function for dict_processor()
-    def nlp_sent_engine(self, _this_chunk, symbol, ngram_tkzed, ngram_count, _clsfr_result, _z_cr_package):
+    def nlp_sent_engine(self, _this_chunk, symbol, ngram_tkzed, ngram_count, _clsfr_result, _z_cr_package, _engine_id=1):
         """
         - Computes sentimnent SCORES !!!
         RETURN codoes: 0, 1, 2, 3
@@ -598,7 +987,7 @@ class ml_sentiment:
                                sent=sen_result['label'],
                                rank=raw_score )
             
-            self.engine_id = 1      # LLM pipeline did this work !
+            self.engine_id = _engine_id     # 1 = LLM pipeline did this work ! / 2 = chunk cache did
             self.save_sentiment_df(self.item_idx, sen_package, self.engine_id)      # page, data
             self.sentiment_count[sen_result['label']] += 1  # count sentiment type
             # INFO: sentiment_count{ 'positive': 0, 'negative': 0, 'neutral': 0 }
@@ -618,7 +1007,7 @@ class ml_sentiment:
     # #################################### 5
     def save_sentiment_df(self, item_idx, data_set, engine_id):
         """
-        Save key ML sentiment info to global sentimennt in-memory Dataframe
+        Save key ML sentiment info to global sentimennt in-memory columnar buffer (sen_acc -> sen_df0)
         data_set = a dict - i.e. sen_package{}
         
         The method can be called from...
@@ -637,25 +1026,22 @@ class ml_sentiment:
         rnk = data_set["rank"]
         snt = data_set["sent"]
 
-        # sen_package = dict(sym=symbol, article=item_idx, chunk=i, sent=sen_result['label'], rank=raw_score )
-        self.sen_data = [[ \
-                    x, \
-                    sym, \
-                    art, \
-                    urlhash, \
-                    chk, \
-                    rnk, \
-                    snt ]]
-
         if engine_id == 0:
             self.sen_cache_eng += 1
             
         if engine_id == 1:
             self.sen_llm_eng += 1
+
+        if engine_id == 2:
+            self.sen_ccache_eng += 1
+
+        if engine_id == 3:
+            self.sen_thash_eng += 1
             
-        self.df0_row = pd.DataFrame(self.sen_data, columns=[ 'Row', 'Symbol', 'art', 'urlhash', 'chk', 'rnk', 'snt' ], index=[x] )
-        # Grow sen_df0 DF (adding to it a new row) i.e. 1 chunk data row of this article's sentiment metrics
-        self.sen_df0 = pd.concat([self.sen_df0, self.df0_row])
+        # sen_package = dict(sym=symbol, article=item_idx, chunk=i, sent=sen_result['label'], rank=raw_score )
+        # Grow the columnar buffer (append 1 row) i.e. 1 chunk data row of this article's sentiment metrics
+        # sen_df0 DF is only built when someone asks for it
+        self.sen_acc.append(x, sym, art, urlhash, chk, rnk, snt)
         self.df0_row_count = x      # +1 more sentiment chunk row
         logging.info( f"%s - Saved sent metrics -> DF for article: {item_idx} / chunk: {chk:03} / {snt} / score: {rnk}" % cmi_debug )
         return
@@ -948,19 +1334,10 @@ class ml_sentiment:
         - C4 sends a list of 1 big blob of http striped text (all <p> tag text combined into 1 big blob)
         - BS4 sends a list of rows of individual <p> tags html element text (needs careful pre-processing)
         
-        WARNING:
-        Iitial v1.0 template implementation...
-        - v1 LMDB storage archietcure is inefficent. Ccontains hidden bloat.
-        
-        TODO: v2 archiettcure design
-        1. Dont use Base64 JSON encoding. It adds a 33% overhead in size.
-        2. Use msgpack() raw binary packing of ZSTD compressed text binary blob into LMDB
-        3. Force LMBD into raw binary storage mode for the ZSTD blob data (raw=True)
-        4. Use "Minified" dict key strategy in the _cr_package dict. Avoid "Key Name Tax", reduce size of JSON package
-        5. Convert urlhash into 32 raw bytes <bytes.fromhex()> instead of 64-char hex string. Lean efficent storage +  faster lookups
-        
-        migrate _cr_package dict and LMDB to the above.
-        -It is Lean, more efficient, faster encoding, fast lookups, more scalable.
+        v2 LMDB record format (see datastore_codec_LMDB.py)
+        - returns a v3 text value : header (zstd dict id) + RAW zstd bytes. No Base64 (33% overhead)
+        - the record is msgpack packed w/ minified keys + 32 byte binary urlhash by encode_record()
+        - v1 records (JSON + Base64 blob) are still readable, and migrated by dump_db.py --migrate
         """
         cmi_debug = __name__+"::" + self.zstd_text_compressor.__name__+".#"+str(_extractor)
         logging.info( f"%s - article text compressor..." % cmi_debug )
@@ -969,13 +1346,11 @@ class ml_sentiment:
             # C4 sends a list of 1 big blob of text (all <p> tags text combined into 1 big blob)
             # print ( f"ARTICLE_STARTS_HERE: {scentxt[0]}")     # for debugging...
             _source_data = scentxt[0].encode('utf-8')   # prepare byte stream for ZSTD compressor
-            _compressor = zstd.ZstdCompressor(level=3)
-            _compressed_C4_bytes = _compressor.compress(_source_data)
+            _compressed_C4_bytes = self.text_compress(_source_data)     # v3 text value. Uses the trained zstd dict (if any)
             _perctg_compressed = len(_compressed_C4_bytes) / len(_source_data) * 100
-            b64_compressed_C4_blob = base64.b64encode(_compressed_C4_bytes).decode('utf-8')
             logging.info( f"%s - Orig size: {len(_source_data)} bytes / Cmprssd size: {len(_compressed_C4_bytes)} bytes / optz: {_perctg_compressed:.2f} pct" % cmi_debug )
 
-            return b64_compressed_C4_blob
+            return _compressed_C4_bytes
         elif _extractor == 1:    # BS4
             logging.info( f"%s - BS4 ZSTD text compressor engine..." % cmi_debug )
             _blocklets = [" "]
@@ -993,11 +1368,21 @@ class ml_sentiment:
             _final_article = " ".join(_blocklets)
             # print ( f"{_final_article}")      # for debugging...
             _source_data = _final_article.encode('utf-8')   # prepare byte stream for ZSTD compressor
-            _compressor = zstd.ZstdCompressor(level=3)
-            _compressed_BS4_bytes = _compressor.compress(_source_data)
+            _compressed_BS4_bytes = self.text_compress(_source_data)     # v3 text value. Uses the trained zstd dict (if any)
             _perctg_compressed = len(_compressed_BS4_bytes) / len(_source_data) * 100
-            b64_compressed_BS4_blob = base64.b64encode(_compressed_BS4_bytes).decode('utf-8')
             logging.info( f"%s - Orig size: {len(_source_data)} bytes / Cmprssd size: {len(_compressed_BS4_bytes)} bytes / optz: {_perctg_compressed:.2f} pct" % cmi_debug )
-            return b64_compressed_BS4_blob
+            return _compressed_BS4_bytes
 
         return 1
+
+    # #################################### 9.1
+    def text_compress(self, _source_data):
+        """
+        zstd compress 1 article text byte stream
+        - w/ an LMDB attached (chunk_cache) -> the ACTIVE trained zstd dictionary (dump_db.py --train-dict)
+        - no LMDB -> plain level 3 frame
+        returns a v3 text value (dict id header + zstd frame)
+        """
+        if self.chunk_cache is not None:
+            return self.chunk_cache.compress_text(_source_data)
+        return pack_text(zstd.ZstdCompressor(level=3).compress(_source_data), 0)
@@ -8,27 +8,65 @@ from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from glob import escape
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from crawl4ai import LLMConfig
 from crawl4ai import BrowserConfig
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, CrawlResult
+from crawl4ai import CrawlerRunConfig, CacheMode, CrawlResult
 from crawl4ai import JsonCssExtractionStrategy
+from c4_browser_pool import c4_browser_pool
+from composite_score import CompositeScorer
 
 import hashlib
+import httpx
 import json
 import logging
 import numpy as np
 import pandas as pd
 
 from pathlib import Path
+import queue
 import requests
-from requests_html import HTMLSession
 #from rich import print
 #from rich.markup import escape
+import threading
 import time
 from typing import List
 from urllib.parse import urlparse
 
+from datastore_codec_LMDB import encode_article, encode_record
+from netcache_LRU import netcache_lru
+
+try:
+    import lxml         # noqa: F401 - fast C parser for the BS4 article zone parse
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+# Depth 3 BS4 article zones. The ONLY parts of a Yahoo article page we read
+ZONE_BODY = "body yf-v6n2s3"                # full news article <p> zones - locally hosted
+ZONE_PUBTIME = "byline-attr-time-style"     # emperical publish timestamp (<time datetime=...>)
+ZONE_STRAINER = SoupStrainer(attrs={"class": [ZONE_BODY, ZONE_PUBTIME]})
+
+
+def article_zones(_html, parser=None):
+    """
+    Targeted BS4 parse of 1 article page. Only the article body + byline timestamp zones are built into the tree
+    (SoupStrainer), with the lxml parser when installed. Everything else (nav, scripts, ads, JSON blobs) is skipped
+    RETURNS: BeautifulSoup holding just those zones. Same find() / find_all("p") calls as a full page soup
+    """
+    return BeautifulSoup(_html, parser or BS4_PARSER, parse_only=ZONE_STRAINER)
+
+# Incremental depth 0 skim (see skim_mark / skim_watermark)
+SKIM_MARK_MAX = 256         # urlhashes kept in 1 symbols skim watermark (newest first)
+SKIM_MAX_SCROLLS = 20       # incremental skim scroll limit. Stops early at a run of known articles
+SKIM_ITEM_JS = "document.querySelectorAll('section.mainContent section.container div.news-stream ul.stream-items li')"
+
+try:
+    import h2           # noqa: F401 - httpx HTTP/2 support (pip install httpx[http2])
+    HTTP2 = True
+except ImportError:     # HTTP/1.1 keep-alive only
+    HTTP2 = False
+
 # DELETE ME!
 #from datastore_eng_LMDB import lmdb_io_eng
 
@@ -47,17 +85,18 @@ class yfnews_reader:
     args = []               # class dict to hold global args being passed in from main() methods
     article_url = "https://www.default_instance_url.com"
     articles_found = 0
-    articles_crawled = {}
+    articles_crawled = None  # netcache_lru { item_idx: urlhash } articles crawled this run (metadata only)
     cur_dir = None
     cycle = 0               # class thread loop counter
     cx = None
     dateageresolver = None  # singleton class of News Article Age date Resolver()
     dummy_resp0 = None
-    ext_req = None          # HTMLSession request handle
+    ext_req = None          # live session warm-up response (cookie jar)
     extracted_articles = None  # crawl4ai extracted articles
     
     kv_created_C4 = 0       # count new article data CREATED in LMDB KV cache processed by C4 engine
     kv_created_BS4 = 0      # count new article data CREATED in LMDB KV cache processed by BS4 engine
+    kv_defer = None         # list[] = DEFER LMDB article writes to the pipeline collector (see kv_write). None = write NOW
     lmdb_env = None         # Global LMBD instance, opened @ main::newsai_sent
     C4_lmdb_env = None
     BS4_lmdb_env = None
@@ -91,7 +130,11 @@ class yfnews_reader:
     nlp_x = 1
     result_engine = "unknown"  # engine used to extract article data
     sent_ai = None          # GLOBALLY shared handle = prob a very bad idea to do it this way
+    epoch_eng = None        # CompositeScorer. Resolves an articles published_epoch for the LMDB pub_time index (see pub_epoch)
+    sen_defer = None        # list[] = DEFER sen_stats_df rows to the pipeline collector (see sen_stats_add). None = add NOW
     sen_stats_df = None     # Aggregated sentiment stats for this 1 article
+    skim_known = 0          # depth 1 articles skipped as already cached (incremental skim)
+    skim_mark = None        # incremental depth 0 skim watermark dict{ h: [urlhashes], u: [urls] } None = full page skim
     symbol = None           # Unique company symbol
     this_article_url = "https://www.default_interpret_page_url.com"
     url_netloc = None
@@ -105,19 +148,27 @@ class yfnews_reader:
     yfqnews_url = None      # SET by form_endpoint - the URL that is being worked on
     yti = 0                 # Unique instance identifier
 
-    yfn_c4_result = {}      # Crawl4ai extracted data net cache from crawl
+    yfn_c4_result = None    # netcache_lru : Crawl4ai extracted data net cache from crawl (per instance, bounded)
     # key: urlhash
     # value: a nexted sub dict{} with the following keys...
     #       url: durl
-    #       data: self.yfn_crawl_data
-    #       result: result
+    #       data: self.yfn_crawl_data  (extracted content list[] - NOT the CrawlResult)
+    #       success: bool
+    c4_prefetched = None    # set{} of ml_ingest item_idx handed to the concurrent fetch stage
+    c4_reported = None      # set{} of item_idx the fetch stage has put on its out queue
+    _c4_stop = None         # threading.Event -> stops the fetch stage workers
+    _c4_thread = None       # fetch stage event loop thread
                     
-    yfn_jsdb = {}           # database to hold response handle from multiple crawl operations    
+    yfn_jsdb = None         # netcache_lru : net cache of pages read by multiple crawl operations (per instance, bounded)
     # dict structure...
-    #       { aurl_hash: respons_0,
+    #       { aurl_hash:
     #       url: self.yfqnews_url,
-    #       data: self.yfn_crawl_data,
-    #       result: result  }
+    #       data: page HTML text (BS4 get) or self.yfn_crawl_data (depth 0 crawl4ai extraction),
+    #       status: HTTP status code (BS4 get) }
+
+    _http_clients = {}      # { host: httpx.Client } 1 pooled keep-alive HTTP client per host. Process wide
+    _http_warm = {}         # { host: warm-up response } live cookie warm-up is done ONCE per host per run
+    _http_lock = threading.Lock()
 
     yahoo_headers = {
         'authority': 'finance.yahoo.com',
@@ -142,8 +193,16 @@ class yfnews_reader:
         self.nlp_x = int(1)
         self.cycle = int(1)
         self.news_heatmap = dict()
+        self.ml_ingest = dict()        # per instance. Batch mode runs many readers (1 per symbol) at once
+        self.skim_mark = None
+        self.skim_known = int(0)
         self.kv_created_BS4 = int(0)
         self.kv_created_C4 = int(0)
+        _items = self.args.get('netcache_items', None)
+        _bytes = int(self.args.get('netcache_mb', 64) or 64) << 20
+        self.yfn_jsdb = netcache_lru("yfn_jsdb", _items, _bytes)            # bounded per instance net caches
+        self.yfn_c4_result = netcache_lru("yfn_c4_result", _items, _bytes)
+        self.articles_crawled = netcache_lru("articles_crawled", 4096, 1 << 20)
         self.sent_df0 = pd.DataFrame(columns=['Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time'])
         
         # Setup crawl4ai schema path
@@ -163,16 +222,57 @@ class yfnews_reader:
     def init_live_session(self, id_url):
         '''
         A key objetcive acheived here is populating the existing yahoo_headers with live cookies
-        from the live session. This is done by the requests.get() method
+        from the live session. This is done by 1 get() on the hosts pooled HTTP client (once per host per run)
         But, we dont need the response object, so we dont store it
         Thats allready been captured at stored in: self.ext_req object
         '''
         cmi_debug = __name__+"::"+self.init_live_session.__name__+".#"+str(self.yti)
+        _host = urlparse(id_url).netloc
+        _warm = yfnews_reader._http_warm.get(_host)
+        if _warm is not None:                   # cookies already live in this hosts pooled client jar
+            logging.info(f"%s    - Live cookies already warm for: {_host}" % cmi_debug )
+            self.live_resp0 = _warm
+            return self.live_resp0
         logging.info(f"%s    - Force live cookie update via basic get()..." % cmi_debug )
-        self.live_resp0 = requests.get(id_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
+        self.live_resp0 = self.http_client(id_url).get(id_url, headers=self.yahoo_headers, timeout=5 )    # cookies land in the pooled client jar
+        yfnews_reader._http_warm[_host] = self.live_resp0
         logging.info(f"%s    - Saved get() resp {type(self.live_resp0)}" % cmi_debug )
         return self.live_resp0
 
+    # ################ 2.1
+    def http_client(self, _url):
+        """
+        Pooled HTTP client for this URLs host. Created once per host, shared by every yfnews_reader instance
+        - keep-alive connection pool (no TCP + TLS handshake per article), HTTP/2 when h2 is installed
+        - cookie jar persists across requests (live cookie warm-up happens once per run)
+        """
+        _host = urlparse(_url).netloc
+        with yfnews_reader._http_lock:
+            _client = yfnews_reader._http_clients.get(_host)
+            if _client is None:
+                cmi_debug = __name__+"::"+self.http_client.__name__+".#"+str(self.yti)
+                logging.info(f"%s  - New pooled HTTP client for: {_host} / http2: {HTTP2}" % cmi_debug )
+                _client = httpx.Client(
+                    http2=HTTP2,
+                    headers={'user-agent': self.yahoo_headers['user-agent']},
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+                    )
+                yfnews_reader._http_clients[_host] = _client
+            return _client
+
+    # ################ 2.2
+    @classmethod
+    def http_close(cls):
+        """Close every pooled HTTP client (end of run)"""
+        with cls._http_lock:
+            for _client in cls._http_clients.values():
+                _client.close()
+            cls._http_clients = {}
+            cls._http_warm = {}
+        return
+
     # ################ 3
     def update_headers(self, ch):
 
@@ -213,26 +313,29 @@ class yfnews_reader:
         """
         cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)
 
-        js_session = HTMLSession()                  # Create a new session        
-        with js_session.get(_url) as self.js_resp0:  # must do a get() - NO setting cookeis/headers)
-            logging.info(f'%s  - Simple Net get()' % cmi_debug ) 
-
-            # lOGGING HACK - helpS logging() f-string bug to handle strings with %
-            cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)+"  - "+_url
-            logging.info('%s' % cmi_debug )
-            cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)    # reset cmi_debug
-            #########################################################
-            if self.js_resp0.status_code != 200:
-                    logging.error(f'{cmi_debug} - Net get() failed with error: {self.js_resp0.status_code}')
-                    return 1, self.js_resp0.status_code
-                    ################ FAILURE ###############################
+        try:
+            self.js_resp0 = self.http_client(_url).get(_url)     # pooled keep-alive client for this host (NO per article session / handshake)
+        except httpx.HTTPError as _he:
+            logging.error(f'{cmi_debug} - Net get() failed with error: {_he}')
+            return 1, str(_he)
+        logging.info(f'%s  - Simple Net get()' % cmi_debug ) 
+
+        # lOGGING HACK - helpS logging() f-string bug to handle strings with %
+        cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)+"  - "+_url
+        logging.info('%s' % cmi_debug )
+        cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)    # reset cmi_debug
+        #########################################################
+        if self.js_resp0.status_code != 200:
+                logging.error(f'{cmi_debug} - Net get() failed with error: {self.js_resp0.status_code}')
+                return 1, self.js_resp0.status_code
+                ################ FAILURE ###############################
 
         logging.info(f'{cmi_debug}  - Net get() success status: {self.js_resp0.status_code}')
         logging.info( f"%s  - js.render() engine... DISABLED" % cmi_debug )
         logging.info( f'%s  - Store get() resp HTML dataset' % cmi_debug )
         self.js_resp2 = self.js_resp0               # Set js_resp2 to the same response as js_resp0 for now
  
-        hot_cookies = requests.utils.dict_from_cookiejar(self.js_resp0.cookies)
+        hot_cookies = self.js_resp0.cookies
         logging.info( f"%s  - Swap {len(hot_cookies)} cookies into LOCAL yahoo_headers" % cmi_debug )
 
         self.yfn_htmldata = self.js_resp0.text      # class GLOBAL store page HTML text in memory in this class
@@ -241,11 +344,11 @@ class yfnews_reader:
         _url_hash = _uh.hexdigest()
         logging.info( f'%s  - CREATE ml_ingest DB cache entry: [ {_url_hash} ]' % cmi_debug )
          
-        # create jsdb CACHE entry @ key=aurl_hash, value=js_resp0 (i.e. get()::resp, not  page TEXT data)
+        # create jsdb CACHE entry @ key=aurl_hash, value=page TEXT data + metadata (NOT the get() resp)
         self.yfn_jsdb[_url_hash] = {
             'url': _url,
             'data': self.yfn_htmldata,
-            'result': self.js_resp0
+            'status': self.js_resp0.status_code
         }
 
         # Xray DEBUG
@@ -302,15 +405,19 @@ class yfnews_reader:
         logging.info( '%s - Setup crawl4ai Depth0 News Skimmer strategy...' % cmi_debug)
         extraction_strategy = JsonCssExtractionStrategy(schema)
         
-        js_cmds = [
-            "window.scrollTo(0, document.body.scrollHeight);",
-            "await new Promise(resolve => setTimeout(resolve, 1000));"
-        ]
+        if self.skim_mark and self.skim_mark.get('u'):     # incremental skim : stop scrolling at a run of known articles
+            js_cmds = [ self._skim_incremental_js() ]
+            logging.info( f'%s - INCREMENTAL skim / {len(self.skim_mark["u"])} known urls' % cmi_debug)
+        else:
+            js_cmds = [
+                "window.scrollTo(0, document.body.scrollHeight);",
+                "await new Promise(resolve => setTimeout(resolve, 1000));"
+            ]
         
         config = CrawlerRunConfig(
             excluded_tags=["script", "style", "noscript", "template"],
             extraction_strategy=extraction_strategy,
-            scan_full_page=True,
+            scan_full_page=not self.skim_mark,     # full page scroll ONLY when there is no watermark
             verbose=False,               # disable crawl4ai verbose browser loging e.g. [FETCH], [EXTRACT], [SCRAPE], [EXTRACT], [COMPLETE]
             log_console=False,
             stream=True,
@@ -319,7 +426,7 @@ class yfnews_reader:
         )
 
         try:
-            async with AsyncWebCrawler() as crawler:
+            async with c4_browser_pool.crawler() as crawler:
                 cmi_debug = __name__+"::" + self.yahoofin_news_depth0.__name__+".#"+str(self.yti)+"."+str(idx_x)+"_crawler"
                 logging.info( '%s - Run C4 async Depth0 skim crawl NOW...' % cmi_debug)
                 result = await crawler.arun(self.yfqnews_url, config=config)
@@ -336,8 +443,7 @@ class yfnews_reader:
                     aurl_hash = auh.hexdigest()                     # this cache entry is a depth0 @ news artile url;
                     self.yfn_jsdb[aurl_hash] = dict(                # global cache within yfn instance
                         url = self.yfqnews_url,
-                        data = self.yfn_crawl_data,
-                        result = result
+                        data = self.yfn_crawl_data                  # extracted dataset only. NOT the CrawlResult
                     )
                     
                     # print ( f"DEBUG: C4_Data dump 1: {self.yfn_jsdb[aurl_hash]}" )
@@ -497,6 +603,9 @@ class yfnews_reader:
         bad_url_count = 0       # counter for bad URLs found in the article dataset
         hcycle = 1              # uhinter counter for logging
         dedupe_set = set()      # deduplication optimization data set
+        known = set(self.skim_mark['h']) if self.skim_mark else None     # incremental skim : urlhashes already cached
+        known_run = 0           # consecutive known articles. Stop extracting at args['skim_stop_run']
+        stop_run = max(1, int(self.args.get('skim_stop_run', 3) or 3))
         logging.info('%s - Article Zone scanning / ml_ingest population loop...' % cmi_debug)
         for article in self.extracted_articles:         # GLOBAL class accessor : article >>dataset<< extracted by crawl4ai
             art_title = article.get('Title', 'ERROR_no_title')                      # extracted craw4al element
@@ -526,6 +635,19 @@ class yfnews_reader:
                     continue        # abandon this article and move to the next one
                     # return 2      # this abandons/ends the entire scan loop
 
+                auh = hashlib.sha256(self.article_url.encode()) # Generate hash of URL
+                aurl_hash = auh.hexdigest()                     # compute hash
+                if known is not None and aurl_hash in known:    # INCREMENTAL : already cached by an earlier run
+                    known_run += 1
+                    self.skim_known += 1
+                    cg += 1
+                    hcycle += 1
+                    if known_run >= stop_run:
+                        print(f"Incremental:   {known_run} known articles in a row / Stop extracting @ {cg - 1} of {self.articles_found}")
+                        break
+                    continue
+                known_run = 0
+
                 # TEST #2 : learn what this URL actually is
                 uhint, uhdescr = self.yfn_uh.uhinter(hcycle, self.article_url)
                 logging.info(f'%s - Source url [{self.a_urlp.netloc}] / u:{uhint} / {uhdescr}' % cmi_debug)
@@ -552,8 +674,6 @@ class yfnews_reader:
                 print(f"Long teaser:   {art_teaser}")
                 
                 # TEST #3 : Uniqueness - Depupe this URL (have we seen it before?)
-                auh = hashlib.sha256(self.article_url.encode()) # Generate hash of URL
-                aurl_hash = auh.hexdigest()                     # compute hash
                 if aurl_hash not in dedupe_set:                 # dedupe membership test (deupe_set => set() ) : uniqueness test
                     dedupe_set.add(aurl_hash)                   # add aurl_hash to dupe_set for next membership test
 
@@ -742,8 +862,7 @@ class yfnews_reader:
                 self.sent_ai.sentiment_count['positive'] = _fr["positive_count"]
                 self.sent_ai.sentiment_count['neutral'] = _fr["neutral_count"]
                 self.sent_ai.sentiment_count['negative'] = _fr["negative_count"]
-                _sen_df_row = pd.DataFrame(_sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )                
-                self.sen_stats_df = pd.concat([self.sen_stats_df, _sen_df_row])
+                self.sen_stats_add(_sen_data)
                 #print (f"##-debug-561: sen_stats_df:\n{self.sen_stats_df}" )
                 #print (f"##-debug-562: _fr:\n{_fr}" )
                 logging.info( f'%s - BS4 Rehydrated sentiment metrics from KV cache: {self.sent_ai.sentiment_count}' % cmi_debug )
@@ -790,7 +909,7 @@ class yfnews_reader:
             self.yfqnews_url = durl
             ip_urlp = urlparse(durl)
             ip_headers = ip_urlp.path
-            self.ext_req = self.init_live_session(durl)        # uses basic requests modeule. Sould use requests_html at least
+            self.ext_req = self.init_live_session(durl)        # live cookie warm-up. Once per host per run (pooled client)
             self.update_headers(ip_headers)
             
             _ec, xhash = self.do_simple_get(durl)            # xhash now == cached_state (what we were given, but faield to find in cache))
@@ -811,7 +930,7 @@ class yfnews_reader:
             cy_soup = self.yfn_jsdb[xhash]              # ref the dict{} that do_simple_get() created
             logging.info( f'%s - BS4 EVAL.#1 : re-read Net-cache #1 for: {cached_state}' % cmi_debug ) 
             if self.yfn_jsdb[cached_state]:
-                self.yfn_jsdata = self.yfn_jsdb[cached_state]['result']
+                self.yfn_jsdata = self.yfn_jsdb[cached_state]['data']
                 logging.info ( f'%s - BS4 Found entry:   {cached_state}' % cmi_debug )
                 logging.info ( f'%s - BS4 working url:   {cy_soup['url']}' % cmi_debug )
                 logging.info ( f'%s - BS4 Cache dict:    {type(cy_soup)}' % cmi_debug )
@@ -819,10 +938,10 @@ class yfnews_reader:
                 logging.info ( f'%s - Bs4 Cache dataset: {type(cy_soup['data'])}' % cmi_debug )
                 #
                 logging.info( f'%s - Good BS4 data:     Gracefully pre-built: {cached_state}' % cmi_debug )
-                _dataset_1 = self.yfn_jsdata.text
+                _dataset_1 = self.yfn_jsdata
                 #self.nsoup = BeautifulSoup(escape(_dataset_1), "html.parser")
-                self.nsoup = BeautifulSoup(_dataset_1, "html.parser")   # scrape the article page with BS4 NOW !
-                self.articles_crawled[item_idx] = self.nsoup
+                self.nsoup = article_zones(_dataset_1)   # scrape the article zones with BS4 NOW !
+                self.articles_crawled[item_idx] = cached_state
                 self.result_engine = "yfn_jsdb.#1"
                 _built_bs4_entry = 1
             else:
@@ -836,18 +955,19 @@ class yfnews_reader:
                 logging.info( '%s - EVAL.#2 :      BS4 data entry...' % cmi_debug )
                 logging.info( f'%s - Weird Net cache state: Try cached net data: {cached_state}' % cmi_debug )
                 #print (f"###-debug: jsdb:\n{self.yfn_jsdb[cached_state]} \nresult:\n{self.yfn_jsdb[cached_state]['result']}")
-                _dataset_1 = self.yfn_jsdata.text
+                self.yfn_jsdata = self.yfn_jsdb[cached_state]['data']
+                _dataset_1 = self.yfn_jsdata
                 #self.nsoup = BeautifulSoup(escape(_dataset_1), "html.parser")
-                self.nsoup = BeautifulSoup(_dataset_1, "html.parser")
-                self.articles_crawled[item_idx] = self.yfn_jsdb[cached_state]['result']  # future feat: parallel crawl4ai extraction
+                self.nsoup = article_zones(_dataset_1)
+                self.articles_crawled[item_idx] = cached_state
                 self.result_engine = "yfn_jsdb.#2"
             else:
                 logging.info( '%s - EVAL.#3 :      BS4 data entry...' % cmi_debug )
                 logging.info( f'%s - Bad BS4 data: Force extract now: {cached_state}' % cmi_debug ) 
-                _dataset_1 = self.yfn_jsdata.text
+                _dataset_1 = self.yfn_jsdata
                 #self.nsoup = BeautifulSoup(escape(_dataset_1), "html.parser")        # BS4 read() <- replace with crawl4ai
-                self.nsoup = BeautifulSoup(_dataset_1, "html.parser")        # BS4 read() <- replace with crawl4ai
-                self.articles_crawled[item_idx] = self.nsoup     # NOTE USED: future feat: parallel crawl4ai extraction
+                self.nsoup = article_zones(_dataset_1)        # BS4 read() <- replace with crawl4ai
+                self.articles_crawled[item_idx] = cached_state
                 self.result_engine = "yfn_jsdb.#3"
 
         logging.info( '%s - BS4 EVAL.#4:       Read Net Cahce entry...' % cmi_debug )
@@ -861,9 +981,9 @@ class yfnews_reader:
         logging.info( f'%s - BS4 set Article data zones: [ {item_idx} ]' % cmi_debug )
         # local_news = self.nsoup.find(attrs={"class": "body yf-1ir6o1g"})               # full news article - locally hosted
         
-        local_news = self.nsoup.find(attrs={"class": "body yf-v6n2s3"})                  # full news article - locally hosted        
+        local_news = self.nsoup.find(attrs={"class": ZONE_BODY})                  # full news article - locally hosted        
         #pub_timestamp = self.nsoup.find(attrs={"class": "byline-attr-time-style"})      # emperical publish timestamp
-        pub_timestamp = self.nsoup.find("div", attrs={"class": "byline-attr-time-style"} )     # emperical publish timestamp
+        pub_timestamp = self.nsoup.find("div", attrs={"class": ZONE_PUBTIME} )     # emperical publish timestamp
 
         # post process BS4 time html tag that contians all the date/time data
         if pub_timestamp and (time_tag := pub_timestamp.find("time")):
@@ -901,8 +1021,9 @@ class yfnews_reader:
         logging.info( '%s - BS4 Exec NLP sent classifier pipeline.#0...' % cmi_debug )
         # WARN: trigger var for compute_sentiment(symbol, item_idx, local_stub_news_p, hs, 1)
         # 0 = Crawl4ai extractor, 1 = BS4 extractor
-        self.total_tokens, self.total_words, _final_data_dict = self.sent_ai.compute_sentiment(symbol, item_idx, local_stub_news_p, hs, 1)
+        self.total_tokens, self.total_words, _final_data_dict = self.classify_article(symbol, item_idx, local_stub_news_p, hs, 1, self.BS4_lmdb_env)
         if _final_data_dict is None:
+            self.release_article(cached_state)
             return 0, 0, None
         
         # compute core Data Metrics for this article
@@ -912,6 +1033,8 @@ class yfnews_reader:
         _total_chars = 0
         for _i, _v in enumerate(local_stub_news_p):
             _total_chars += sum(len(_s) for _s in _v.text)
+        local_news = local_stub_news_p = None
+        self.release_article(cached_state)      # page HTML + BS4 tree no longer needed
 
         # these are set @ compute_sentiment::nlp_sent_engine()
         # totals of all blockets
@@ -930,8 +1053,7 @@ class yfnews_reader:
                     ]]
 
         #print (f"###-debug-734: KV-write extr JSON - {self.sen_data}" )            
-        sen_df_row = pd.DataFrame(self.sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )
-        self.sen_stats_df = pd.concat([self.sen_stats_df, sen_df_row])
+        self.sen_stats_add(self.sen_data)
         
         _final_data_dict.update({
             'skim_age': d0_age,
@@ -945,28 +1067,19 @@ class yfnews_reader:
             })
  
         # Create LMBD KV cache entry
-        #print (f"debug-786: BS4 DB open state: {type(self.BS4_lmdb_env.db_open_state.get(self.BS4_lmdb_env.db_name))} / RO: {self.BS4_lmdb_env.RO_env} / RW: {self.BS4_lmdb_env.RW_env}")
-        if self.BS4_lmdb_env.RO_env is not None:      # is open? - explicit reliable singleton None test
-            self.BS4_lmdb_env.close_lmdb("BS4")       # force close
-            #print (f"debug-789: BS4 DB open state: {type(self.BS4_lmdb_env.db_open_state.get(self.BS4_lmdb_env.db_name))} / RO: {self.BS4_lmdb_env.RO_env} / RW: {self.BS4_lmdb_env.RW_env}")
-
-        logging.info( '%s - BS4 Open LMDB in READ-WRITE mode...' % cmi_debug )
-        #print (f"debug-792: BS4 DB open state: {type(self.BS4_lmdb_env.db_open_state.get(self.BS4_lmdb_env.db_name))} / RO: {self.BS4_lmdb_env.RO_env} / RW: {self.BS4_lmdb_env.RW_env}")
-        kv_success = self.BS4_lmdb_env.open_lmdb_RW("BS4")  # re-open in RW mode
-        self.BS4_lmdb_env.RW_env = kv_success
+        # short write txn on the PERSISTENT LMDB env (no close RO / re-open RW churn)
+        kv_success = self.BS4_lmdb_env.open_env("BS4")
         
         if kv_success is not None:      # explicit reliable singleton None test
             _url_hash = data_row['urlhash']
             _key = "0001"+"."+symbol+"."+_url_hash          # we are looking at the artile here. So test for this K/V data
             bs4_kvs_key = _key.encode('utf-8')              # byte encode 
             logging.info( f'%s - BS4 WRITE sent package to KVstore: {_key}' % cmi_debug )
-            with kv_success.begin(write=True) as _txn:
-                _kvs_json_dataset = json.dumps(_final_data_dict, default=str)    # serialize to JSON
-                _txn.put(bs4_kvs_key, _kvs_json_dataset.encode('utf-8'))   # write data to LMDB                
+            _kvs_dataset, _kvs_text = encode_article(_final_data_dict)     # serialize v2 metrics + text values (outside the write txn)
+            self.kv_write(self.BS4_lmdb_env, bs4_kvs_key, _kvs_dataset, _kvs_text, self.sent_ai.ccache_drain(), _final_data_dict.get('text_hash'), self.pub_epoch(_final_data_dict))    # write data to LMDB + new chunk cache entries + text hash + pub_time
 
         else:
             logging.info( '%s - BS4 FAILED to access KVstore / not writing cache entry !' % cmi_debug )
-            self.BS4_lmdb_env.close_lmdb("BS4")  # force close
             pass    # Not Fatal - faield to open LMDB. Continue with manual Network Read
         # empty vocabulary pretty-printer logic for eof=""
         if self.sent_ai.empty_vocab > 0:
@@ -998,7 +1111,6 @@ class yfnews_reader:
                 )
         print ( f"{footer}")
         print ( f"============== BS4 End.#2 / Cache miss / Net read article / New cache entry built: {self.kv_created_C4 + self.kv_created_BS4} ================" )
-        self.BS4_lmdb_env.close_lmdb("BS4")
         #print ( f"#-Debug-978#:  emperical publish date: {pub_HUMANdatets} / {pub_ISOdatets}" )
         #print ( f"#-Debug-979#: DB open state: {type(self.BS4_lmdb_env.db_open_state.get(self.BS4_lmdb_env.db_name))} / RO: {self.BS4_lmdb_env.RO_env} / RW: {self.BS4_lmdb_env.RW_env}")
         return self.total_tokens, self.total_words, bs4_final_results
@@ -1058,8 +1170,7 @@ class yfnews_reader:
                 self.sent_ai.sentiment_count['positive'] = _fr["positive_count"]
                 self.sent_ai.sentiment_count['neutral'] = _fr["neutral_count"]
                 self.sent_ai.sentiment_count['negative'] = _fr["negative_count"]
-                _sen_df_row = pd.DataFrame(_sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )                
-                self.sen_stats_df = pd.concat([self.sen_stats_df, _sen_df_row])
+                self.sen_stats_add(_sen_data)
                 #print (f"##-@817: sen_stats_df:\n{self.sen_stats_df}" )
                 #print (f"##-@818: _fr:\n{_fr}" )
                 logging.info( f'%s - C4 Rehydrated sentiment metrics from KV cache: {self.sent_ai.sentiment_count}' % cmi_debug )
@@ -1102,15 +1213,21 @@ class yfnews_reader:
             # #######################################################
             # crawl an indivial article NOW... !!
             # #######################################################
-            result = asyncio.run(self.c4_engine_depth3(durl, item_idx))  # exec crawl4ai engine and extract article's text
-            self.articles_crawled[item_idx] = result                     # NOTE UNUSED: future feat: parallel crawl4ai extraction
+            _prefetched = self.yfn_c4_result.get(cached_state)          # already crawled by the concurrent fetch stage ?
+            if _prefetched is not None and _prefetched.get('success'):
+                logging.info( f'%s - C4 Pre-fetched by fetch stage: {cached_state}' % cmi_debug )
+                result = _prefetched
+                self.yfn_crawl_data = _prefetched['data']
+            else:
+                result = asyncio.run(self.c4_engine_depth3(durl, item_idx))  # exec crawl4ai engine and extract article's text
+            self.articles_crawled[item_idx] = cached_state
 
             self.yfqnews_url = durl
             
-            self.yfn_c4_result[cached_state] = dict(   # C4 local cache - for crawl4ai results, for post-processing
+            self.yfn_c4_result[cached_state] = dict(   # C4 local cache - extracted data only, for post-processing
                         url = durl,
                         data = self.yfn_crawl_data,
-                        result = result
+                        success = result is not None
                         )
             
             cy = self.yfn_c4_result[cached_state]    # pickup up result dict
@@ -1146,24 +1263,24 @@ class yfnews_reader:
         if _built_c4_entry == 1:
             logging.info( '%s - EVAL.#2 : C4 data entry...' % cmi_debug )
             logging.info( f'%s - Good C4 data:  Gracefully pre-built: {cached_state}' % cmi_debug ) 
-            dataset_1 = self.yfn_c4_result[cached_state]['result']
+            dataset_1 = self.yfn_c4_result[cached_state]['data']
 
             result_engine = "yfn_c4_result"
-            self.articles_crawled[item_idx] = result    # crawl4ai result
+            self.articles_crawled[item_idx] = cached_state
         elif _built_c4_entry == 2:
             logging.info( '%s - EVAL.#3 : C4 data entry...' % cmi_debug )
             logging.info( f'%s - Weird C4 state:   Try cached Net data: {cached_state}' % cmi_debug )
             #print (f"###-debug: jsdb:\n{self.yfn_jsdb[cached_state]} \nresult:\n{self.yfn_jsdb[cached_state]['result']}")
-            dataset_1 = self.yfn_jsdb[cached_state]['result']
+            dataset_1 = self.yfn_jsdb[cached_state]['data']
             result_engine = "yfn_jsdb"
-            self.articles_crawled[item_idx] = self.yfn_jsdb[cached_state]['result']  # future feat: parallel crawl4ai extraction
+            self.articles_crawled[item_idx] = cached_state
             #self.yfn_jsdb[cached_state]['result']
         else:
             logging.info( '%s - EVAL.#4 : C4 data entry...' % cmi_debug )
             logging.info( f'%s - Bad C4 data:      Force crawl now: {cached_state}' % cmi_debug ) 
             result = asyncio.run(self.c4_engine_depth3(durl, item_idx))  # call the crawl4ai engine to extract 1 article's data
-            self.articles_crawled[item_idx] = result  # NOTE USED: future feat: parallel crawl4ai extraction
-            dataset_1 = self.yfn_c4_result[cached_state]['result']
+            self.articles_crawled[item_idx] = cached_state
+            dataset_1 = self.yfn_c4_result[cached_state]['data']
             result_engine = "yfn_c4_result"
 
         logging.info( f'%s - Cached hash    {cached_state}' % cmi_debug )
@@ -1248,20 +1365,14 @@ class yfnews_reader:
                                     'negative_count': 0,
                                 }
                                 # --- LMDB write (mirrors the case "process" write; see note below) ---
-                                if self.C4_lmdb_env.RO_env is not None:
-                                    self.C4_lmdb_env.close_lmdb("C4")
-                                kv_success = self.C4_lmdb_env.open_lmdb_RW("C4")
-                                self.C4_lmdb_env.RW_env = kv_success
+                                kv_success = self.C4_lmdb_env.open_env("C4")     # PERSISTENT env
                                 if kv_success is not None:
                                     _key = "0001"+"."+symbol+"."+_url_hash
                                     c4_kvs_key = _key.encode('utf-8')
                                     logging.info( f'%s - C4 WRITE paywall-marker @ KVstore: {_key}' % cmi_debug )
-                                    with self.C4_lmdb_env.RW_env.begin(write=True) as _txn:
-                                        _txn.put(c4_kvs_key,
-                                                 json.dumps(_paywall_marker, default=str).encode('utf-8'))
+                                    self.kv_write(self.C4_lmdb_env, c4_kvs_key, encode_record(_paywall_marker))
                                 else:
                                     logging.info( '%s - C4 FAILED to open KVstore / paywall-marker NOT cached' % cmi_debug )
-                                self.C4_lmdb_env.close_lmdb("C4")
 
                                 print ("Premium Paywalled article. Caching skip-marker...")
                                 print ( f"================ C4 End.#1 YF Premium paywall: {item_idx} ================")
@@ -1283,7 +1394,8 @@ class yfnews_reader:
                             hs = cached_state    # the URL hash (passing it to sentiment_ai for us in DF)
                             logging.info( "%s - C4 Exec NLP sent classifier pipeline.#0..." % cmi_debug )
                             # 0 = Crawl4ai extractor, 1 = BS4 extractor
-                            self.total_tokens, self.total_words, _final_data_dict = self.sent_ai.compute_sentiment(symbol, item_idx, art_all_p, hs, 0)
+                            self.total_tokens, self.total_words, _final_data_dict = self.classify_article(symbol, item_idx, art_all_p, hs, 0, self.C4_lmdb_env)
+                            self.release_article(cached_state)      # extracted data + CrawlResult no longer needed
                             self.sent_ai.cr_package.update({ 'chars_count': int(_total_chars) })
                             self.sent_ai.cr_package.update({ 'total_words': int(self.total_words) })
 
@@ -1308,8 +1420,7 @@ class yfnews_reader:
                                 ]]  
 
                             #print (f"##-@1088: KV-write extr JSON - {self.sen_data}" ) 
-                            sen_df_row = pd.DataFrame(self.sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )
-                            self.sen_stats_df = pd.concat([self.sen_stats_df, sen_df_row])
+                            self.sen_stats_add(self.sen_data)
 
                             _final_data_dict.update({
                                 'skim_age': d0_age,
@@ -1323,24 +1434,16 @@ class yfnews_reader:
                                 })
 
                             # Create LMBD KV cache entry
-                            #print (f"debug-1134: C4 DB open state: {type(self.C4_lmdb_env.db_open_state.get(self.C4_lmdb_env.db_name))} / RO: {self.C4_lmdb_env.RO_env} / RW: {self.C4_lmdb_env.RW_env}")
-                            if self.C4_lmdb_env.RO_env is not None:      # explicit reliable singleton None test
-                                self.C4_lmdb_env.close_lmdb("C4")        # force close
-
-                            logging.info( '%s - C4 Open LMDB in READ-WRITE mode...' % cmi_debug )
-                            kv_success = self.C4_lmdb_env.open_lmdb_RW("C4")  # re-open in RW mode
-                            self.C4_lmdb_env.RW_env = kv_success
-                            #print (f"debug-1142: C4 DB open state: {type(self.C4_lmdb_env.db_open_state.get(self.C4_lmdb_env.db_name))} / RO: {self.C4_lmdb_env.RO_env} / RW: {self.C4_lmdb_env.RW_env}")
+                            # short write txn on the PERSISTENT LMDB env (no close RO / re-open RW churn)
+                            kv_success = self.C4_lmdb_env.open_env("C4")
                             
                             if kv_success is not None:
                                 _url_hash = data_row['urlhash']
                                 _key = "0001"+"."+symbol+"."+_url_hash     # we are looking at the artile here. So test for this K/V data
                                 c4_kvs_key = _key.encode('utf-8')          # byte encode 
                                 logging.info( f'%s - C4 WRITE package @ KVstore: {_key}' % cmi_debug )
-                                with self.C4_lmdb_env.RW_env.begin(write=True) as _txn:
-                                    _kvs_json_dataset = json.dumps(_final_data_dict, default=str)
-                                    _txn.put(c4_kvs_key, _kvs_json_dataset.encode('utf-8'))     # write data to LMDB
-                                    #self.C4_lmdb_env.close_lmdb("C4")
+                                _kvs_dataset, _kvs_text = encode_article(_final_data_dict)     # serialize v2 metrics + text values (outside the write txn)
+                                self.kv_write(self.C4_lmdb_env, c4_kvs_key, _kvs_dataset, _kvs_text, self.sent_ai.ccache_drain(), _final_data_dict.get('text_hash'), self.pub_epoch(_final_data_dict))    # write data to LMDB + new chunk cache entries + text hash + pub_time
                             else:
                                 logging.info( '%s - C4 FAILED to access KVstore / not writing cache entry !' % cmi_debug )
                                 pass        # Not Fatal - faield to open LMDB. Continue with manual Network Read
@@ -1372,7 +1475,6 @@ class yfnews_reader:
                                     )
                             print (f"{footer}")
                             print (f"============== C4 End.#3 / Cache miss / Net read article / New cache entry built: {self.kv_created_C4 + self.kv_created_BS4} ================" )
-                            self.C4_lmdb_env.close_lmdb("C4")
 
                             return self.total_tokens, self.total_words, c4_final_results
                         case _:
@@ -1433,20 +1535,288 @@ class yfnews_reader:
         Just the crawl4ai engine for Depth 3
         Dont do anyting else
         """
-        config = None
-        schema = None
         cmi_debug = __name__+"::" + self.c4_engine_depth3.__name__+".#"+str(self.yti)+"."+str(item_idx)
         if not durl or not isinstance(durl, str):       # empty str or not type(str)
             logging.error(f'{cmi_debug} - Invalid URL: {durl}')
             return None
 
+        config = self._c4_article_config(cmi_debug)
+        if config is None:
+            return None
+
+        logging.info(f'%s  - Crawl article [ {item_idx} ] NOW...' % cmi_debug)
+        try:
+            async with c4_browser_pool.crawler() as crawler:
+                result = await crawler.arun(durl, config=config)        # exec the craw HERE !!!!
+                if result.success:
+                    self.yfn_crawl_data = self._c4_structured(result, durl, item_idx, cmi_debug)    # the 'data' channel the caller reads
+                    auh = hashlib.sha256(durl.encode())         # prep hash
+                    aurl_hash = auh.hexdigest()                 # WARN: needs dedupe checking !!
+                    self.yfn_c4_result[aurl_hash] = dict(
+                        url     = durl,
+                        data    = self.yfn_crawl_data,
+                        success = True
+                    )
+                    logging.info(f'%s  - Created C4 result cache entry: {aurl_hash}' % cmi_debug)
+                    return result
+                else:
+                    logging.error(f'%s - crawl4ai extraction failed: {result.error_message}' % cmi_debug)
+                    return None
+        except Exception as e:
+            logging.error(f'{cmi_debug} - Error during crawl4ai extraction: {e}')
+            return None
+
+    # ################ 7.1
+    # Concurrent Depth 3 fetch stage
+    #
+    async def c4_fetch_stage(self, work_items, out_q, concurrency=4, host_delay=1.0, stop_event=None):
+        """
+        Concurrent Depth 3 fetch stage. 1 event loop + the shared c4_browser_pool crawler (1 warm browser) for ALL articles
+        - work_items = list[] of (item_idx, durl, urlhash). Cache MISSES only (see lmdb_io_eng.probe_ml_ingest)
+        - bounded asyncio worker pool : max concurrency crawls in flight at once
+        - per-host politeness : crawl STARTS to the same host are spaced >= host_delay secs apart
+        - extracted data lands in yfn_c4_result[urlhash] (same shape c4_engine_depth3 builds)
+        - out_q (thread safe queue.Queue) gets (item_idx, ok) as each article completes. The sentiment step consumes it
+        """
+        cmi_debug = __name__+"::" + self.c4_fetch_stage.__name__+".#"+str(self.yti)
+        config = self._c4_article_config(cmi_debug)
+        if config is None:
+            return 0        # c4_prefetch() reports every un-crawled article as failed
+
+        _loop = asyncio.get_running_loop()
+        work_q = asyncio.Queue()
+        for _w in work_items:
+            work_q.put_nowait(_w)
+        host_next = dict()          # { host: earliest loop.time() the next crawl may start }
+        host_lock = asyncio.Lock()
+        _fetched = 0
+
+        async def _polite(host):
+            async with host_lock:
+                _now = _loop.time()
+                _start = max(_now, host_next.get(host, _now))
+                host_next[host] = _start + host_delay
+            if _start > _now:
+                await asyncio.sleep(_start - _now)
+
+        async def _worker(crawler, wid):
+            nonlocal _fetched
+            while stop_event is None or not stop_event.is_set():
+                try:
+                    item_idx, durl, urlhash = work_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await _polite(urlparse(durl).netloc)
+                _ok = False
+                logging.info(f'%s  - Worker.#{wid} crawl article [ {item_idx} ] NOW...' % cmi_debug)
+                try:
+                    result = await crawler.arun(durl, config=config)
+                    if result.success:
+                        self.yfn_c4_result[urlhash] = dict(
+                            url     = durl,
+                            data    = self._c4_structured(result, durl, item_idx, cmi_debug),
+                            success = True
+                        )
+                        _ok = True
+                        _fetched += 1
+                    else:
+                        logging.error(f'%s - crawl4ai extraction failed [ {item_idx} ]: {result.error_message}' % cmi_debug)
+                except Exception as e:
+                    logging.error(f'{cmi_debug} - Error during crawl4ai extraction [ {item_idx} ]: {e}')
+                self.c4_reported.add(item_idx)
+                out_q.put((item_idx, _ok))
+
+        async with c4_browser_pool.crawler() as crawler:
+            await asyncio.gather(*[ _worker(crawler, w) for w in range(max(1, min(concurrency, len(work_items)))) ])
+        logging.info(f'%s  - Fetch stage done: {_fetched} of {len(work_items)} articles crawled' % cmi_debug)
+        return _fetched
+
+    # ################ 7.2
+    def c4_prefetch(self, work_items, concurrency=4, host_delay=1.0):
+        """
+        Run c4_fetch_stage() on its OWN event loop thread, so network I/O overlaps the (sync) LLM classifier
+        RETURNS: thread safe queue.Queue of (item_idx, ok). Exactly 1 entry per work item (unless stopped)
+        """
+        cmi_debug = __name__+"::" + self.c4_prefetch.__name__+".#"+str(self.yti)
+        _out_q = queue.Queue()
+        self._c4_stop = threading.Event()
+
+        def _runner():
+            try:
+                asyncio.run(self.c4_fetch_stage(work_items, _out_q, concurrency, host_delay, self._c4_stop))
+            except Exception as e:
+                logging.error(f'{cmi_debug} - Fetch stage FAILED: {e}')
+            for _w in work_items:               # never leave the consumer blocked on an article we didnt report
+                if _w[0] not in self.c4_reported:
+                    _out_q.put((_w[0], False))
+
+        self.c4_prefetched = { _w[0] for _w in work_items }
+        self.c4_reported = set()
+        self._c4_thread = threading.Thread(target=_runner, name="c4_fetch_stage", daemon=True)
+        self._c4_thread.start()
+        logging.info(f'%s  - Fetch stage started: {len(work_items)} articles / concurrency: {concurrency} / host delay: {host_delay}s' % cmi_debug)
+        return _out_q
+
+    # ################ 7.3
+    def c4_prefetch_stop(self):
+        """Stop the fetch stage workers pulling new articles (in flight crawls finish)"""
+        if self._c4_stop is not None:
+            self._c4_stop.set()
+        return
+
+    # ################ 7.4
+    def ingest_order(self, out_q=None):
+        """
+        ml_ingest item order for the main sentiment LOOP
+        - no fetch stage: plain ml_ingest order
+        - fetch stage running: every article that needs NO network first (cache hits, non candidates)
+          then the pre-fetched cache misses, in fetch COMPLETION order (as they come off out_q)
+        """
+        _prefetched = self.c4_prefetched or set()
+        for item_idx in list(self.ml_ingest.keys()):
+            if out_q is None or item_idx not in _prefetched:
+                yield item_idx
+        if out_q is not None:
+            for _ in range(len(_prefetched)):
+                item_idx, _ok = out_q.get()
+                yield item_idx
+
+    # ################ 7.5
+    def release_article(self, urlhash):
+        """
+        Release every heavy object held for 1 article once compute_sentiment() is done with it
+        - its net cache entries (page HTML / extracted data)
+        - the last get() response, BS4 tree + CrawlResult the reader keeps on self
+        """
+        self.yfn_jsdb.release(urlhash)
+        self.yfn_c4_result.release(urlhash)
+        self.js_resp0 = self.js_resp2 = None
+        self.yfn_htmldata = self.yfn_jsdata = None
+        self.nsoup = None
+        self.yfn_c4_data = None
+        return
+
+    # ################ 7.6
+    def netcache_stats(self):
+        """RETURNS: list[] of stats dict{} for each bounded net cache"""
+        return [ self.yfn_jsdb.stats(), self.yfn_c4_result.stats(), self.articles_crawled.stats() ]
+
+    # ################ 7.7
+    def kv_write(self, lmdb_inst, kvs_key, metrics_value, text_value=None, ccache=None, thash=None, epoch=None):
+        """
+        Write 1 article (+ its new chunk cache entries + text hash + pub_time index entries) to LMDB in 1 short write txn
+        - kv_defer is a list[] (pipeline mode) : queue the write for the pipeline collector instead. NO LMDB I/O here
+        - thash = hex text hash of the article (see classify_article). None = not indexed
+        - epoch = published_epoch of the article (see pub_epoch). None = not in the pub_time index
+        """
+        _thash = bytes.fromhex(thash) if thash else None
+        if self.kv_defer is not None:
+            self.kv_defer.append((lmdb_inst, kvs_key, metrics_value, text_value, ccache, _thash, epoch))
+            return 0
+        with lmdb_inst.write_txn() as _txn:
+            lmdb_inst.put_article(_txn, kvs_key, metrics_value, text_value, epoch)
+            lmdb_inst.ccache_put(_txn, ccache)
+            lmdb_inst.thash_put(_txn, _thash, kvs_key)
+        return 1
+
+    # ################ 7.8
+    def skim_watermark(self, lmdb_inst):
+        """
+        Write this symbols incremental skim WATERMARK. Called at the END of the depth 3 run (not after the skim)
+        - newest first = ml_ingest (feed) order, then the previous mark
+        - type 0 articles only count once they are really in LMDB. An article skimmed but never cached (cycle limit,
+          extract failure) is NOT marked, so the next incremental skim picks it up again
+        - non type 0 items (video, ads, stubs) never reach LMDB. They are marked as soon as they are skimmed
+        RETURNS: urlhashes in the new mark
+        """
+        cmi_debug = __name__+"::"+self.skim_watermark.__name__+".#"+str(self.yti)
+        if lmdb_inst is None or lmdb_inst.open_env("GLOBAL") is None:
+            return 0
+        _hashes, _urls = [], []
+        with lmdb_inst.read_txn() as txn:
+            for _row in self.ml_ingest.values():
+                _h = _row.get('urlhash')
+                if not _h or _h in _hashes:
+                    continue
+                if _row.get('type') == 0 and txn.get(("0001"+"."+_row['symbol'].upper()+"."+_h).encode('utf-8')) is None:
+                    continue
+                _hashes.append(_h)
+                _urls.append(_row.get('url', ''))
+        if self.skim_mark:
+            for _h, _u in zip(self.skim_mark.get('h', []), self.skim_mark.get('u', [])):
+                if _h not in _hashes:
+                    _hashes.append(_h)
+                    _urls.append(_u)
+        logging.info( f'%s - New skim watermark: {min(len(_hashes), SKIM_MARK_MAX)} urlhashes' % cmi_debug )
+        return lmdb_inst.put_skim_mark(self.symbol, _hashes[:SKIM_MARK_MAX], _urls[:SKIM_MARK_MAX])
+
+    # ################ 7.9
+    def classify_article(self, symbol, item_idx, scentxt, hs, ext, lmdb_inst):
+        """
+        Score 1 article that MISSED the LMDB cache (kv_cache_engine codes 1 / 2 / 3)
+        - hash the cleaned article text + look it up in the text hash side index
+        - HIT  : the same text was already scored (syndicated copy, rebuilt corrupt record). Clone its chunk scores
+        - MISS : full compute_sentiment() (chunker + LLM classifier)
+        - the text hash rides in the returned dict{} as 'text_hash', so the LMDB write can index it
+        RETURNS: same shape as compute_sentiment() -> total_tokens, total_words, final data dict{} (None = failed)
+        """
+        cmi_debug = __name__+"::"+self.classify_article.__name__+".#"+str(item_idx)
+        if len(scentxt) == 0:
+            return self.sent_ai.compute_sentiment(symbol, item_idx, scentxt, hs, ext)
+        _thash = self.sent_ai.text_hash(scentxt, ext)
+        _prior = lmdb_inst.thash_get(_thash) if lmdb_inst is not None and lmdb_inst.open_env("GLOBAL") is not None else None
+        if _prior is not None:
+            _key, _record = _prior
+            logging.info( f'%s - Text hash HIT / clone chunk scores from: {_key} (no LLM)' % cmi_debug )
+            print ( f"Text unchanged: re-using sentiment of {_key.decode('utf-8')}" )
+            _ttc, _twc, _fdd = self.sent_ai.clone_sentiment(symbol, item_idx, scentxt, hs, ext, _record)
+        else:
+            _ttc, _twc, _fdd = self.sent_ai.compute_sentiment(symbol, item_idx, scentxt, hs, ext)
+        if _fdd is not None:
+            _fdd['text_hash'] = _thash.hex()
+        return _ttc, _twc, _fdd
+
+    # ################ 7.10
+    def pub_epoch(self, record):
+        """
+        published_epoch of 1 article record for the LMDB pub_time index
+        - same resolution rules the CompositeScorer reads the record back with (iso_age, then skim_age)
+        RETURNS: epoch float or None (no usable publish time)
+        """
+        if yfnews_reader.epoch_eng is None:
+            yfnews_reader.epoch_eng = CompositeScorer()
+        return yfnews_reader.epoch_eng.resolve_published_epoch(record)[0]
+
+    # ################ 7.11
+    def sen_stats_add(self, sen_data):
+        """
+        Add 1 articles aggregated sentiment row [[ art, urlhash, positive, neutral, negative ]] to sen_stats_df
+        - sen_defer is a list[] (pipeline mode) : queue the row for the pipeline collector instead. The caller reads
+          sen_stats_df on its own thread (aop merge), so the classify thread never touches it
+        """
+        if self.sen_defer is not None:
+            self.sen_defer.extend(sen_data)
+            return 0
+        return self.sen_stats_put(sen_data)
+
+    # ################ 7.12
+    def sen_stats_put(self, sen_data):
+        """Append sentiment row(s) to sen_stats_df NOW. The pipeline collector calls this for the deferred rows"""
+        _sen_df_row = pd.DataFrame(sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )
+        self.sen_stats_df = pd.concat([self.sen_stats_df, _sen_df_row])
+        return 1
+
+    # ###################### Helper Method
+    # Helper method -> c4_engine_depth3 / c4_fetch_stage
+
+    def _c4_article_config(self, cmi_debug):
+        """crawl4ai run config for a Depth 3 article crawl (schema driven extraction). None if the schema cant load"""
         logging.info(f'%s  - Load schema file: [ {self.YF_sym_article_schema} ]' % cmi_debug)
         schema_file_path = f"{self.YF_sym_article_schema}"
         if os.path.exists(schema_file_path):
             with open(schema_file_path, "r") as f:
                 schema = json.load(f)
                 logging.info( '%s  - crawl4ai schema loaded' % cmi_debug)
-                #self.YF_sym_article_schema = schema
                 logging.info( '%s  - INIT extraction strategy...' % cmi_debug)
                 extraction_strategy = JsonCssExtractionStrategy(schema, verbose=True)
                 js_cmds = [
@@ -1456,73 +1826,53 @@ class yfnews_reader:
                 
                 # scan_full_page=True,
                 # js_code = js_cmds
-                config = CrawlerRunConfig(
+                return CrawlerRunConfig(
                     extraction_strategy=extraction_strategy,
                     verbose=False,               # disable crawl4ai verbose browser loging e.g. [FETCH], [EXTRACT], [SCRAPE], [EXTRACT], [COMPLETE]
                     log_console=False,
                     js_code=js_cmds,
                     cache_mode=CacheMode.BYPASS  # Bypass cache for fresh data
                     )
-        else:
-            logging.error(f'%s - FAILED to load schema file: [ {self.YF_sym_article_schema} ]' % cmi_debug)
-            return None
+        logging.error(f'%s - FAILED to load schema file: [ {self.YF_sym_article_schema} ]' % cmi_debug)
+        return None
 
-        logging.info(f'%s  - Crawl article [ {item_idx} ] NOW...' % cmi_debug)
+    def _c4_structured(self, result, durl, item_idx, cmi_debug):
+        """
+        crawl4ai result -> list[] of content dicts (each carrying a 'Content' key)
+        schema extraction first, raw markdown fallback on a template miss
+        """
+        logging.info( '%s  - crawl4ai extraction running...' % cmi_debug)
+        # ---- structured extraction channel (schema-driven) ----
+        # extracted_content is a JSON *string*; can be None, "", or "[]"
+        # when the schema's baseSelector matched zero nodes.
+        _raw_extracted = result.extracted_content
         try:
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(durl, config=config)        # exec the craw HERE !!!!
-                if result.success:
-                    logging.info( '%s  - crawl4ai extraction running...' % cmi_debug)
-                    # ---- structured extraction channel (schema-driven) ----
-                    # extracted_content is a JSON *string*; can be None, "", or "[]"
-                    # when the schema's baseSelector matched zero nodes.
-                    _raw_extracted = result.extracted_content
-                    try:
-                        _structured = json.loads(_raw_extracted) if _raw_extracted else []
-                    except (json.JSONDecodeError, TypeError) as _je:
-                        logging.warning(f'%s - C4 extracted_content not JSON-parseable: {_je}' % cmi_debug)
-                        _structured = []
-                        
-                    # ---- detect the silent template-miss: schema ran, matched nothing ----
-                    if not _structured:
-                        logging.warning( f'%s - C4 schema matched 0 nodes (template miss?) [ {item_idx} ]' % cmi_debug )
-                        _raw_text = self._c4_raw_text(result)   # normalize markdown -> str (helper below)
-                        if _raw_text:
-                            # synthesize a single content block so the downstream
-                            # sentiment path sees the same shape it always sees:
-                            # a list of dicts each carrying a 'Content' key.
-                            _structured = [{
-                                'Content': _raw_text,
-                                'Premium_paywall': '',          # unknown from raw fallback
-                                '_fallback': 'raw_markdown'     # provenance marker (see note)
-                            }]
-                            logging.info( f'%s - C4 raw-markdown fallback engaged: {len(_raw_text)} chars [ {item_idx} ]' % cmi_debug )
-                        else:
-                            # genuinely nothing on the page — neither schema nor raw text
-                            logging.error( f'%s - C4 NO structured data AND NO raw text [ {item_idx} ] URL: {durl}' % cmi_debug )
-                            # leave _structured as [] and let the caller's empty-data
-                            # guard handle it (rather than caching a hollow entry)
-
-                    self.yfn_crawl_data = _structured           # the 'data' channel the caller reads
-                    auh = hashlib.sha256(durl.encode())         # prep hash
-                    aurl_hash = auh.hexdigest()                 # WARN: needs dedupe checking !!
-                    self.yfn_c4_result[aurl_hash] = dict(
-                        url    = durl,
-                        data   = self.yfn_crawl_data,
-                        result = result
-                    )
-                    logging.info(f'%s  - Created C4 result cache entry: {aurl_hash}' % cmi_debug)
-                    return result
-                else:
-                    logging.error(f'%s - crawl4ai extraction failed: {result.error_message}' % cmi_debug)
-                    return None
-        except Exception as e:
-            logging.error(f'{cmi_debug} - Error during crawl4ai extraction: {e}')
-            return None
+            _structured = json.loads(_raw_extracted) if _raw_extracted else []
+        except (json.JSONDecodeError, TypeError) as _je:
+            logging.warning(f'%s - C4 extracted_content not JSON-parseable: {_je}' % cmi_debug)
+            _structured = []
+            
+        # ---- detect the silent template-miss: schema ran, matched nothing ----
+        if not _structured:
+            logging.warning( f'%s - C4 schema matched 0 nodes (template miss?) [ {item_idx} ]' % cmi_debug )
+            _raw_text = self._c4_raw_text(result)   # normalize markdown -> str (helper below)
+            if _raw_text:
+                # synthesize a single content block so the downstream
+                # sentiment path sees the same shape it always sees:
+                # a list of dicts each carrying a 'Content' key.
+                _structured = [{
+                    'Content': _raw_text,
+                    'Premium_paywall': '',          # unknown from raw fallback
+                    '_fallback': 'raw_markdown'     # provenance marker (see note)
+                }]
+                logging.info( f'%s - C4 raw-markdown fallback engaged: {len(_raw_text)} chars [ {item_idx} ]' % cmi_debug )
+            else:
+                # genuinely nothing on the page — neither schema nor raw text
+                logging.error( f'%s - C4 NO structured data AND NO raw text [ {item_idx} ] URL: {durl}' % cmi_debug )
+                # leave _structured as [] and let the caller's empty-data
+                # guard handle it (rather than caching a hollow entry)
+        return _structured
 
-    # ###################### Helper Method
-    # Helper method -> c4_engine_depth3
-    
     def _c4_raw_text(self, result):
         """
         Normalize crawl4ai's markdown into a plain str, defensively.
@@ -1546,7 +1896,33 @@ class yfnews_reader:
         raw = getattr(md, 'raw_markdown', None)
         return (raw or '').strip()
 
- 
+    # Helper method -> yahoofin_news_depth0
+
+    def _skim_incremental_js(self):
+        """
+        Incremental depth 0 skim scroll. Scrolls the news stream (max SKIM_MAX_SCROLLS) and stops as soon as
+        args['skim_stop_run'] consecutive stream items link to urls in the skim watermark
+        """
+        _stop_run = max(1, int(self.args.get('skim_stop_run', 3) or 3))
+        return f"""
+const known = new Set({json.dumps(self.skim_mark['u'])});
+for (let i = 0; i < {SKIM_MAX_SCROLLS}; i++) {{
+    let run = 0, reached = false;
+    for (const li of {SKIM_ITEM_JS}) {{
+        const a = li.querySelector('div a');
+        if (a && known.has(a.getAttribute('href'))) {{
+            if (++run >= {_stop_run}) {{ reached = true; break; }}
+        }} else {{
+            run = 0;
+        }}
+    }}
+    if (reached) break;
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise(resolve => setTimeout(resolve, 1000));
+}}
+"""
+
+
     # ###############
 
     def dump_ml_ingest(self):
@@ -47,6 +47,7 @@ class ml_nlpreader:
     # global accessors
     args = []               # class dict to hold global args being passed in from main() methods
     dateageresolver = None  # singleton class of News Article Age date Resolver() 
+    lmdb_env = None         # lmdb_io_eng instance (set by main). Holds the incremental skim watermarks
     cycle = 0               # class thread loop counter
     ml_yfn_dataset = None   # Yahoo Finance News reader instance
     yfn = None              # class of @ml_yahoofinews_crawl4ai.py/yfnews_reader
@@ -97,6 +98,8 @@ class ml_nlpreader:
         logging.info(f"%s - Form NEWS endpoint for {news_symbol} + globalize url_hinter @ #1" % cmi_debug)
         self.yfn_uh = url_hinter(1, self.args)                          # instantiate URL hinter 
         ml_yfn_dataset.yfn_uh = self.yfn_uh                     # give UFN reader access to the URL hinter instance
+        if self.args.get('skim_incremental') and self.lmdb_env is not None:
+            ml_yfn_dataset.skim_mark = self.lmdb_env.get_skim_mark(news_symbol)    # newest cached urlhashes. None = full skim
 
         # 3 Main steps execuete @here : Depth -> 0 + Depth -> 1
         # print a report of the Depth 0 Top Level news skim run
@@ -109,6 +112,8 @@ class ml_nlpreader:
             self.ml_yfn_dataset = ml_yfn_dataset                    # set global dataset -> ml_yfn_dataset            
             print(" ")
             print(f"Skim Depth: 0 - Candidates: {articles_found} / Maybe good: {len(ml_yfn_dataset.ml_ingest)} / (Bad urls: {bad_url_count})")
+            if ml_yfn_dataset.skim_mark:
+                print(f"Incremental skim - Already cached: {ml_yfn_dataset.skim_known} / New: {len(ml_yfn_dataset.ml_ingest)}")
             print("========================================================================================")
   
             # DEBUG: xray debug
@@ -0,0 +1,137 @@
+#! python3
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+
+# ###################### Main class
+class netcache_lru:
+    """
+    Bounded LRU network cache (drop in for the yfnews_reader yfn_jsdb{} / yfn_c4_result{} / articles_crawled{} dicts)
+    - bounded by item count AND (approx) bytes. Least recently used entries are evicted first
+    - dict style access. cache[key] raises KeyError on a miss (the repo wide cache miss signal)
+    - thread safe (the c4 fetch stage + pipeline threads write into it)
+    - entries should hold extracted text + metadata ONLY. Never Response / CrawlResult / BeautifulSoup objects
+    """
+
+    # global accessors
+    name = None             # cache name (for logging + stats)
+    max_items = 256         # item bound
+    max_bytes = 64 << 20    # approx byte bound (sum of entry sizes)
+    nbytes = 0              # current approx bytes held
+    peak_bytes = 0
+    hits = 0
+    misses = 0
+    evictions = 0
+    evicted_bytes = 0
+    released = 0            # entries dropped explicitly via release()
+
+    ######################## init ########################
+    def __init__(self, name, max_items=None, max_bytes=None):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        self.name = name
+        self.max_items = max(1, int(max_items or netcache_lru.max_items))
+        self.max_bytes = max(1, int(max_bytes or netcache_lru.max_bytes))
+        self._data = OrderedDict()      # { key: (value, approx_bytes) } oldest first
+        self._lock = threading.Lock()
+        logging.info( f'%s - Instantiate {name} / items: {self.max_items} / bytes: {self.max_bytes}' % cmi_debug )
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                _v, _n = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data.move_to_end(key)
+            self.hits += 1
+            return _v
+
+    def __setitem__(self, key, value):
+        _n = sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data.pop(key)[1]
+            self._data[key] = (value, _n)
+            self.nbytes += _n
+            self.peak_bytes = max(self.peak_bytes, self.nbytes)
+            self._evict()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data.keys()))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self._data.keys())
+
+    def pop(self, key, default=None):
+        with self._lock:
+            _e = self._data.pop(key, None)
+            if _e is None:
+                return default
+            self.nbytes -= _e[1]
+            return _e[0]
+
+    # #################################### 1
+    def release(self, key):
+        """Drop 1 entry as soon as its consumer is done with it (not counted as an eviction)"""
+        with self._lock:
+            _e = self._data.pop(key, None)
+            if _e is None:
+                return 0
+            self.nbytes -= _e[1]
+            self.released += 1
+            return _e[1]
+
+    # #################################### 2
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    # #################################### 3
+    def stats(self):
+        """RETURNS: dict{} of cache counters"""
+        return dict(
+            name=self.name, items=len(self._data), bytes=self.nbytes, peak_bytes=self.peak_bytes,
+            hits=self.hits, misses=self.misses, evictions=self.evictions, evicted_bytes=self.evicted_bytes,
+            released=self.released
+            )
+
+    # ###################### Helper Method
+    # Helper method -> __setitem__ (callers hold the lock)
+
+    def _evict(self):
+        cmi_debug = __name__+"::"+self._evict.__name__+"."+str(self.name)
+        while len(self._data) > 1 and (len(self._data) > self.max_items or self.nbytes > self.max_bytes):
+            _k, (_v, _n) = self._data.popitem(last=False)
+            self.nbytes -= _n
+            self.evictions += 1
+            self.evicted_bytes += _n
+            logging.info( f'%s - Evict LRU entry: {_k} ({_n} bytes)' % cmi_debug )
+
+
+def sizeof(value, _depth=0):
+    """Approx bytes held by 1 cache value (str / bytes / containers walked, everything else sys.getsizeof)"""
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if _depth > 8:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sum(sizeof(_k, _depth+1) + sizeof(_v, _depth+1) for _k, _v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(sizeof(_v, _depth+1) for _v in value)
+    return sys.getsizeof(value)
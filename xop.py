@@ -307,7 +307,7 @@ def main():
                     
                     pd.set_option('display.max_rows', None)
                     pd.set_option('max_colwidth', 40)
-                    aggregate_mean = sent_ai.sen_df0.loc[sent_ai.sen_df0['urlhash'] == this_urlhash].groupby('snt')['rnk'].mean()
+                    aggregate_mean = sent_ai.sen_acc.urlhash_mean(this_urlhash)     # O(1) per-urlhash view (no full DF scan)
 
                     # aggregate_mean DF keys are only set if the sentiment analysis computes a pos/net/neu sentiment for the article.
                     # If the article has no matching sentiment, the keys are not set in the DF.